@@ -13,6 +13,7 @@ class ProjectProgressSerializer(serializers.Serializer):
     total_tasks = serializers.IntegerField(read_only=True)
     completed_tasks = serializers.IntegerField(read_only=True)
     pending_tasks = serializers.IntegerField(read_only=True)
+    overdue_tasks = serializers.IntegerField(read_only=True)
     progress_pct = serializers.FloatField(read_only=True)
 
 
@@ -22,4 +23,5 @@ class DashboardSummarySerializer(serializers.Serializer):
     total_tasks = serializers.IntegerField(read_only=True)
     completed_tasks = serializers.IntegerField(read_only=True)
     pending_tasks = serializers.IntegerField(read_only=True)
+    overdue_tasks = serializers.IntegerField(read_only=True)
     projects = ProjectProgressSerializer(many=True, read_only=True)
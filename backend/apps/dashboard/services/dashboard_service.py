@@ -1,64 +1,180 @@
 """
 TeamTrack – Dashboard service.
 Read-only aggregation logic: totals and progress per project for current user's projects.
+Summaries are cached per user and invalidated through project version counters (core.cache)
+and the current date (overdue counts change when it rolls over).
 """
-from django.db.models import Count, Q
+import hashlib
 
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from core.cache import CacheStats
 from apps.users.models import User
 from apps.projects.services import ProjectService
-from apps.tasks.models import Task
+from apps.tasks.services import TaskStatsService
+
+cache_stats = CacheStats.get("dashboard_summary")
+visible_cache_stats = CacheStats.get("dashboard_visible_projects")
 
 
 class DashboardService:
     """Dashboard aggregation logic (read-only)."""
 
     @staticmethod
-    def get_summary(user: User) -> dict:
+    def get_summary(user: User, key: str = None) -> dict:
         """
-        Return dashboard summary for the current user:
-        - total_tasks, completed_tasks, pending_tasks (across all visible projects)
-        - projects: list of { id, name, total_tasks, completed_tasks, pending_tasks, progress_pct }
+        Return the dashboard summary for user, served from cache when none of the visible
+        projects (or the set of visible projects) changed since it was computed.
+        Pass key if the caller already computed get_summary_cache_key(user).
         """
-        projects = ProjectService.list_projects_for_user(user)
-        project_ids = list(projects.values_list("id", flat=True))
+        key = key or DashboardService.get_summary_cache_key(user)
+        summary = cache.get(key)
+        if summary is not None:
+            cache_stats.record_hit()
+            return summary
+        cache_stats.record_miss()
+        summary = DashboardService.compute_summary(user)
+        cache.set(key, summary, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        return summary
+
+    @staticmethod
+    async def aget_summary(user: User, key: str = None) -> dict:
+        """Async get_summary (async cache and ORM calls)."""
+        key = key or await DashboardService.aget_summary_cache_key(user)
+        summary = await cache.aget(key)
+        if summary is not None:
+            cache_stats.record_hit()
+            return summary
+        cache_stats.record_miss()
+        summary = await DashboardService.acompute_summary(user)
+        await cache.aset(key, summary, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        return summary
+
+    @staticmethod
+    def get_cache_stats() -> dict:
+        """Per-process hit/miss counters of the summary cache."""
+        return cache_stats.snapshot()
+
+    @staticmethod
+    def get_summary_cache_key(user: User) -> str:
+        """Cache key over user, role and the (id, version) of every visible project."""
+        project_ids = DashboardService._get_visible_project_ids(user)
+        versions = ProjectService.get_project_versions(project_ids)
+        return DashboardService._summary_cache_key(user, project_ids, versions)
 
-        if not project_ids:
+    @staticmethod
+    async def aget_summary_cache_key(user: User) -> str:
+        """Async get_summary_cache_key."""
+        project_ids = await DashboardService._aget_visible_project_ids(user)
+        versions = await ProjectService.aget_project_versions(project_ids)
+        return DashboardService._summary_cache_key(user, project_ids, versions)
+
+    @staticmethod
+    def _summary_cache_key(user: User, project_ids: list, versions: dict) -> str:
+        digest = hashlib.sha1(
+            ",".join(f"{project_id}:{versions.get(project_id, 0)}" for project_id in project_ids).encode()
+        ).hexdigest()
+        return f"dashboard:summary:{user.pk}:{user.role}:{timezone.localdate().isoformat()}:{digest}"
+
+    @staticmethod
+    def _get_visible_project_ids(user: User) -> list:
+        """Visible project ids, cached until the user's visibility version changes."""
+        scope, version = ProjectService.get_visibility_version(user)
+        key = f"dashboard:visible:{user.pk}:{scope}:{version}"
+        project_ids = cache.get(key)
+        if project_ids is not None:
+            visible_cache_stats.record_hit()
+        else:
+            visible_cache_stats.record_miss()
+            project_ids = sorted(ProjectService.list_projects_for_user(user).values_list("id", flat=True))
+            cache.set(key, project_ids, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        return project_ids
+
+    @staticmethod
+    async def _aget_visible_project_ids(user: User) -> list:
+        scope, version = await ProjectService.aget_visibility_version(user)
+        key = f"dashboard:visible:{user.pk}:{scope}:{version}"
+        project_ids = await cache.aget(key)
+        if project_ids is not None:
+            visible_cache_stats.record_hit()
+        else:
+            visible_cache_stats.record_miss()
+            project_ids = sorted(
+                [project_id async for project_id in ProjectService.list_projects_for_user(user).values_list("id", flat=True)]
+            )
+            await cache.aset(key, project_ids, timeout=settings.DASHBOARD_CACHE_TIMEOUT)
+        return project_ids
+
+    @staticmethod
+    def compute_summary(user: User) -> dict:
+        """
+        Compute the dashboard summary for the current user (uncached):
+        - total_tasks, completed_tasks, pending_tasks, overdue_tasks (across all visible projects)
+        - projects: list of { id, name, total_tasks, completed_tasks, pending_tasks, overdue_tasks, progress_pct }
+
+        Reads the materialized ProjectTaskStats counters joined onto the visible projects,
+        so the cost is one query over O(projects) rows; totals are folded in Python.
+        Overdue tasks are not materialized (TaskStatsService.overdue_counts): one grouped query
+        over the open tasks of those projects that are past due.
+        """
+        projects = list(DashboardService._summary_rows(user))
+        overdue = TaskStatsService.overdue_counts([project["id"] for project in projects]) if projects else {}
+        return DashboardService._fold_summary(projects, overdue)
+
+    @staticmethod
+    async def acompute_summary(user: User) -> dict:
+        """Async compute_summary."""
+        projects = [row async for row in DashboardService._summary_rows(user)]
+        overdue = await TaskStatsService.aoverdue_counts([project["id"] for project in projects]) if projects else {}
+        return DashboardService._fold_summary(projects, overdue)
+
+    @staticmethod
+    def _summary_rows(user: User):
+        return ProjectService.list_projects_for_user(user).values(
+            "id",
+            "name",
+            "task_stats__total",
+            "task_stats__todo",
+            "task_stats__in_progress",
+            "task_stats__done",
+        )
+
+    @staticmethod
+    def _fold_summary(projects: list, overdue: dict) -> dict:
+        if not projects:
             return {
                 "total_tasks": 0,
                 "completed_tasks": 0,
                 "pending_tasks": 0,
+                "overdue_tasks": 0,
                 "projects": [],
             }
 
-        # Totals across all user's projects
-        task_counts = Task.objects.filter(project_id__in=project_ids).aggregate(
-            total=Count("id"),
-            completed=Count("id", filter=Q(status=Task.Status.DONE)),
-            pending=Count("id", filter=Q(status__in=(Task.Status.TODO, Task.Status.IN_PROGRESS))),
-        )
-        total_tasks = task_counts["total"] or 0
-        completed_tasks = task_counts["completed"] or 0
-        pending_tasks = task_counts["pending"] or 0
-
-        # Per-project stats
+        total_tasks = 0
+        completed_tasks = 0
+        pending_tasks = 0
+        overdue_tasks = 0
         project_stats = []
         for project in projects:
-            proj_tasks = Task.objects.filter(project_id=project.id).aggregate(
-                total=Count("id"),
-                completed=Count("id", filter=Q(status=Task.Status.DONE)),
-                pending=Count("id", filter=Q(status__in=(Task.Status.TODO, Task.Status.IN_PROGRESS))),
-            )
-            p_total = proj_tasks["total"] or 0
-            p_completed = proj_tasks["completed"] or 0
-            p_pending = proj_tasks["pending"] or 0
+            p_total = project["task_stats__total"] or 0
+            p_completed = project["task_stats__done"] or 0
+            p_pending = (project["task_stats__todo"] or 0) + (project["task_stats__in_progress"] or 0)
+            p_overdue = overdue.get(project["id"], 0)
             progress_pct = round((p_completed / p_total * 100), 1) if p_total else 0.0
 
+            total_tasks += p_total
+            completed_tasks += p_completed
+            pending_tasks += p_pending
+            overdue_tasks += p_overdue
             project_stats.append({
-                "id": project.id,
-                "name": project.name,
+                "id": project["id"],
+                "name": project["name"],
                 "total_tasks": p_total,
                 "completed_tasks": p_completed,
                 "pending_tasks": p_pending,
+                "overdue_tasks": p_overdue,
                 "progress_pct": progress_pct,
             })
 
@@ -66,5 +182,6 @@ class DashboardService:
             "total_tasks": total_tasks,
             "completed_tasks": completed_tasks,
             "pending_tasks": pending_tasks,
+            "overdue_tasks": overdue_tasks,
             "projects": project_stats,
         }
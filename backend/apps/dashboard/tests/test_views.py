@@ -0,0 +1,108 @@
+"""
+TeamTrack – Dashboard view tests.
+"""
+import datetime
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.testing import assert_async_view_matches, assert_within_query_budget
+from apps.users.models import User
+from apps.dashboard.services import DashboardService
+from apps.dashboard.views.dashboard_views import DashboardSummaryView
+from apps.projects.services import ProjectService
+from apps.tasks.models import Task
+from apps.tasks.services import TaskService
+
+SUMMARY_URL = "/api/v1/dashboard/summary/"
+
+
+class DashboardSummaryQueryCountTests(TestCase):
+    """The summary costs the same number of queries however many projects the user is in."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def add_projects(self, count: int) -> None:
+        for index in range(count):
+            project = ProjectService.create_project(self.user, {"name": f"Project {index}"})
+            yesterday = timezone.localdate() - datetime.timedelta(days=1)
+            TaskService.create_task(project, self.user, {"title": "Open", "due_date": yesterday})
+            TaskService.create_task(project, self.user, {"title": "Done", "status": Task.Status.DONE})
+
+    def get_summary(self):
+        cache.clear()
+        response = self.client.get(SUMMARY_URL)
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response
+
+    def test_query_count_is_independent_of_project_count(self):
+        self.add_projects(2)
+        few = self.get_summary()
+        self.add_projects(10)
+        many = self.get_summary()
+
+        self.assertEqual(many.query_stats.count, few.query_stats.count)
+        summary = many.json()["data"]
+        self.assertEqual(
+            (summary["total_tasks"], summary["completed_tasks"], summary["pending_tasks"], summary["overdue_tasks"]),
+            (24, 12, 12, 12),
+        )
+        self.assertEqual(len(summary["projects"]), 12)
+        self.assertTrue(all(project["progress_pct"] == 50.0 for project in summary["projects"]))
+        self.assertTrue(all(project["overdue_tasks"] == 1 for project in summary["projects"]))
+
+    def test_async_view_answers_like_the_sync_view(self):
+        self.add_projects(3)
+        etag = assert_async_view_matches(DashboardSummaryView, self.user, SUMMARY_URL)["ETag"]
+        response = assert_async_view_matches(DashboardSummaryView, self.user, SUMMARY_URL, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+
+class DashboardSummaryConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        cls.project = ProjectService.create_project(cls.user, {"name": "Project"})
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_not_modified_skips_summary_and_serialization(self):
+        etag = self.client.get(SUMMARY_URL)["ETag"]
+        with mock.patch("apps.dashboard.views.dashboard_views.DashboardSummarySerializer") as serializer, \
+                mock.patch.object(DashboardService, "get_summary") as get_summary:
+            response = self.client.get(SUMMARY_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(serializer.mock_calls, [])
+        get_summary.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):  # project versions are bumped on commit
+            TaskService.create_task(self.project, self.user, {"title": "New"})
+        response = self.client.get(SUMMARY_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["total_tasks"], 1)
+
+    def test_date_rollover_refreshes_overdue_counts(self):
+        tomorrow = timezone.localdate() + datetime.timedelta(days=1)
+        TaskService.create_task(self.project, self.user, {"title": "Due", "due_date": tomorrow})
+        response = self.client.get(SUMMARY_URL)
+        self.assertEqual(response.json()["data"]["overdue_tasks"], 0)
+        etag = response["ETag"]
+
+        with mock.patch("django.utils.timezone.localdate", return_value=tomorrow + datetime.timedelta(days=1)):
+            response = self.client.get(SUMMARY_URL, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["overdue_tasks"], 1)
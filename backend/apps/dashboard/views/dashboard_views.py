@@ -5,19 +5,37 @@ Read-only; request handling only; business logic in DashboardService.
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
+from core.conditional import etag_matches, not_modified_response, request_etag
 from core.responses import success_response
+from core.views import AsyncAPIView
 
 from apps.dashboard.serializers import DashboardSummarySerializer
 from apps.dashboard.services import DashboardService
 
 
-class DashboardSummaryView(APIView):
+class DashboardSummaryView(AsyncAPIView):
     """GET /api/v1/dashboard/summary/ – totals and progress per project for current user."""
     permission_classes = [IsAuthenticated]
+    query_budget = 3
+    renders_floats = True  # progress_pct (core.renderers.FastJSONRenderer)
 
     def get(self, request: Request) -> Response:
-        summary = DashboardService.get_summary(request.user)
+        # The summary cache key already covers the user and every visible project's version.
+        key = DashboardService.get_summary_cache_key(request.user)
+        etag = request_etag(request, key)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        summary = DashboardService.get_summary(request.user, key=key)
         serializer = DashboardSummarySerializer(instance=summary)
-        return success_response(data=serializer.data)
+        return success_response(data=serializer.data, etag=etag)
+
+    async def aget(self, request: Request) -> Response:
+        """Async get (settings.API_ASYNC_VIEWS)."""
+        key = await DashboardService.aget_summary_cache_key(request.user)
+        etag = request_etag(request, key)
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        summary = await DashboardService.aget_summary(request.user, key=key)
+        serializer = DashboardSummarySerializer(instance=summary)
+        return success_response(data=serializer.data, etag=etag)
@@ -32,6 +32,7 @@ class Project(models.Model):
         indexes = [
             models.Index(fields=["created_by"]),
             models.Index(fields=["status"]),
+            models.Index(fields=["-updated_at"]),
         ]
 
     def __str__(self):
@@ -64,6 +65,7 @@ class ProjectMember(models.Model):
 
     class Meta:
         constraints = [
+            # Also the covering index for visibility checks: EXISTS (user_id = ? AND project_id = ?).
             models.UniqueConstraint(fields=["user", "project"], name="unique_project_member"),
         ]
         indexes = [
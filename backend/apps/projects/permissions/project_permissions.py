@@ -25,4 +25,9 @@ class IsAdminOrProjectOwner(permissions.BasePermission):
             return False
         if request.method in permissions.SAFE_METHODS:
             return True  # Access already enforced by get_object using ProjectService.get_project_by_id
+        get_access = getattr(view, "get_project_access", None)
+        if get_access is not None:
+            access = get_access()
+            if access.project.pk == obj.pk:
+                return access.can_modify
         return ProjectService.can_modify_project(request.user, obj)
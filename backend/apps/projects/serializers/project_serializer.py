@@ -3,6 +3,7 @@ TeamTrack – Project serializers (create/update, list, detail).
 """
 from rest_framework import serializers
 
+from core.fieldsets import SparseFieldsetSerializerMixin
 from apps.projects.models import Project
 from apps.users.models import User
 
@@ -21,8 +22,8 @@ class ProjectCreateUpdateSerializer(serializers.Serializer):
         return name
 
 
-class ProjectListSerializer(serializers.ModelSerializer):
-    """Serialize project for list (with creator and optional member count)."""
+class ProjectListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """Serialize project for list (with creator and optional member count). Accepts fields= for sparse fieldsets."""
 
     created_by_email = serializers.EmailField(source="created_by.email", read_only=True)
     member_count = serializers.SerializerMethodField()
@@ -33,7 +34,11 @@ class ProjectListSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
     def get_member_count(self, obj):
-        return obj.members.count()
+        # Annotated by ProjectService.list_projects_for_user; count only for other querysets.
+        member_count = getattr(obj, "member_count", None)
+        if member_count is None:
+            return obj.members.count()
+        return member_count
 
 
 class ProjectDetailSerializer(serializers.ModelSerializer):
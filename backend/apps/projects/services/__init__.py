@@ -1,3 +1,4 @@
+from .project_access import ProjectAccess, TokenProjectAccess
 from .project_service import ProjectService
 
-__all__ = ["ProjectService"]
+__all__ = ["ProjectAccess", "ProjectService", "TokenProjectAccess"]
@@ -0,0 +1,58 @@
+"""
+TeamTrack – Project access context.
+The caller's view of one project (project row + own membership role), loaded with a single
+query and reused for every visibility / role / modify check within a request; or, for task
+endpoints with JWT_ACCESS_CLAIMS, answered from the access token (TokenProjectAccess).
+"""
+from apps.users.models import User
+from apps.projects.models import Project, ProjectMember
+
+
+class ProjectAccess:
+    """Caller's access to a project; answers permission checks from memory."""
+
+    def __init__(self, project: Project, user: User, member_role=None):
+        self.project = project
+        self.user = user
+        self.member_role = member_role  # ProjectMember.Role value, or None if not a member
+
+    @property
+    def is_admin(self) -> bool:
+        return getattr(self.user, "role", None) == User.Role.ADMIN
+
+    @property
+    def is_creator(self) -> bool:
+        return self.project.created_by_id == self.user.pk
+
+    @property
+    def is_member(self) -> bool:
+        return self.member_role is not None
+
+    @property
+    def can_view(self) -> bool:
+        """Same rule as ProjectService.get_project_by_id."""
+        return self.is_admin or self.is_creator or self.is_member
+
+    @property
+    def can_modify(self) -> bool:
+        """Same rule as ProjectService.can_modify_project."""
+        return self.is_admin or self.is_creator or self.member_role == ProjectMember.Role.PROJECT_ADMIN
+
+
+class TokenProjectAccess(ProjectAccess):
+    """
+    Access answered from verified token claims (ProjectService.get_project_access_from_claims).
+    project is an id-only instance: its other fields load from the database on first access.
+    """
+
+    def __init__(self, project: Project, user: User, can_modify: bool):
+        super().__init__(project, user)
+        self._can_modify = can_modify
+
+    @property
+    def can_view(self) -> bool:
+        return True
+
+    @property
+    def can_modify(self) -> bool:
+        return self.is_admin or self._can_modify
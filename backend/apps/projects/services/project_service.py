@@ -3,54 +3,190 @@ TeamTrack – Project service.
 Business logic for project CRUD and member management.
 Permission checks (admin or project owner/admin) are done in the permission class; service assumes caller is allowed where applicable.
 """
-from django.db.models import QuerySet
+from django.conf import settings
+from django.db import router, transaction
+from django.db.models import Count, Exists, IntegerField, Max, OuterRef, Q, QuerySet, Subquery
+from django.db.models.functions import Coalesce
 
+from core.cache import aget_version, aget_versions, bump_version_on_commit, get_version, get_versions
 from core.exceptions import NotFoundError, PermissionDeniedError, ConflictError
+from core.pubsub import publish_on_commit
 
 from apps.users.models import User
 from apps.projects.models import Project, ProjectMember
+from apps.projects.services.project_access import ProjectAccess, TokenProjectAccess
+
+# Cache version namespaces (see core.cache). "project" changes whenever a project or its
+# tasks change; "membership" whenever a user's set of projects changes; "project_set"
+# whenever a project is created or deleted (the admin view of all projects).
+# "membership" also versions the project-access claims in access tokens (get_access_claims).
+PROJECT_VERSION = "project"
+MEMBERSHIP_VERSION = "membership"
+PROJECT_SET_VERSION = "project_set"
 
 
 class ProjectService:
     """Project and membership business logic."""
 
     @staticmethod
-    def list_projects_for_user(user: User) -> QuerySet:
+    def list_projects_for_user(user: User, with_member_count: bool = True) -> QuerySet:
         """
-        Return projects the user can see: all if admin, else only projects they are a member of.
+        Return projects the user can see: all if admin, else projects they created or are a
+        member of (same rule as get_project_by_id).
+        Visibility is a correlated EXISTS on the (user, project) unique index rather than a
+        join + DISTINCT, so the -updated_at ordering can be served without a temp table.
+        Annotated with member_count (correlated subquery, so list pages avoid a COUNT per row)
+        unless with_member_count is False.
         Ordered by -updated_at.
         """
         if getattr(user, "role", None) == User.Role.ADMIN:
-            return Project.objects.all().select_related("created_by").order_by("-updated_at")
-        return (
-            Project.objects.filter(members__user=user)
-            .select_related("created_by")
-            .distinct()
-            .order_by("-updated_at")
+            qs = Project.objects.all()
+        else:
+            is_member = Exists(ProjectMember.objects.filter(project=OuterRef("pk"), user=user))
+            qs = Project.objects.filter(Q(created_by=user) | is_member)
+        qs = qs.select_related("created_by")
+        if with_member_count:
+            qs = qs.annotate(member_count=ProjectService._member_count_subquery())
+        return qs.order_by("-updated_at")
+
+    @staticmethod
+    def _member_count_subquery():
+        members = (
+            ProjectMember.objects.filter(project=OuterRef("pk"))
+            .order_by()
+            .values("project")
+            .annotate(count=Count("pk"))
+            .values("count")
         )
+        return Coalesce(Subquery(members, output_field=IntegerField()), 0)
 
     @staticmethod
     def get_project_by_id(project_id: int, user: User) -> Project:
         """
-        Return project by id. Admin can access any; others only if member.
+        Return project by id. Admin can access any; others only if creator or member.
+        Raises NotFoundError if not found or no access (no leak of existence).
+        """
+        return ProjectService.get_project_access(project_id, user).project
+
+    @staticmethod
+    def get_project_access(project_id: int, user: User) -> ProjectAccess:
+        """
+        Load project and the user's membership role in one query.
         Raises NotFoundError if not found or no access (no leak of existence).
         """
         try:
-            project = Project.objects.select_related("created_by").get(pk=project_id)
+            project = ProjectService._project_access_queryset(user).get(pk=project_id)
         except Project.DoesNotExist:
             raise NotFoundError(message="Project not found.")
+        return ProjectService._check_access(project, user)
 
-        if getattr(user, "role", None) == User.Role.ADMIN:
-            return project
-        if project.created_by_id == user.pk:
-            return project
-        if ProjectMember.objects.filter(project=project, user=user).exists():
-            return project
-        raise NotFoundError(message="Project not found.")
+    @staticmethod
+    async def aget_project_access(project_id: int, user: User) -> ProjectAccess:
+        """Async get_project_access (same single query, through the async ORM)."""
+        try:
+            project = await ProjectService._project_access_queryset(user).aget(pk=project_id)
+        except Project.DoesNotExist:
+            raise NotFoundError(message="Project not found.")
+        return ProjectService._check_access(project, user)
 
     @staticmethod
+    async def aget_project_by_id(project_id: int, user: User) -> Project:
+        """Async get_project_by_id."""
+        return (await ProjectService.aget_project_access(project_id, user)).project
+
+    @staticmethod
+    def get_access_claims(user: User):
+        """
+        Compact project-access digest for the user's access token: {"v": membership version,
+        "a": [ids the user can modify], "m": [ids the user can only view]} over the projects they
+        created or belong to. None above JWT_ACCESS_CLAIMS_MAX_PROJECTS (the token stays small;
+        such users are checked against the database).
+        The version is read before the rows, so a concurrent change leaves the digest stale, never wrong.
+        """
+        version = get_version(MEMBERSHIP_VERSION, user.pk)
+        is_member = Exists(ProjectMember.objects.filter(project=OuterRef("pk"), user_id=user.pk))
+        rows = list(
+            ProjectService._project_access_queryset(user, select_creator=False)
+            .filter(Q(created_by_id=user.pk) | is_member)
+            .order_by("pk")
+            .values_list("pk", "created_by_id", "member_role")[: settings.JWT_ACCESS_CLAIMS_MAX_PROJECTS + 1]
+        )
+        if len(rows) > settings.JWT_ACCESS_CLAIMS_MAX_PROJECTS:
+            return None
+        modify = [pk for pk, creator, role in rows if creator == user.pk or role == ProjectMember.Role.PROJECT_ADMIN]
+        modify_set = set(modify)
+        return {"v": version, "a": modify, "m": [pk for pk, _, _ in rows if pk not in modify_set]}
+
+    @staticmethod
+    def get_project_access_from_claims(project_id: int, user: User, token):
+        """
+        ProjectAccess from the access token's claims (see apps.users.tokens) without touching the
+        database, or None when the token cannot answer: claims off or absent, role or membership
+        version changed since the token was issued, or an admin asking about a project outside
+        their own. Raises NotFoundError for a non-admin's project missing from a current digest.
+        """
+        claims = ProjectService._current_claims(user, token)
+        if claims is None:
+            return None
+        return ProjectService._access_from_claims(int(project_id), user, claims, get_version(MEMBERSHIP_VERSION, user.pk))
+
+    @staticmethod
+    async def aget_project_access_from_claims(project_id: int, user: User, token):
+        """Async get_project_access_from_claims."""
+        claims = ProjectService._current_claims(user, token)
+        if claims is None:
+            return None
+        version = await aget_version(MEMBERSHIP_VERSION, user.pk)
+        return ProjectService._access_from_claims(int(project_id), user, claims, version)
+
+    @staticmethod
+    def _current_claims(user: User, token):
+        from apps.users.tokens import ACCESS_CLAIM, ROLE_CLAIM, access_claims_enabled
+
+        if not access_claims_enabled() or token is None:
+            return None
+        claims = token.get(ACCESS_CLAIM)
+        if not claims or token.get(ROLE_CLAIM) != getattr(user, "role", None):
+            return None
+        return claims
+
+    @staticmethod
+    def _access_from_claims(project_id: int, user: User, claims: dict, version: int):
+        if claims["v"] != version:
+            return None
+        if project_id in claims["a"]:
+            can_modify = True
+        elif project_id in claims["m"]:
+            can_modify = False
+        elif getattr(user, "role", None) == User.Role.ADMIN:
+            return None  # admins see every project; existence is only known to the database
+        else:
+            raise NotFoundError(message="Project not found.")
+        project = Project.from_db(router.db_for_read(Project), ["id"], [project_id])
+        return TokenProjectAccess(project, user, can_modify=can_modify)
+
+    @staticmethod
+    def _project_access_queryset(user: User, select_creator: bool = True) -> QuerySet:
+        member_role = ProjectMember.objects.filter(project=OuterRef("pk"), user_id=user.pk).values("role")[:1]
+        qs = Project.objects.select_related("created_by") if select_creator else Project.objects.all()
+        return qs.annotate(member_role=Subquery(member_role))
+
+    @staticmethod
+    def _check_access(project: Project, user: User) -> ProjectAccess:
+        access = ProjectAccess(project, user, member_role=project.member_role)
+        if not access.can_view:
+            raise NotFoundError(message="Project not found.")
+        return access
+
+    @staticmethod
+    @transaction.atomic
     def create_project(user: User, validated_data: dict) -> Project:
-        """Create project and add creator as PROJECT_ADMIN member. Returns created project."""
+        """
+        Create project and add creator as PROJECT_ADMIN member, with zeroed task counters (so
+        the first task write updates them instead of rebuilding). Returns created project.
+        """
+        from apps.tasks.models import ProjectTaskStats
+
         project = Project.objects.create(
             name=validated_data["name"],
             description=validated_data.get("description", ""),
@@ -62,22 +198,49 @@ class ProjectService:
             user=user,
             role=ProjectMember.Role.PROJECT_ADMIN,
         )
+        ProjectTaskStats.objects.create(project=project)
+        bump_version_on_commit(MEMBERSHIP_VERSION, user.pk)
+        bump_version_on_commit(PROJECT_SET_VERSION, "all")
         return project
 
     @staticmethod
-    def update_project(project_id: int, validated_data: dict) -> Project:
-        """Update project fields. Caller must have been checked for modify permission."""
-        project = Project.objects.get(pk=project_id)
+    def update_project(project_id: int, validated_data: dict, project: Project = None) -> Project:
+        """
+        Update project fields. Caller must have been checked for modify permission.
+        Pass the already-loaded project to skip re-fetching it.
+        """
+        if project is None or project.pk != project_id:
+            project = Project.objects.get(pk=project_id)
         for key in ("name", "description", "status"):
             if key in validated_data:
                 setattr(project, key, validated_data[key])
-        project.save(update_fields=[k for k in ("name", "description", "status") if k in validated_data])
+        project.save(update_fields=[k for k in ("name", "description", "status") if k in validated_data] + ["updated_at"])
+        bump_version_on_commit(PROJECT_VERSION, project.pk)
+        ProjectService.publish_event(project.pk, "project.updated")
         return project
 
     @staticmethod
+    @transaction.atomic
     def delete_project(project_id: int) -> None:
-        """Delete project (cascade deletes members). Caller must have been checked for modify permission."""
+        """
+        Delete project (cascade deletes members and tasks; the tasks are recorded in the deletion log).
+        Caller must have been checked for modify permission.
+        """
+        from apps.tasks.models import Task
+        from apps.tasks.services import TaskSyncService
+
+        member_ids = set(ProjectMember.objects.filter(project_id=project_id).values_list("user_id", flat=True))
+        # The creator sees the project even without a membership row (token access claims).
+        member_ids.update(Project.objects.filter(pk=project_id).values_list("created_by_id", flat=True))
+        TaskSyncService.record_deleted(
+            project_id, Task.objects.filter(project_id=project_id).values_list("id", flat=True).iterator()
+        )
         Project.objects.filter(pk=project_id).delete()
+        for user_id in member_ids:
+            bump_version_on_commit(MEMBERSHIP_VERSION, user_id)
+        bump_version_on_commit(PROJECT_VERSION, project_id)
+        bump_version_on_commit(PROJECT_SET_VERSION, "all")
+        ProjectService.publish_event(project_id, "project.deleted")
 
     @staticmethod
     def can_modify_project(user: User, project: Project) -> bool:
@@ -92,6 +255,19 @@ class ProjectService:
             role=ProjectMember.Role.PROJECT_ADMIN,
         ).exists()
 
+    @staticmethod
+    async def acan_modify_project(user: User, project: Project) -> bool:
+        """Async can_modify_project."""
+        if getattr(user, "role", None) == User.Role.ADMIN:
+            return True
+        if project.created_by_id == user.pk:
+            return True
+        return await ProjectMember.objects.filter(
+            project=project,
+            user=user,
+            role=ProjectMember.Role.PROJECT_ADMIN,
+        ).aexists()
+
     @staticmethod
     def list_members(project: Project) -> QuerySet:
         """Return project members (ProjectMember with user)."""
@@ -108,7 +284,11 @@ class ProjectService:
         target_user = User.objects.filter(pk=user_id).first()
         if not target_user:
             raise NotFoundError(message="User not found.")
-        return ProjectMember.objects.create(project=project, user=target_user, role=role)
+        member = ProjectMember.objects.create(project=project, user=target_user, role=role)
+        bump_version_on_commit(MEMBERSHIP_VERSION, target_user.pk)
+        bump_version_on_commit(PROJECT_VERSION, project.pk)
+        ProjectService.publish_event(project.pk, "member.added", user=target_user.pk)
+        return member
 
     @staticmethod
     def remove_member(project: Project, user_id: int, removed_by: User) -> None:
@@ -120,3 +300,78 @@ class ProjectService:
         if not membership:
             raise NotFoundError(message="User is not a member of this project.")
         membership.delete()
+        bump_version_on_commit(MEMBERSHIP_VERSION, user_id)
+        bump_version_on_commit(PROJECT_VERSION, project.pk)
+        ProjectService.publish_event(project.pk, "member.removed", user=user_id)
+
+    @staticmethod
+    def get_project_fingerprint(project: Project) -> tuple:
+        """
+        Fingerprint of the project detail payload (project fields + member list):
+        updated_at plus member count and newest membership id (one aggregate query), and the
+        project version, which also changes with the member / creator emails shown
+        (bump_user_projects).
+        """
+        row = ProjectMember.objects.filter(project=project).aggregate(count=Count("id"), latest=Max("id"))
+        version = get_version(PROJECT_VERSION, project.pk)
+        return (project.pk, project.updated_at.isoformat(), row["count"], row["latest"], version)
+
+    @staticmethod
+    def events_channel(project_id: int) -> str:
+        """Pub/sub channel carrying the project's live events (see core.pubsub)."""
+        return f"project:{project_id}"
+
+    @staticmethod
+    def publish_event(project_id: int, event_type: str, **data) -> None:
+        """Publish {"type", "project", **data} to the project's channel once the transaction commits."""
+        publish_on_commit(ProjectService.events_channel(project_id), {"type": event_type, "project": project_id, **data})
+
+    @staticmethod
+    def bump_project_version(project_id: int) -> None:
+        """Mark project (or its tasks) as changed once the current transaction commits."""
+        bump_version_on_commit(PROJECT_VERSION, project_id)
+
+    @staticmethod
+    def bump_user_projects(user_id: int) -> None:
+        """
+        Bump the version of every project whose payloads show the user (as creator, member,
+        task creator or assignee), once the transaction commits: their email changed or they
+        are being deleted, which changes those payloads without touching the projects' rows.
+        """
+        from apps.tasks.models import Task
+
+        project_ids = set(
+            Project.objects.filter(Q(created_by_id=user_id) | Q(members__user_id=user_id)).values_list("pk", flat=True)
+        )
+        project_ids.update(
+            Task.objects.filter(Q(created_by_id=user_id) | Q(assigned_to_id=user_id)).values_list("project_id", flat=True)
+        )
+        for project_id in project_ids:
+            bump_version_on_commit(PROJECT_VERSION, project_id)
+
+    @staticmethod
+    def get_project_versions(project_ids) -> dict:
+        """Return {project_id: version}; versions change whenever the project or its tasks change."""
+        return get_versions(PROJECT_VERSION, project_ids)
+
+    @staticmethod
+    def get_visibility_version(user: User) -> tuple:
+        """
+        Version of the set of projects visible to user: the global project set for admins,
+        the user's own memberships otherwise.
+        """
+        if getattr(user, "role", None) == User.Role.ADMIN:
+            return (User.Role.ADMIN, get_version(PROJECT_SET_VERSION, "all"))
+        return (user.pk, get_version(MEMBERSHIP_VERSION, user.pk))
+
+    @staticmethod
+    async def aget_project_versions(project_ids) -> dict:
+        """Async get_project_versions."""
+        return await aget_versions(PROJECT_VERSION, project_ids)
+
+    @staticmethod
+    async def aget_visibility_version(user: User) -> tuple:
+        """Async get_visibility_version."""
+        if getattr(user, "role", None) == User.Role.ADMIN:
+            return (User.Role.ADMIN, await aget_version(PROJECT_SET_VERSION, "all"))
+        return (user.pk, await aget_version(MEMBERSHIP_VERSION, user.pk))
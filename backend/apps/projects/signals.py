@@ -0,0 +1,30 @@
+"""
+TeamTrack – Project signal receivers.
+Project payloads and task lists show user emails (members, creators, assignees). A user's email
+changes only outside the API (Django admin, shell) and users are deleted the same way, so these
+are caught with model signals: either bumps the version of the projects showing that user
+(ProjectService.bump_user_projects), which invalidates their ETags and cached summaries.
+"""
+from django.db.models.signals import pre_delete, pre_save
+
+from apps.users.models import User
+
+
+def user_email_changing(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or instance.pk is None or (update_fields is not None and "email" not in update_fields):
+        return  # fixtures, new users, and saves that leave email alone (e.g. last_login)
+    from apps.projects.services import ProjectService
+
+    if User.objects.filter(pk=instance.pk).exclude(email=instance.email).exists():
+        ProjectService.bump_user_projects(instance.pk)
+
+
+def user_deleting(sender, instance, **kwargs):
+    from apps.projects.services import ProjectService
+
+    ProjectService.bump_user_projects(instance.pk)
+
+
+def connect() -> None:
+    pre_save.connect(user_email_changing, sender=User, dispatch_uid="projects.user_email_changing")
+    pre_delete.connect(user_deleting, sender=User, dispatch_uid="projects.user_deleting")
@@ -0,0 +1,216 @@
+"""
+TeamTrack – Project view tests.
+"""
+import shutil
+import tempfile
+from unittest import mock
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.testing import assert_async_view_matches, assert_within_query_budget
+from apps.users.models import User
+from apps.projects.models import ProjectMember
+from apps.projects.serializers import ProjectListSerializer
+from apps.projects.services import ProjectService
+from apps.projects.views.project_views import ProjectListView
+from apps.users.tokens import ACCESS_CLAIM, ROLE_CLAIM, add_access_claims
+
+PROJECTS_URL = "/api/v1/projects/"
+
+
+class ProjectListQueryCountTests(TestCase):
+    """member_count comes from the list query's annotation, not one COUNT per row."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        members = [
+            User.objects.create_user(username=f"member{index}", email=f"member{index}@example.com", password="pass12345")
+            for index in range(2)
+        ]
+        for index in range(30):
+            project = ProjectService.create_project(cls.user, {"name": f"Project {index}"})
+            ProjectMember.objects.bulk_create(
+                [ProjectMember(project=project, user=member, role=ProjectMember.Role.MEMBER) for member in members]
+            )
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertQueryCountIndependentOfPageSize(self, **params):
+        counts = {}
+        for page_size in (1, 10, 30):
+            response = self.client.get(PROJECTS_URL, {"page_size": page_size, **params})
+            self.assertEqual(response.status_code, 200, response.content)
+            assert_within_query_budget(response)
+            rows = response.json()["data"]["results"]
+            self.assertEqual(len(rows), page_size)
+            self.assertTrue(all(row["member_count"] == 3 for row in rows))
+            counts[page_size] = response.query_stats.count
+        self.assertEqual(len(set(counts.values())), 1, counts)
+
+    def test_page_number_pagination(self):
+        self.assertQueryCountIndependentOfPageSize()
+
+    def test_keyset_pagination(self):
+        self.assertQueryCountIndependentOfPageSize(cursor="")
+
+    def test_async_view_answers_like_the_sync_view(self):
+        for params in (
+            None,
+            {"page_size": 10, "page": 3},
+            {"page_size": 10, "page": 4},  # 404
+            {"page_size": 10, "cursor": ""},
+            {"fields": "id,name,member_count"},
+            {"exclude": "description"},
+        ):
+            assert_async_view_matches(ProjectListView, self.user, PROJECTS_URL, params)
+
+
+class ProjectListFieldsetTests(TestCase):
+    """?fields= / ?exclude= narrow both the rows and the SQL; unknown names are a 400."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        for index in range(3):
+            ProjectService.create_project(cls.user, {"name": f"Project {index}", "description": "Long text"})
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get_rows(self, **params) -> tuple:
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(PROJECTS_URL, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]["results"], " ".join(query["sql"] for query in queries)
+
+    def test_fields(self):
+        for params in ({}, {"cursor": ""}):
+            rows, sql = self.get_rows(fields="name,id", **params)
+            self.assertEqual([list(row) for row in rows], [["id", "name"]] * 3)
+            self.assertNotIn('"description"', sql)
+            self.assertNotIn('"member_count"', sql)
+
+    def test_exclude(self):
+        rows, sql = self.get_rows(exclude="description,created_by_email")
+        self.assertEqual(
+            list(rows[0]), ["id", "name", "status", "created_by", "member_count", "created_at", "updated_at"]
+        )
+        self.assertNotIn('"description"', sql)
+        self.assertNotIn('"users_user"', sql)
+        self.assertIn('"member_count"', sql)
+
+    def test_invalid_selections(self):
+        for params, errors in (
+            ({"fields": "id,secret"}, {"fields": ["Unknown field: secret."]}),
+            ({"exclude": "nope"}, {"exclude": ["Unknown field: nope."]}),
+            ({"fields": "id", "exclude": "name"}, None),
+            ({"exclude": ",".join(ProjectListSerializer.Meta.fields)}, None),
+        ):
+            response = self.client.get(PROJECTS_URL, params)
+            self.assertEqual(response.status_code, 400, params)
+            body = response.json()
+            self.assertEqual(body["code"], "invalid_fieldset")
+            if errors:
+                self.assertEqual({key: body["errors"][key] for key in errors}, errors)
+                self.assertEqual(body["errors"]["available"], list(ProjectListSerializer.Meta.fields))
+
+
+class ProjectDetailConditionalGetTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        cls.project = ProjectService.create_project(cls.user, {"name": "Project"})
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.url = f"{PROJECTS_URL}{self.project.pk}/"
+
+    def test_not_modified_skips_serialization(self):
+        etag = self.client.get(self.url)["ETag"]
+        with mock.patch("apps.projects.views.project_views.ProjectDetailSerializer") as serializer:
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(serializer.mock_calls, [])
+        assert_within_query_budget(response)
+
+        self.client.patch(self.url, {"name": "Renamed"}, format="json")
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["name"], "Renamed")
+
+    def test_member_email_change_changes_the_etag(self):
+        etag = self.client.get(self.url)["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            self.user.email = "renamed@example.com"
+            self.user.save()
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("renamed@example.com", response.content.decode())
+
+
+@override_settings(JWT_ACCESS_CLAIMS=True)
+class ProjectAccessClaimsTests(TestCase):
+    """Project access answered from access-token claims stops when the membership changes."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        cls.member = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+        cls.project = ProjectService.create_project(cls.owner, {"name": "Project"})
+        ProjectMember.objects.create(project=cls.project, user=cls.member, role=ProjectMember.Role.MEMBER)
+
+    def setUp(self):
+        self.tasks_url = f"/api/v1/projects/{self.project.pk}/tasks/"
+        self.owner_client = APIClient()
+        self.owner_client.force_authenticate(self.owner)
+
+    def shared_cache(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        return override_settings(
+            CACHES={"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location}}
+        )
+
+    def member_client(self) -> APIClient:
+        token = AccessToken.for_user(self.member)
+        add_access_claims(token, self.member)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        return client
+
+    def test_removing_a_member_invalidates_their_claims(self):
+        with self.shared_cache():
+            client = self.member_client()
+            response = client.get(self.tasks_url)
+            self.assertEqual(response.status_code, 200, response.content)
+            # Access came from the token: no membership or project lookup.
+            self.assertFalse([sql for sql, _ in response.query_stats.queries if '"projects_' in sql])
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.owner_client.delete(f"/api/v1/projects/{self.project.pk}/members/{self.member.pk}/")
+            self.assertEqual(response.status_code, 204, response.content)
+            response = client.get(self.tasks_url)
+            self.assertEqual(response.status_code, 404, response.content)
+
+    def test_claims_are_ignored_with_a_process_local_cache(self):
+        token = AccessToken.for_user(self.member)
+        add_access_claims(token, self.member)
+        self.assertNotIn(ACCESS_CLAIM, token.payload)
+        # A token carrying claims that are current in this process's LocMemCache.
+        token[ROLE_CLAIM] = self.member.role
+        token[ACCESS_CLAIM] = ProjectService.get_access_claims(self.member)
+        client = APIClient()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+        # Removed by another worker: its version bump never reaches this process's cache.
+        ProjectMember.objects.filter(project=self.project, user=self.member).delete()
+        response = client.get(self.tasks_url)
+        self.assertEqual(response.status_code, 404, response.content)
@@ -14,16 +14,13 @@ from core.exceptions import ValidationError as APIValidationError
 from apps.projects.serializers import ProjectMemberSerializer, AddProjectMemberSerializer
 from apps.projects.services import ProjectService
 from apps.projects.permissions import IsAdminOrProjectOwner
+from apps.projects.views.mixins import ProjectAccessMixin
 
 
-class ProjectMemberListView(APIView):
+class ProjectMemberListView(ProjectAccessMixin, APIView):
     """GET /api/v1/projects/<id>/members/ – list members. POST – add member."""
     permission_classes = [IsAuthenticated, IsAdminOrProjectOwner]
-
-    def get_object(self):
-        project = ProjectService.get_project_by_id(self.kwargs["pk"], self.request.user)
-        self.check_object_permissions(self.request, project)
-        return project
+    query_budget = {"GET": 3, "POST": 6}
 
     def get(self, request: Request, pk: int) -> Response:
         project = self.get_object()
@@ -53,14 +50,10 @@ class ProjectMemberListView(APIView):
         )
 
 
-class ProjectMemberDetailView(APIView):
+class ProjectMemberDetailView(ProjectAccessMixin, APIView):
     """DELETE /api/v1/projects/<id>/members/<user_id>/ – remove member."""
     permission_classes = [IsAuthenticated, IsAdminOrProjectOwner]
-
-    def get_object(self):
-        project = ProjectService.get_project_by_id(self.kwargs["pk"], self.request.user)
-        self.check_object_permissions(self.request, project)
-        return project
+    query_budget = {"DELETE": 4}
 
     def delete(self, request: Request, pk: int, user_id: int) -> Response:
         project = self.get_object()
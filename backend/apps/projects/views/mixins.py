@@ -0,0 +1,48 @@
+"""
+TeamTrack – Project view mixins.
+Shared request handling for views nested under /api/v1/projects/<pk>/.
+"""
+from apps.projects.services import ProjectAccess, ProjectService
+
+
+class ProjectAccessMixin:
+    """
+    Resolve the caller's ProjectAccess once per request (the view instance is request-scoped).
+    Permission classes and handlers read it via get_project_access() instead of re-querying.
+    """
+
+    project_url_kwarg = "pk"
+    # Views that only need the project id (task endpoints) may answer from the access token's
+    # claims (settings.JWT_ACCESS_CLAIMS), skipping the query; project fields then load lazily.
+    project_access_from_token = False
+
+    def get_project_access(self) -> ProjectAccess:
+        access = getattr(self, "_project_access", None)
+        if access is None:
+            project_id, user = self.kwargs[self.project_url_kwarg], self.request.user
+            if self.project_access_from_token:
+                access = ProjectService.get_project_access_from_claims(project_id, user, self.request.auth)
+            if access is None:
+                access = ProjectService.get_project_access(project_id, user)
+            self._project_access = access
+        return access
+
+    async def aget_project_access(self) -> ProjectAccess:
+        """Async get_project_access (for AsyncAPIView handlers); shares the per-request cache."""
+        access = getattr(self, "_project_access", None)
+        if access is None:
+            project_id, user = self.kwargs[self.project_url_kwarg], self.request.user
+            if self.project_access_from_token:
+                access = await ProjectService.aget_project_access_from_claims(project_id, user, self.request.auth)
+            if access is None:
+                access = await ProjectService.aget_project_access(project_id, user)
+            self._project_access = access
+        return access
+
+    def get_project(self):
+        return self.get_project_access().project
+
+    def get_object(self):
+        project = self.get_project()
+        self.check_object_permissions(self.request, project)
+        return project
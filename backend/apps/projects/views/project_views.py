@@ -9,8 +9,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
 
+from core.conditional import etag_matches, not_modified_response, request_etag
+from core.fieldsets import SparseFieldsetMixin
 from core.responses import success_response
 from core.exceptions import ValidationError as APIValidationError
+from core.views import AsyncAPIView
 
 from apps.projects.serializers import (
     ProjectCreateUpdateSerializer,
@@ -19,15 +22,23 @@ from apps.projects.serializers import (
 )
 from apps.projects.services import ProjectService
 from apps.projects.permissions import IsAdminOrProjectOwner as ProjectPermission
+from apps.projects.views.mixins import ProjectAccessMixin
 
 
-class ProjectListView(ListAPIView, APIView):
-    """GET /api/v1/projects/ – list projects for current user. POST – create project."""
+class ProjectListView(SparseFieldsetMixin, ListAPIView, AsyncAPIView):
+    """GET /api/v1/projects/ – list projects for current user (?fields= / ?exclude=). POST – create project."""
     permission_classes = [IsAuthenticated]
+    query_budget = {"GET": 3, "POST": 5}
     serializer_class = ProjectListSerializer
+    fieldset_columns = {"created_by_email": ("created_by__email",), "member_count": ()}
 
     def get_queryset(self):
-        return ProjectService.list_projects_for_user(self.request.user)
+        fieldset = self.get_fieldset()
+        queryset = ProjectService.list_projects_for_user(
+            self.request.user,
+            with_member_count=fieldset is None or "member_count" in fieldset,
+        )
+        return self.apply_fieldset(queryset)
 
     def get(self, request: Request) -> Response:
         queryset = self.get_queryset()
@@ -38,6 +49,16 @@ class ProjectListView(ListAPIView, APIView):
         serializer = self.get_serializer(queryset, many=True)
         return success_response(data=serializer.data)
 
+    async def aget(self, request: Request) -> Response:
+        """Async get (settings.API_ASYNC_VIEWS)."""
+        queryset = self.get_queryset()
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        serializer = self.get_serializer([project async for project in queryset], many=True)
+        return success_response(data=serializer.data)
+
     def post(self, request: Request) -> Response:
         serializer = ProjectCreateUpdateSerializer(data=request.data)
         if not serializer.is_valid():
@@ -53,19 +74,18 @@ class ProjectListView(ListAPIView, APIView):
         )
 
 
-class ProjectDetailView(APIView):
+class ProjectDetailView(ProjectAccessMixin, APIView):
     """GET /api/v1/projects/<id>/ – retrieve. PATCH – update. DELETE – delete."""
     permission_classes = [IsAuthenticated, ProjectPermission]
-
-    def get_object(self):
-        project = ProjectService.get_project_by_id(self.kwargs["pk"], self.request.user)
-        self.check_object_permissions(self.request, project)
-        return project
+    query_budget = {"GET": 4, "PATCH": 4}
 
     def get(self, request: Request, pk: int) -> Response:
         project = self.get_object()
+        etag = request_etag(request, "project", *ProjectService.get_project_fingerprint(project))
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
         serializer = ProjectDetailSerializer(project)
-        return success_response(data=serializer.data)
+        return success_response(data=serializer.data, etag=etag)
 
     def patch(self, request: Request, pk: int) -> Response:
         project = self.get_object()
@@ -76,7 +96,7 @@ class ProjectDetailView(APIView):
                 code="validation_error",
                 details=serializer.errors,
             )
-        project = ProjectService.update_project(pk, serializer.validated_data)
+        project = ProjectService.update_project(pk, serializer.validated_data, project=project)
         return success_response(data=ProjectDetailSerializer(project).data)
 
     def delete(self, request: Request, pk: int) -> Response:
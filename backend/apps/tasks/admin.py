@@ -1,5 +1,8 @@
 from django.contrib import admin
-from .models import Task
+from django.db import transaction
+
+from .models import Task, ProjectTaskStats, TaskDeletion
+from .services import TaskService
 
 
 @admin.register(Task)
@@ -8,3 +11,30 @@ class TaskAdmin(admin.ModelAdmin):
     list_filter = ("status", "priority", "project")
     search_fields = ("title", "description")
     readonly_fields = ("created_at", "updated_at")
+
+    # Admin writes keep the counters, tombstones and project versions TaskService maintains.
+    def save_model(self, request, obj, form, change):
+        with transaction.atomic():
+            super().save_model(request, obj, form, change)
+            if change:
+                TaskService.record_saved_task(obj, form.initial["project"], form.initial["status"])
+            else:
+                TaskService.record_saved_task(obj)
+
+    def delete_model(self, request, obj):
+        TaskService.delete_tasks(Task.objects.filter(pk=obj.pk))
+
+    def delete_queryset(self, request, queryset):
+        TaskService.delete_tasks(queryset)
+
+
+@admin.register(ProjectTaskStats)
+class ProjectTaskStatsAdmin(admin.ModelAdmin):
+    list_display = ("project", "total", "todo", "in_progress", "done", "updated_at")
+    readonly_fields = ("project", "total", "todo", "in_progress", "done", "updated_at")
+
+
+@admin.register(TaskDeletion)
+class TaskDeletionAdmin(admin.ModelAdmin):
+    list_display = ("task_id", "project_id", "deleted_at")
+    readonly_fields = ("task_id", "project_id", "deleted_at")
@@ -1,7 +1,29 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_migrate
+
+
+def install_task_search_index(sender, using="default", **kwargs):
+    """Create the full-text index (and its sync triggers) once the tasks table exists."""
+    from django.db import DatabaseError
+
+    from apps.tasks.services.task_search import install_task_search, logger
+
+    if using != "default":
+        return
+    try:
+        install_task_search()
+    except DatabaseError:
+        logger.warning("Could not install the task search index; search falls back to LIKE.", exc_info=True)
 
 
 class TasksConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.tasks"
     verbose_name = "Tasks"
+
+    def ready(self):
+        post_migrate.connect(install_task_search_index, sender=self)
+
+        from apps.tasks import signals
+
+        signals.connect()
@@ -0,0 +1,119 @@
+"""
+TeamTrack – Index audit for task list queries.
+Runs EXPLAIN (and times the first page) for every TaskService.list_tasks filter combination
+and flags plans that fall back to full scans or filesorts.
+"""
+import itertools
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.db.models import Count
+
+from apps.projects.models import Project
+from apps.tasks.models import Task
+from apps.tasks.services import TaskService
+
+FILTERS = ("status", "assigned_to", "priority", "due_date")
+
+# Plan fragments that mean the query is not served by an index, per database vendor.
+WARNING_MARKERS = {
+    "sqlite": {
+        "USE TEMP B-TREE FOR ORDER BY": "filesort",
+        "SCAN tasks_task": "full scan",
+    },
+    "mysql": {
+        "Using filesort": "filesort",
+        "type=ALL": "full scan",
+        "Using temporary": "temporary table",
+    },
+}
+
+
+class Command(BaseCommand):
+    help = "EXPLAIN every task list filter combination and flag filesorts / full scans."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", type=int, help="Project to audit (default: the one with most tasks).")
+        parser.add_argument("--page-size", type=int, default=20, help="Rows fetched per timed query.")
+        parser.add_argument("--repeat", type=int, default=5, help="Timed runs per query (best is reported).")
+        parser.add_argument("--verbose-plans", action="store_true", help="Print the full plan for each query.")
+
+    def handle(self, *args, **options):
+        project = self._get_project(options.get("project"))
+        samples = self._sample_values(project)
+        markers = WARNING_MARKERS.get(connection.vendor, {})
+        flagged = 0
+
+        self.stdout.write(f"Auditing task list queries for project {project.pk} ({connection.vendor})")
+        for size in range(len(FILTERS) + 1):
+            for combination in itertools.combinations(FILTERS, size):
+                filters = {name: samples[name] for name in combination}
+                queryset = TaskService.list_tasks(project, **self._to_kwargs(filters))
+                for label, qs in (("page", queryset), ("cursor", queryset.order_by("-updated_at", "-id"))):
+                    plan = qs.explain() if connection.vendor != "mysql" else self._mysql_plan(qs)
+                    issues = sorted({issue for marker, issue in markers.items() if marker in plan})
+                    elapsed = self._time(qs, options["page_size"], options["repeat"])
+                    flagged += bool(issues)
+                    status = self.style.WARNING(", ".join(issues)) if issues else self.style.SUCCESS("ok")
+                    name = "+".join(combination) or "(none)"
+                    self.stdout.write(f"{name:<40} {label:<7} {elapsed:8.2f} ms  {status}")
+                    if options["verbose_plans"] or issues:
+                        for line in plan.splitlines():
+                            self.stdout.write(f"    {line}")
+
+        self.stdout.write(f"{flagged} quer{'y' if flagged == 1 else 'ies'} flagged.")
+
+    def _get_project(self, project_id):
+        if project_id is not None:
+            project = Project.objects.filter(pk=project_id).first()
+        else:
+            project = Project.objects.annotate(task_total=Count("tasks")).order_by("-task_total").first()
+        if project is None:
+            raise CommandError("No project to audit.")
+        return project
+
+    @staticmethod
+    def _sample_values(project):
+        """Most common value per filter, so plans reflect realistic selectivity."""
+        tasks = Task.objects.filter(project=project)
+
+        def most_common(field):
+            row = tasks.exclude(**{f"{field}__isnull": True}).values(field).annotate(n=Count("id")).order_by("-n").first()
+            return row[field] if row else None
+
+        return {
+            "status": most_common("status") or Task.Status.TODO,
+            "assigned_to": most_common("assigned_to"),
+            "priority": most_common("priority") or Task.Priority.MEDIUM,
+            "due_date": most_common("due_date"),
+        }
+
+    @staticmethod
+    def _to_kwargs(filters):
+        kwargs = dict(filters)
+        if "due_date" in kwargs:
+            due_date = kwargs.pop("due_date")
+            kwargs["due_date_from"] = due_date
+            kwargs["due_date_to"] = due_date
+        return kwargs
+
+    @staticmethod
+    def _mysql_plan(queryset):
+        """Flatten MySQL's tabular EXPLAIN into key=value lines for marker matching."""
+        sql, params = queryset.query.sql_with_params()
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN {sql}", params)
+            columns = [column[0] for column in cursor.description]
+            rows = cursor.fetchall()
+        return "\n".join(" ".join(f"{column}={value}" for column, value in zip(columns, row)) for row in rows)
+
+    @staticmethod
+    def _time(queryset, page_size, repeat):
+        best = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            list(queryset[:page_size])
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
@@ -0,0 +1,76 @@
+"""
+TeamTrack – Task list serialization microbenchmark.
+Times TaskListSerializer (model instances + DRF field dispatch) against TaskListValuesSerializer
+(values() rows) on the same page of tasks, and checks both render to identical JSON.
+"""
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from rest_framework.renderers import JSONRenderer
+
+from apps.projects.models import Project
+from apps.tasks.serializers import TaskListSerializer, TaskListValuesSerializer
+from apps.tasks.services import TaskService
+
+
+class Command(BaseCommand):
+    help = "Compare per-row cost of the ModelSerializer and values() task list serialization paths."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--project", type=int, help="Project to read (default: the one with most tasks).")
+        parser.add_argument("--rows", type=int, default=100, help="Rows per page (default 100, the max page size).")
+        parser.add_argument("--repeat", type=int, default=50, help="Timed runs per path (best is reported).")
+
+    def handle(self, *args, **options):
+        project = self._get_project(options.get("project"))
+        queryset = TaskService.list_tasks(project)
+        rows = options["rows"]
+
+        instances = list(queryset[:rows])
+        values = list(TaskListValuesSerializer.get_queryset(queryset)[:rows])
+        if not instances:
+            raise CommandError(f"Project {project.pk} has no tasks.")
+
+        renderer = JSONRenderer()
+        expected = renderer.render(TaskListSerializer(instances, many=True).data)
+        actual = renderer.render(TaskListValuesSerializer(values, many=True).data)
+        if expected != actual:
+            raise CommandError("TaskListValuesSerializer output differs from TaskListSerializer.")
+
+        self.stdout.write(f"Serializing {len(instances)} tasks of project {project.pk} (best of {options['repeat']})")
+        results = {
+            "serialize: TaskListSerializer": self._time(
+                lambda: TaskListSerializer(instances, many=True).data, options["repeat"]),
+            "serialize: TaskListValuesSerializer": self._time(
+                lambda: TaskListValuesSerializer(values, many=True).data, options["repeat"]),
+            "fetch+serialize: TaskListSerializer": self._time(
+                lambda: TaskListSerializer(list(queryset[:rows]), many=True).data, options["repeat"]),
+            "fetch+serialize: TaskListValuesSerializer": self._time(
+                lambda: TaskListValuesSerializer(
+                    list(TaskListValuesSerializer.get_queryset(queryset)[:rows]), many=True).data,
+                options["repeat"]),
+        }
+        for label, elapsed in results.items():
+            per_row = elapsed * 1000 / len(instances)
+            self.stdout.write(f"{label:<45} {elapsed:8.2f} ms  {per_row:7.2f} us/row")
+        self.stdout.write(self.style.SUCCESS("Output identical."))
+
+    def _get_project(self, project_id):
+        if project_id is not None:
+            project = Project.objects.filter(pk=project_id).first()
+        else:
+            project = Project.objects.annotate(task_total=Count("tasks")).order_by("-task_total").first()
+        if project is None:
+            raise CommandError("No project to benchmark.")
+        return project
+
+    @staticmethod
+    def _time(func, repeat):
+        best = None
+        for _ in range(max(repeat, 1)):
+            start = time.perf_counter()
+            func()
+            elapsed = (time.perf_counter() - start) * 1000
+            best = elapsed if best is None else min(best, elapsed)
+        return best
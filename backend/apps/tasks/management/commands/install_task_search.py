@@ -0,0 +1,23 @@
+"""
+TeamTrack – Install or rebuild the task full-text search index.
+Runs automatically after migrate; use --rebuild to re-index existing tasks.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.tasks.services.task_search import install_task_search
+
+
+class Command(BaseCommand):
+    help = "Create (or rebuild) the full-text search index used for task search."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rebuild", action="store_true", help="Re-index all existing tasks.")
+        parser.add_argument(
+            "--backend",
+            choices=["auto", "sqlite_fts5", "mysql_fulltext", "like"],
+            help="Backend to install (default: settings.TASK_SEARCH_BACKEND).",
+        )
+
+    def handle(self, *args, **options):
+        backend = install_task_search(rebuild=options["rebuild"], backend_name=options.get("backend"))
+        self.stdout.write(self.style.SUCCESS(f"Task search index ready ({backend.name})."))
@@ -0,0 +1,29 @@
+"""
+TeamTrack – Prune the task deletion log.
+Removes tombstones older than settings.TASK_SYNC_RETENTION_DAYS (sync tokens that old are
+rejected anyway). Intended for a daily cron job.
+"""
+import datetime
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from apps.tasks.services import TaskSyncService
+
+
+class Command(BaseCommand):
+    help = "Delete task tombstones older than the sync retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TASK_SYNC_RETENTION_DAYS,
+            help="Keep tombstones newer than this many days (default: TASK_SYNC_RETENTION_DAYS).",
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - datetime.timedelta(days=options["days"])
+        deleted = TaskSyncService.prune(before=before)
+        self.stdout.write(self.style.SUCCESS(f"Pruned {deleted} task tombstone(s) older than {before:%Y-%m-%d %H:%M}."))
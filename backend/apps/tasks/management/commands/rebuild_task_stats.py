@@ -0,0 +1,24 @@
+"""
+TeamTrack – Rebuild ProjectTaskStats from the tasks table.
+Run after deploying the stats table, or to repair counters after writes that bypassed TaskService.
+"""
+from django.core.management.base import BaseCommand
+
+from apps.tasks.services import TaskStatsService
+
+
+class Command(BaseCommand):
+    help = "Reconcile per-project task counters (ProjectTaskStats) with the tasks table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--project",
+            type=int,
+            action="append",
+            dest="project_ids",
+            help="Only rebuild the given project id (repeatable). Default: all projects.",
+        )
+
+    def handle(self, *args, **options):
+        fixed = TaskStatsService.rebuild(project_ids=options.get("project_ids"))
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt task stats: {fixed} row(s) created or corrected."))
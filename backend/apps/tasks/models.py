@@ -1,9 +1,11 @@
 """
 TeamTrack – Task model.
 Work item under a project; belongs to project, has status, priority, assignee, due date.
+Also per-project task counters and the deletion log used by the changes (sync) endpoint.
 """
 from django.conf import settings
 from django.db import models
+from django.utils import timezone
 
 
 class Task(models.Model):
@@ -59,7 +61,61 @@ class Task(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["assigned_to"]),
             models.Index(fields=["due_date"]),
+            # List query shapes: filter by project (+ status / assignee), order by -updated_at, -id.
+            # See the audit_task_indexes management command.
+            models.Index(fields=["project", "-updated_at", "-id"]),
+            models.Index(fields=["project", "status", "-updated_at", "-id"]),
+            models.Index(fields=["project", "assigned_to", "-updated_at", "-id"]),
         ]
 
     def __str__(self):
         return self.title
+
+
+class ProjectTaskStats(models.Model):
+    """
+    Materialized per-project task counters, maintained by TaskStatsService in the same
+    transaction as task writes so reads cost one row per project instead of a scan over tasks.
+    Overdue tasks depend on the current date and are not stored (TaskStatsService.overdue_counts).
+    """
+
+    project = models.OneToOneField(
+        "projects.Project",
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="task_stats",
+    )
+    total = models.PositiveIntegerField(default=0)
+    todo = models.PositiveIntegerField(default=0)
+    in_progress = models.PositiveIntegerField(default=0)
+    done = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        verbose_name = "project task stats"
+        verbose_name_plural = "project task stats"
+
+    def __str__(self):
+        return f"Task stats for project {self.project_id}"
+
+
+class TaskDeletion(models.Model):
+    """
+    Tombstone for a deleted task, read by the changes endpoint (TaskSyncService).
+    task_id / project_id are plain integers: the rows they pointed to no longer exist.
+    Pruned after settings.TASK_SYNC_RETENTION_DAYS (prune_task_deletions).
+    """
+
+    task_id = models.PositiveBigIntegerField()
+    project_id = models.PositiveBigIntegerField()
+    deleted_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            # Changes query: filter by project, keyset scan over (deleted_at, id).
+            models.Index(fields=["project_id", "deleted_at", "id"]),
+            models.Index(fields=["deleted_at"]),
+        ]
+
+    def __str__(self):
+        return f"Task {self.task_id} deleted from project {self.project_id}"
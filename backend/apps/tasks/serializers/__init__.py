@@ -2,10 +2,18 @@ from .task_serializer import (
     TaskCreateUpdateSerializer,
     TaskListSerializer,
     TaskDetailSerializer,
+    TaskListValuesSerializer,
+    TaskDeletionSerializer,
+    TaskBulkOperationSerializer,
+    TaskBulkSerializer,
 )
 
 __all__ = [
     "TaskCreateUpdateSerializer",
     "TaskListSerializer",
     "TaskDetailSerializer",
+    "TaskListValuesSerializer",
+    "TaskDeletionSerializer",
+    "TaskBulkOperationSerializer",
+    "TaskBulkSerializer",
 ]
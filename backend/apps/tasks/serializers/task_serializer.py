@@ -1,8 +1,10 @@
 """
-TeamTrack – Task serializers (create/update, list, detail).
+TeamTrack – Task serializers (create/update, list, detail, changes, bulk).
 """
+from django.conf import settings
 from rest_framework import serializers
 
+from core.fieldsets import SparseFieldsetSerializerMixin
 from apps.tasks.models import Task
 
 
@@ -28,8 +30,8 @@ class TaskCreateUpdateSerializer(serializers.Serializer):
         return value
 
 
-class TaskListSerializer(serializers.ModelSerializer):
-    """Serialize task for list (with assignee email)."""
+class TaskListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """Serialize task for list (with assignee email). Accepts fields= for sparse fieldsets."""
 
     assigned_to_email = serializers.EmailField(source="assigned_to.email", read_only=True, allow_null=True)
     created_by_email = serializers.EmailField(source="created_by.email", read_only=True)
@@ -54,27 +56,99 @@ class TaskListSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class TaskDetailSerializer(serializers.ModelSerializer):
-    """Serialize task for detail (same as list; full fields)."""
+class TaskDetailSerializer(TaskListSerializer):
+    """Serialize task for detail (same fields as list)."""
 
-    assigned_to_email = serializers.EmailField(source="assigned_to.email", read_only=True, allow_null=True)
-    created_by_email = serializers.EmailField(source="created_by.email", read_only=True)
 
-    class Meta:
-        model = Task
-        fields = (
-            "id",
-            "project",
-            "title",
-            "description",
-            "status",
-            "priority",
-            "due_date",
-            "assigned_to",
-            "assigned_to_email",
-            "created_by",
-            "created_by_email",
-            "created_at",
-            "updated_at",
-        )
-        read_only_fields = fields
+class TaskListValuesSerializer:
+    """
+    Fast read path producing exactly TaskListSerializer's output from values() rows.
+    Only the listed columns are fetched (emails through the join) and no model instances
+    or per-field serializer dispatch are involved. Use get_queryset() to turn a task
+    queryset into rows, then TaskListValuesSerializer(rows, many=True).data; pass the same
+    fields to both for a sparse fieldset.
+    """
+
+    # Output field -> values() lookup, in TaskListSerializer.Meta.fields order.
+    columns = {
+        "id": "id",
+        "project": "project_id",
+        "title": "title",
+        "description": "description",
+        "status": "status",
+        "priority": "priority",
+        "due_date": "due_date",
+        "assigned_to": "assigned_to_id",
+        "assigned_to_email": "assigned_to__email",
+        "created_by": "created_by_id",
+        "created_by_email": "created_by__email",
+        "created_at": "created_at",
+        "updated_at": "updated_at",
+    }
+    # Formatting delegated to the DRF fields so output follows DATE_FORMAT / DATETIME_FORMAT.
+    formatters = {
+        "due_date": serializers.DateField().to_representation,
+        "created_at": serializers.DateTimeField().to_representation,
+        "updated_at": serializers.DateTimeField().to_representation,
+    }
+
+    def __init__(self, instance, many=False, fields=None):
+        self.instance = instance
+        self.many = many
+        # Output in column order whatever the order of fields, like TaskListSerializer.
+        self.selected = {field: lookup for field, lookup in self.columns.items() if fields is None or field in fields}
+        self.selected_formatters = [(field, fmt) for field, fmt in self.formatters.items() if field in self.selected]
+
+    @classmethod
+    def get_queryset(cls, queryset, fields=None, extra=()):
+        """
+        values() rows for the given output fields (default: all). extra adds columns needed
+        by the caller but not output, e.g. the keyset pagination ordering.
+        Email lookups (and their joins) are only included when requested.
+        """
+        lookups = [cls.columns[field] for field in (fields or cls.columns)]
+        return queryset.values(*dict.fromkeys([*lookups, *extra]))
+
+    def to_representation(self, row: dict) -> dict:
+        data = {field: row[lookup] for field, lookup in self.selected.items()}
+        for field, format_value in self.selected_formatters:
+            if data[field] is not None:
+                data[field] = format_value(data[field])
+        return data
+
+    @property
+    def data(self):
+        if self.many:
+            return [self.to_representation(row) for row in self.instance]
+        return self.to_representation(self.instance)
+
+
+class TaskDeletionSerializer(serializers.Serializer):
+    """Serialize a tombstone from the changes endpoint (deleted task id and time)."""
+
+    id = serializers.IntegerField(read_only=True)
+    deleted_at = serializers.DateTimeField(read_only=True)
+
+
+class TaskBulkOperationSerializer(serializers.Serializer):
+    """One bulk operation: op, target task id (update/delete) and task data (create/update)."""
+
+    OP_CHOICES = ("create", "update", "delete")
+
+    op = serializers.ChoiceField(choices=OP_CHOICES)
+    id = serializers.IntegerField(required=False, min_value=1)
+    data = serializers.DictField(required=False, default=dict)
+
+    def validate(self, attrs):
+        if attrs["op"] in ("update", "delete") and attrs.get("id") is None:
+            raise serializers.ValidationError({"id": ["This field is required for update and delete."]})
+        if attrs["op"] == "create" and attrs.get("id") is not None:
+            raise serializers.ValidationError({"id": ["Must not be set for create."]})
+        return attrs
+
+
+class TaskBulkSerializer(serializers.Serializer):
+    """Validate the bulk envelope. Task data of each operation is validated with TaskCreateUpdateSerializer."""
+
+    operations = TaskBulkOperationSerializer(many=True, allow_empty=False, max_length=settings.TASK_BULK_MAX_OPERATIONS)
+    atomic = serializers.BooleanField(required=False, default=True)
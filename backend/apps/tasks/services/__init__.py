@@ -1,3 +1,6 @@
+from .task_event_service import TaskEventService
 from .task_service import TaskService
+from .task_stats_service import TaskStatsService
+from .task_sync_service import TaskSyncService
 
-__all__ = ["TaskService"]
+__all__ = ["TaskEventService", "TaskService", "TaskStatsService", "TaskSyncService"]
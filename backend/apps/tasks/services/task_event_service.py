@@ -0,0 +1,54 @@
+"""
+TeamTrack – Task event stream tickets.
+EventSource cannot send an Authorization header, so a client opening the SSE stream first asks
+for a ticket (an authenticated POST) and passes it as ?ticket=. A ticket is signed, names one
+user and one project, expires after settings.TASK_EVENTS_TICKET_SECONDS and is accepted once,
+so one that leaks through a URL log is worth one stream of one project for a few seconds, not
+an access token. Single use is enforced through the cache (shared across workers when the
+cache backend is).
+"""
+import secrets
+
+from django.conf import settings
+from django.core import signing
+from django.core.cache import cache
+
+from core.exceptions import AuthenticationError
+
+from apps.users.models import User
+
+TICKET_SALT = "tasks.events.ticket"
+
+
+def _redeemed_key(nonce: str) -> str:
+    return f"tasks:events:ticket:{nonce}"
+
+
+class TaskEventService:
+    """Single-use tickets for the task event stream."""
+
+    @staticmethod
+    def issue_ticket(user: User, project_id: int) -> str:
+        """Ticket for user to open project_id's event stream (caller checked view access)."""
+        return signing.dumps({"u": user.pk, "p": project_id, "n": secrets.token_urlsafe(12)}, salt=TICKET_SALT)
+
+    @staticmethod
+    def redeem_ticket(ticket: str, project_id: int) -> User:
+        """
+        Return the user the ticket was issued to. Raises AuthenticationError if it is invalid,
+        expired, for another project, already used or its user is inactive.
+        """
+        try:
+            payload = signing.loads(ticket, salt=TICKET_SALT, max_age=settings.TASK_EVENTS_TICKET_SECONDS)
+        except signing.SignatureExpired:
+            raise AuthenticationError(message="Stream ticket expired.", code="ticket_expired")
+        except signing.BadSignature:
+            raise AuthenticationError(message="Invalid stream ticket.", code="ticket_invalid")
+        if payload.get("p") != project_id:
+            raise AuthenticationError(message="Invalid stream ticket.", code="ticket_invalid")
+        if not cache.add(_redeemed_key(payload["n"]), True, timeout=settings.TASK_EVENTS_TICKET_SECONDS):
+            raise AuthenticationError(message="Stream ticket already used.", code="ticket_used")
+        try:
+            return User.objects.get(pk=payload["u"], is_active=True)
+        except User.DoesNotExist:
+            raise AuthenticationError(message="Invalid stream ticket.", code="ticket_invalid")
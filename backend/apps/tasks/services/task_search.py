@@ -0,0 +1,210 @@
+"""
+TeamTrack – Task search backends.
+Pluggable full-text search for TaskService.list_tasks(search=...):
+- like: title/description icontains (portable fallback, substring semantics)
+- sqlite_fts5: FTS5 external-content table kept in sync with tasks_task by triggers
+- mysql_fulltext: InnoDB FULLTEXT index queried in boolean mode
+Index-based backends match whole words and word prefixes ("deplo" finds "deployment"),
+rank by relevance on request, and fall back to `like` for terms they cannot index and for
+terms no word of the searched tasks starts with (substrings inside words: "ploy" finds "deploy").
+Selected by settings.TASK_SEARCH_BACKEND ("auto" picks the best one for the database).
+"""
+import logging
+import re
+
+from django.conf import settings
+from django.db import DatabaseError, connection
+from django.db.models import FloatField, Q, QuerySet
+from django.db.models.expressions import RawSQL
+
+logger = logging.getLogger(__name__)
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+class LikeSearchBackend:
+    """Substring match with LIKE '%term%' (full scan; always available)."""
+
+    name = "like"
+    supports_ranking = False
+
+    def is_available(self) -> bool:
+        return True
+
+    def install(self, rebuild=False) -> None:
+        """Create index structures (no-op for LIKE)."""
+
+    def filter(self, queryset: QuerySet, term: str, rank: bool = False) -> QuerySet:
+        return queryset.filter(Q(title__icontains=term) | Q(description__icontains=term))
+
+    def substring_fallback(self, queryset: QuerySet, matched: QuerySet, term: str) -> QuerySet:
+        """
+        matched (the index backend's result), or a LIKE search over queryset when matched is
+        empty: word indexes cannot match inside words ("ploy" in "deploy"). The check is an
+        EXISTS over matched, i.e. over the searched tasks only, so one project's results never
+        depend on other projects' tasks. Off with settings.TASK_SEARCH_SUBSTRING_FALLBACK.
+        """
+        if settings.TASK_SEARCH_SUBSTRING_FALLBACK and not matched.exists():
+            return LikeSearchBackend.filter(self, queryset, term)
+        return matched
+
+
+class SQLiteFTS5SearchBackend(LikeSearchBackend):
+    """SQLite FTS5 index over title and description, ranked with bm25()."""
+
+    name = "sqlite_fts5"
+    supports_ranking = True
+    table = "tasks_task_fts"
+
+    INSTALL_SQL = (
+        "CREATE VIRTUAL TABLE IF NOT EXISTS tasks_task_fts USING fts5("
+        "title, description, content='tasks_task', content_rowid='id', tokenize='unicode61')",
+        "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_ai AFTER INSERT ON tasks_task BEGIN "
+        "INSERT INTO tasks_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+        "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_ad AFTER DELETE ON tasks_task BEGIN "
+        "INSERT INTO tasks_task_fts(tasks_task_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); END",
+        "CREATE TRIGGER IF NOT EXISTS tasks_task_fts_au AFTER UPDATE OF title, description ON tasks_task BEGIN "
+        "INSERT INTO tasks_task_fts(tasks_task_fts, rowid, title, description) "
+        "VALUES ('delete', old.id, old.title, old.description); "
+        "INSERT INTO tasks_task_fts(rowid, title, description) VALUES (new.id, new.title, new.description); END",
+    )
+
+    def is_available(self) -> bool:
+        if connection.vendor != "sqlite":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = %s", [self.table])
+            return cursor.fetchone() is not None
+
+    def install(self, rebuild=False) -> None:
+        existed = self.is_available()
+        with connection.cursor() as cursor:
+            for statement in self.INSTALL_SQL:
+                cursor.execute(statement)
+            if rebuild or not existed:
+                cursor.execute("INSERT INTO tasks_task_fts(tasks_task_fts) VALUES ('rebuild')")
+
+    @staticmethod
+    def match_expression(term: str):
+        tokens = TOKEN_RE.findall(term)
+        if not tokens:
+            return None
+        # Every token must match, as a word or word prefix.
+        return " ".join(f'"{token}"*' for token in tokens)
+
+    def filter(self, queryset: QuerySet, term: str, rank: bool = False) -> QuerySet:
+        match = self.match_expression(term)
+        if match is None:
+            return super().filter(queryset, term)
+        # The match runs once; tasks of the project are then probed against its rowids.
+        matched = queryset.filter(id__in=RawSQL(f"SELECT rowid FROM {self.table} WHERE {self.table} MATCH %s", (match,)))
+        if rank:
+            # bm25() is only defined inside a MATCH query. The ranks are computed by one
+            # materialized CTE (one index scan per query) and each row's rank looked up in it;
+            # without MATERIALIZED SQLite flattens it into one MATCH per row, which is far slower.
+            materialized = "MATERIALIZED " if connection.Database.sqlite_version_info >= (3, 35) else ""
+            rank_sql = (
+                f"WITH ranked AS {materialized}(SELECT rowid AS task_id, -bm25({self.table}) AS score "
+                f"FROM {self.table} WHERE {self.table} MATCH %s) "
+                f"SELECT score FROM ranked WHERE ranked.task_id = tasks_task.id"
+            )
+            matched = matched.annotate(
+                search_rank=RawSQL(rank_sql, (match,), output_field=FloatField())
+            ).order_by("-search_rank", "-updated_at", "-id")
+        return self.substring_fallback(queryset, matched, term)
+
+
+class MySQLFullTextSearchBackend(LikeSearchBackend):
+    """InnoDB FULLTEXT index over (title, description), boolean mode with prefix operators."""
+
+    name = "mysql_fulltext"
+    supports_ranking = True
+    index_name = "tasks_task_title_description_ft"
+
+    def is_available(self) -> bool:
+        if connection.vendor != "mysql":
+            return False
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT 1 FROM information_schema.statistics "
+                "WHERE table_schema = DATABASE() AND table_name = 'tasks_task' AND index_name = %s",
+                [self.index_name],
+            )
+            return cursor.fetchone() is not None
+
+    def install(self, rebuild=False) -> None:
+        # InnoDB maintains FULLTEXT indexes on every write; rebuild only applies to the index itself.
+        if self.is_available():
+            if not rebuild:
+                return
+            with connection.cursor() as cursor:
+                cursor.execute(f"ALTER TABLE tasks_task DROP INDEX {self.index_name}")
+        with connection.cursor() as cursor:
+            cursor.execute(f"ALTER TABLE tasks_task ADD FULLTEXT INDEX {self.index_name} (title, description)")
+
+    @staticmethod
+    def match_expression(term: str):
+        tokens = TOKEN_RE.findall(term)
+        # Tokens shorter than innodb_ft_min_token_size (default 3) are never indexed.
+        if not tokens or any(len(token) < settings.TASK_SEARCH_MYSQL_MIN_TOKEN for token in tokens):
+            return None
+        return " ".join(f"+{token}*" for token in tokens)
+
+    def filter(self, queryset: QuerySet, term: str, rank: bool = False) -> QuerySet:
+        match = self.match_expression(term)
+        if match is None:
+            return super().filter(queryset, term)
+        score = RawSQL(
+            "MATCH (tasks_task.title, tasks_task.description) AGAINST (%s IN BOOLEAN MODE)",
+            (match,),
+            output_field=FloatField(),
+        )
+        matched = queryset.annotate(search_rank=score).filter(search_rank__gt=0)
+        if rank:
+            matched = matched.order_by("-search_rank", "-updated_at", "-id")
+        return self.substring_fallback(queryset, matched, term)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (LikeSearchBackend, SQLiteFTS5SearchBackend, MySQLFullTextSearchBackend)
+}
+AUTO_BACKENDS = {"sqlite": SQLiteFTS5SearchBackend, "mysql": MySQLFullTextSearchBackend}
+
+
+_resolved = {}
+
+
+def _backend_class(name):
+    if name == "auto":
+        return AUTO_BACKENDS.get(connection.vendor, LikeSearchBackend)
+    return BACKENDS.get(name, LikeSearchBackend)
+
+
+def get_task_search_backend():
+    """
+    Return the configured search backend, or LikeSearchBackend when the configured one
+    does not match the database or its index has not been installed.
+    Resolved once per process (and again after install_task_search).
+    """
+    name = settings.TASK_SEARCH_BACKEND
+    key = (connection.alias, connection.vendor, name)
+    if key not in _resolved:
+        backend = _backend_class(name)()
+        try:
+            available = backend.is_available()
+        except DatabaseError:
+            available = False
+        if not available and backend.name != LikeSearchBackend.name:
+            logger.warning("Task search backend %s unavailable; falling back to LIKE.", backend.name)
+        _resolved[key] = backend if available else LikeSearchBackend()
+    return _resolved[key]
+
+
+def install_task_search(rebuild=False, backend_name=None):
+    """Create the index for the configured (or given) backend. Returns the backend used."""
+    backend = _backend_class(backend_name or settings.TASK_SEARCH_BACKEND)()
+    backend.install(rebuild=rebuild)
+    _resolved.clear()
+    return backend
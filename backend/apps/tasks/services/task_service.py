@@ -3,15 +3,21 @@ TeamTrack – Task service.
 Business logic for task CRUD and filtering.
 Project access is enforced by the view (ProjectService.get_project_by_id); modify by ProjectService.can_modify_project.
 """
-from django.db.models import QuerySet
-from django.db.models import Q
+from django.db import connection, transaction
+from django.db.models import Count, Max, QuerySet
+from django.utils import timezone
 
-from core.exceptions import NotFoundError, PermissionDeniedError
+from core.exceptions import NotFoundError, PermissionDeniedError, ValidationError
 
 from apps.users.models import User
 from apps.projects.models import Project, ProjectMember
 from apps.projects.services import ProjectService
 from apps.tasks.models import Task
+from apps.tasks.services.task_search import get_task_search_backend
+from apps.tasks.services.task_stats_service import TaskStatsService
+from apps.tasks.services.task_sync_service import TaskSyncService
+
+TASK_UPDATE_FIELDS = ("title", "description", "status", "priority", "due_date", "assigned_to")
 
 
 class TaskService:
@@ -26,10 +32,12 @@ class TaskService:
         due_date_from=None,
         due_date_to=None,
         search=None,
+        order_by_relevance=False,
     ) -> QuerySet:
         """
         Return tasks for the project with optional filters.
-        Ordered by -updated_at.
+        Ordered by -updated_at, or by search relevance when requested and the search
+        backend supports ranking.
         """
         qs = Task.objects.filter(project=project).select_related("assigned_to", "created_by").order_by("-updated_at")
         if status is not None:
@@ -43,22 +51,46 @@ class TaskService:
         if due_date_to is not None:
             qs = qs.filter(due_date__lte=due_date_to)
         if search and search.strip():
-            term = search.strip()
-            qs = qs.filter(Q(title__icontains=term) | Q(description__icontains=term))
+            qs = get_task_search_backend().filter(qs, search.strip(), rank=order_by_relevance)
         return qs
 
     @staticmethod
-    def get_task_by_id(project_id: int, task_id: int) -> Task:
-        """Return task by id; must belong to project. Raises NotFoundError if not found."""
+    def get_list_fingerprint(project: Project) -> tuple:
+        """
+        (task count, latest updated_at, project version) of the project's tasks. Count and
+        updated_at change on every create, update and delete (one index-only aggregate query);
+        the project version also changes when the creator / assignee emails the list shows
+        change or an assignee is deleted (ProjectService.bump_user_projects), which leaves the
+        task rows' updated_at untouched.
+        """
+        row = Task.objects.filter(project=project).aggregate(count=Count("id"), latest=Max("updated_at"))
+        version = ProjectService.get_project_versions([project.pk]).get(project.pk)
+        return (row["count"], row["latest"].isoformat() if row["latest"] else None, version)
+
+    @staticmethod
+    async def aget_list_fingerprint(project: Project) -> tuple:
+        """Async get_list_fingerprint."""
+        row = await Task.objects.filter(project=project).aaggregate(count=Count("id"), latest=Max("updated_at"))
+        version = (await ProjectService.aget_project_versions([project.pk])).get(project.pk)
+        return (row["count"], row["latest"].isoformat() if row["latest"] else None, version)
+
+    @staticmethod
+    def get_task_by_id(project_id: int, task_id: int, project: Project = None) -> Task:
+        """
+        Return task by id; must belong to project. Raises NotFoundError if not found.
+        Pass the already-loaded project to avoid joining it again.
+        """
+        related = ("assigned_to", "created_by") if project is not None else ("project", "assigned_to", "created_by")
         try:
-            task = Task.objects.select_related("project", "assigned_to", "created_by").get(
-                pk=task_id, project_id=project_id
-            )
+            task = Task.objects.select_related(*related).get(pk=task_id, project_id=project_id)
         except Task.DoesNotExist:
             raise NotFoundError(message="Task not found.")
+        if project is not None:
+            task.project = project
         return task
 
     @staticmethod
+    @transaction.atomic
     def create_task(project: Project, user: User, validated_data: dict) -> Task:
         """
         Create task under project. assigned_to must be project member if set.
@@ -81,15 +113,20 @@ class TaskService:
             assigned_to_id=assigned_to_id,
             created_by=user,
         )
+        TaskStatsService.record_created(task)
+        ProjectService.bump_project_version(project.pk)
+        ProjectService.publish_event(project.pk, "task.created", id=task.pk)
         return task
 
     @staticmethod
+    @transaction.atomic
     def update_task(project_id: int, task_id: int, validated_data: dict, project: Project = None) -> Task:
         """
-        Update task. assigned_to must be project member if set.
+        Update task. assigned_to must be project member if set (also when it is unchanged: a
+        member removed from the project keeps their tasks, but an update naming them is refused).
         Caller must have been checked for modify permission.
         """
-        task = TaskService.get_task_by_id(project_id, task_id)
+        task = TaskService.get_task_by_id(project_id, task_id, project=project)
         assigned_to_id = validated_data.get("assigned_to")
         if assigned_to_id is not None:
             if not ProjectMember.objects.filter(project=task.project, user_id=assigned_to_id).exists():
@@ -97,6 +134,7 @@ class TaskService:
                     message="Assigned user must be a member of the project.",
                     code="assignee_not_member",
                 )
+        old_status = task.status
         update_fields = []
         for key in ("title", "description", "status", "priority", "due_date", "assigned_to"):
             if key not in validated_data:
@@ -108,11 +146,261 @@ class TaskService:
                 setattr(task, key, validated_data[key])
                 update_fields.append(key)
         if update_fields:
-            task.save(update_fields=update_fields)
+            task.save(update_fields=update_fields + ["updated_at"])
+            if task.status != old_status:
+                TaskStatsService.record_updated(task, old_status)
+            ProjectService.bump_project_version(task.project_id)
+            ProjectService.publish_event(task.project_id, "task.updated", id=task.pk)
         return task
 
     @staticmethod
-    def delete_task(project_id: int, task_id: int) -> None:
+    @transaction.atomic
+    def delete_task(project_id: int, task_id: int, project: Project = None) -> None:
         """Delete task. Caller must have been checked for modify permission."""
-        task = TaskService.get_task_by_id(project_id, task_id)
-        task.delete()
+        task = TaskService.get_task_by_id(project_id, task_id, project=project)
+        task_pk = task.pk
+        deleted, _ = task.delete()
+        if deleted:
+            TaskStatsService.record_deleted(task)
+            TaskSyncService.record_deleted(task.project_id, [task_pk])
+            ProjectService.bump_project_version(task.project_id)
+            ProjectService.publish_event(task.project_id, "task.deleted", id=task_pk)
+
+    @staticmethod
+    @transaction.atomic
+    def delete_tasks(queryset) -> int:
+        """
+        Delete the tasks in queryset (of any projects) with delete_task's bookkeeping: counters,
+        tombstones, version bumps and events. Used by the Django admin. Returns the number deleted.
+        """
+        tasks = list(
+            Task.objects.select_for_update().filter(pk__in=queryset.values("pk")).only("id", "project_id", "status")
+        )
+        if tasks:
+            Task.objects.filter(pk__in=[task.pk for task in tasks]).delete()
+            TaskService.record_deleted_tasks(tasks)
+        return len(tasks)
+
+    @staticmethod
+    def record_deleted_tasks(tasks) -> None:
+        """
+        Bookkeeping for tasks deleted without delete_task (or about to be, by a cascade), inside
+        the deleting transaction: one counter update, tombstone insert, version bump and event per project.
+        """
+        by_project = {}
+        for task in tasks:
+            by_project.setdefault(task.project_id, []).append(task)
+        for project_id, deleted in by_project.items():
+            deleted_ids = [task.pk for task in deleted]
+            TaskStatsService.record_bulk(project_id, deleted=deleted)
+            TaskSyncService.record_deleted(project_id, deleted_ids)
+            ProjectService.bump_project_version(project_id)
+            ProjectService.publish_event(project_id, "task.bulk", created=[], updated=[], deleted=deleted_ids)
+
+    @staticmethod
+    def record_saved_task(task: Task, old_project_id: int = None, old_status=None) -> None:
+        """
+        Bookkeeping for a task saved without create_task / update_task (Django admin), inside the
+        saving transaction. old_project_id / old_status are its values before the save (None: created).
+        """
+        if old_project_id is None:
+            TaskStatsService.record_created(task)
+            event = "task.created"
+        elif old_project_id != task.project_id:
+            # Moved: it leaves the old project's counters and changes feed and joins the new one's.
+            TaskService.record_deleted_tasks([Task(pk=task.pk, project_id=old_project_id, status=old_status)])
+            TaskStatsService.record_created(task)
+            event = "task.created"
+        else:
+            if task.status != old_status:
+                TaskStatsService.record_updated(task, old_status)
+            event = "task.updated"
+        ProjectService.bump_project_version(task.project_id)
+        ProjectService.publish_event(task.project_id, event, id=task.pk)
+
+    @staticmethod
+    def record_user_deletion(user_id: int) -> None:
+        """
+        Bookkeeping for a user about to be deleted, inside the deleting transaction: the database
+        cascade removes the tasks they created (except in projects deleted along with them, whose
+        counters and tombstones go too) and unassigns their tasks, bypassing this service.
+        """
+        tasks = Task.objects.filter(created_by_id=user_id).exclude(project__created_by_id=user_id)
+        TaskService.record_deleted_tasks(list(tasks.only("id", "project_id", "status")))
+        # SET_NULL leaves updated_at alone; touch it so the changes endpoint sends the unassigned rows.
+        Task.objects.filter(assigned_to_id=user_id).exclude(created_by_id=user_id).update(updated_at=timezone.now())
+
+    @staticmethod
+    def _read_back_created_ids(project: Project, user: User, tasks: list) -> None:
+        """
+        Set the ids of tasks written by bulk_create where the INSERT cannot return them (e.g. MySQL).
+        The batch is found by its creator, project and the created_at stamped on each row; rows
+        sharing a stamp and title are matched in insertion (id) order. One query.
+        """
+        rows = (
+            Task.objects.filter(project=project, created_by=user, created_at__in={task.created_at for task in tasks})
+            .order_by("id")
+            .values_list("created_at", "title", "id")
+        )
+        ids_by_key = {}
+        for created_at, title, task_id in rows:
+            ids_by_key.setdefault((created_at, title), []).append(task_id)
+        for task in tasks:
+            task.pk = ids_by_key[(task.created_at, task.title)].pop(0)
+            task._state.adding = False
+
+    @staticmethod
+    def bulk_apply(project: Project, user: User, items: list, atomic: bool = True) -> list:
+        """
+        Apply a batch of create / update / delete operations to tasks of one project.
+        items: [{"index", "op", "id", "data", "errors"}] where data is validated
+        TaskCreateUpdateSerializer output and errors holds per-item validation errors.
+        Existence and assignee membership are checked for the whole batch with one query each,
+        in the transaction that writes it (targets locked with SELECT ... FOR UPDATE); writes use
+        bulk_create (plus one SELECT for the new ids without INSERT ... RETURNING) / one
+        bulk_update per set of changed fields / a single DELETE.
+        atomic=True: any failed item rejects the batch (ValidationError, nothing written).
+        atomic=False: valid items are applied, failed ones reported.
+        Returns per-item results: {"index", "op", "success", "id", "task"} or {..., "code", "errors"}.
+        Caller must have been checked for modify permission.
+        """
+        results = [None] * len(items)
+
+        def fail(item, code, errors):
+            results[item["index"]] = {
+                "index": item["index"],
+                "op": item["op"],
+                "success": False,
+                "id": item.get("id"),
+                "code": code,
+                "errors": errors,
+            }
+
+        with transaction.atomic():
+            # Targets are read and locked in the writing transaction, so no concurrent write can
+            # change or delete them between the checks below and the bulk writes.
+            target_ids = [item["id"] for item in items if item["op"] != "create" and item.get("id") is not None]
+            tasks_by_id = (
+                Task.objects.select_for_update().filter(project=project, pk__in=target_ids).in_bulk()
+                if target_ids else {}
+            )
+
+            assignee_ids = {
+                item["data"]["assigned_to"]
+                for item in items
+                if not item.get("errors") and (item.get("data") or {}).get("assigned_to") is not None
+            }
+            member_ids = set(
+                ProjectMember.objects.filter(project=project, user_id__in=assignee_ids).values_list("user_id", flat=True)
+            ) if assignee_ids else set()
+
+            seen_ids = set()
+            valid = []
+            for item in items:
+                if item.get("errors"):
+                    fail(item, "validation_error", item["errors"])
+                    continue
+                if item["op"] != "create":
+                    task = tasks_by_id.get(item["id"])
+                    if task is None:
+                        fail(item, "not_found", {"id": ["Task not found."]})
+                        continue
+                    if item["id"] in seen_ids:
+                        fail(item, "duplicate_task", {"id": ["Task is targeted by more than one operation."]})
+                        continue
+                    seen_ids.add(item["id"])
+                assigned_to_id = (item.get("data") or {}).get("assigned_to")
+                if assigned_to_id is not None and assigned_to_id not in member_ids:
+                    fail(item, "assignee_not_member", {"assigned_to": ["Assigned user must be a member of the project."]})
+                    continue
+                valid.append(item)
+
+            if atomic and len(valid) != len(items):
+                for item in valid:
+                    fail(item, "not_applied", {})
+                raise ValidationError(
+                    message="Bulk operation rejected; no changes were applied.",
+                    code="bulk_validation_failed",
+                    details={"results": results},
+                )
+
+            now = timezone.now()
+            creates, updates, deletes = [], [], []
+            # Updated rows grouped by the columns they change: each group is written with only
+            # its own columns, so no operation rewrites a field it did not set.
+            updates_by_fields = {}
+            for item in valid:
+                data = item.get("data") or {}
+                if item["op"] == "create":
+                    creates.append((item, Task(
+                        project=project,
+                        title=data["title"],
+                        description=data.get("description", ""),
+                        status=data.get("status", Task.Status.TODO),
+                        priority=data.get("priority", Task.Priority.MEDIUM),
+                        due_date=data.get("due_date"),
+                        assigned_to_id=data.get("assigned_to"),
+                        created_by=user,
+                    )))
+                elif item["op"] == "update":
+                    task = tasks_by_id[item["id"]]
+                    old_status = task.status
+                    fields = []
+                    for key in TASK_UPDATE_FIELDS:
+                        if key not in data:
+                            continue
+                        if key == "assigned_to":
+                            task.assigned_to_id = data[key]
+                            fields.append("assigned_to_id")
+                        else:
+                            setattr(task, key, data[key])
+                            fields.append(key)
+                    if fields:  # like update_task, an update that sets nothing writes nothing
+                        task.updated_at = now
+                        updates_by_fields.setdefault(tuple(fields) + ("updated_at",), []).append(task)
+                    updates.append((item, task, old_status))
+                else:
+                    deletes.append((item, tasks_by_id[item["id"]]))
+
+            created_tasks = [task for _, task in creates]
+            Task.objects.bulk_create(created_tasks)
+            if created_tasks and not connection.features.can_return_rows_from_bulk_insert:
+                TaskService._read_back_created_ids(project, user, created_tasks)
+            for fields, tasks in updates_by_fields.items():
+                Task.objects.bulk_update(tasks, fields)
+            stats_exact = True
+            if deletes:
+                deleted_ids = [task.pk for _, task in deletes]
+                _, deleted_per_model = Task.objects.filter(pk__in=deleted_ids).delete()
+                # Always all of them where rows are locked; otherwise a concurrent delete got
+                # to some first, so the counters are recounted instead of adjusted.
+                stats_exact = deleted_per_model.get(Task._meta.label, 0) == len(deleted_ids)
+                TaskSyncService.record_deleted(project.pk, deleted_ids)
+
+            if stats_exact:
+                TaskStatsService.record_bulk(
+                    project.pk,
+                    created=created_tasks,
+                    updated=[(task, old_status) for _, task, old_status in updates],
+                    deleted=[task for _, task in deletes],
+                )
+            else:
+                TaskStatsService.rebuild(project_ids=[project.pk])
+            if valid:
+                ProjectService.bump_project_version(project.pk)
+                # One event per batch; subscribers fetch the rows via the changes endpoint.
+                ProjectService.publish_event(
+                    project.pk,
+                    "task.bulk",
+                    created=[task.pk for task in created_tasks],
+                    updated=[task.pk for _, task, _ in updates],
+                    deleted=[task.pk for _, task in deletes],
+                )
+
+        for item, task in creates:
+            results[item["index"]] = {"index": item["index"], "op": "create", "success": True, "id": task.pk, "task": task}
+        for item, task, _ in updates:
+            results[item["index"]] = {"index": item["index"], "op": "update", "success": True, "id": task.pk, "task": task}
+        for item, task in deletes:
+            results[item["index"]] = {"index": item["index"], "op": "delete", "success": True, "id": item["id"]}
+        return results
@@ -0,0 +1,156 @@
+"""
+TeamTrack – Task stats service.
+Maintains ProjectTaskStats counters on task writes and rebuilds them from tasks on demand.
+Callers must invoke the record_* methods inside the transaction that performs the task write.
+Only date-independent counters are stored: a stored overdue count would go stale (and its
+decrements underflow) once the date rolls over, so overdue_counts derives it when read.
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q
+from django.utils import timezone
+
+from apps.tasks.models import Task, ProjectTaskStats
+
+STATUS_COUNTER_FIELDS = {
+    Task.Status.TODO: "todo",
+    Task.Status.IN_PROGRESS: "in_progress",
+    Task.Status.DONE: "done",
+}
+COUNTER_FIELDS = ("total", "todo", "in_progress", "done")
+
+
+class TaskStatsService:
+    """Per-project task counters (write-maintained, rebuildable)."""
+
+    @staticmethod
+    def _contribution(status) -> dict:
+        """Counter contribution of a single task with the given status."""
+        return {"total": 1, STATUS_COUNTER_FIELDS[status]: 1}
+
+    @staticmethod
+    def _apply_delta(project_id: int, delta: dict) -> None:
+        """Add delta to the project's counters; rebuild the row if it does not exist yet."""
+        delta = {key: value for key, value in delta.items() if value}
+        if not delta:
+            return
+        updated = ProjectTaskStats.objects.filter(project_id=project_id).update(
+            **{key: F(key) + value for key, value in delta.items()},
+            updated_at=timezone.now(),
+        )
+        if not updated:
+            # No row yet: count from tasks, which already include the current write.
+            TaskStatsService.rebuild(project_ids=[project_id])
+
+    @staticmethod
+    def record_created(task: Task) -> None:
+        TaskStatsService._apply_delta(task.project_id, TaskStatsService._contribution(task.status))
+
+    @staticmethod
+    def record_updated(task: Task, old_status) -> None:
+        delta = TaskStatsService._contribution(task.status)
+        for key, value in TaskStatsService._contribution(old_status).items():
+            delta[key] = delta.get(key, 0) - value
+        TaskStatsService._apply_delta(task.project_id, delta)
+
+    @staticmethod
+    def record_deleted(task: Task) -> None:
+        contribution = TaskStatsService._contribution(task.status)
+        TaskStatsService._apply_delta(task.project_id, {key: -value for key, value in contribution.items()})
+
+    @staticmethod
+    def record_bulk(project_id: int, created=(), updated=(), deleted=()) -> None:
+        """
+        Apply a batch of writes as one counter update.
+        updated is a sequence of (task, old_status).
+        """
+        delta = {}
+
+        def add(contribution, sign):
+            for key, value in contribution.items():
+                delta[key] = delta.get(key, 0) + sign * value
+
+        for task in created:
+            add(TaskStatsService._contribution(task.status), 1)
+        for task, old_status in updated:
+            add(TaskStatsService._contribution(task.status), 1)
+            add(TaskStatsService._contribution(old_status), -1)
+        for task in deleted:
+            add(TaskStatsService._contribution(task.status), -1)
+        TaskStatsService._apply_delta(project_id, delta)
+
+    @staticmethod
+    def overdue_counts(project_ids) -> dict:
+        """
+        Open tasks past their due date, counted from the tasks table as of today.
+        Returns {project_id: count} (projects without overdue tasks are omitted).
+        """
+        return {row["project_id"]: row["overdue"] for row in TaskStatsService._overdue_rows(project_ids)}
+
+    @staticmethod
+    async def aoverdue_counts(project_ids) -> dict:
+        """Async overdue_counts."""
+        return {row["project_id"]: row["overdue"] async for row in TaskStatsService._overdue_rows(project_ids)}
+
+    @staticmethod
+    def _overdue_rows(project_ids):
+        return (
+            Task.objects.filter(project_id__in=project_ids, due_date__lt=timezone.localdate())
+            .exclude(status=Task.Status.DONE)
+            .values("project_id")
+            .annotate(overdue=Count("id"))
+            .order_by()
+        )
+
+    @staticmethod
+    def compute(project_ids=None) -> dict:
+        """Count tasks per project from the tasks table. Returns {project_id: {counter: value}}."""
+        qs = Task.objects.all()
+        if project_ids is not None:
+            qs = qs.filter(project_id__in=project_ids)
+        rows = (
+            qs.values("project_id")
+            .annotate(
+                total=Count("id"),
+                todo=Count("id", filter=Q(status=Task.Status.TODO)),
+                in_progress=Count("id", filter=Q(status=Task.Status.IN_PROGRESS)),
+                done=Count("id", filter=Q(status=Task.Status.DONE)),
+            )
+            .order_by()
+        )
+        return {row.pop("project_id"): row for row in rows}
+
+    @staticmethod
+    def rebuild(project_ids=None) -> int:
+        """
+        Reconcile stored counters with the tasks table (all projects if project_ids is None).
+        The version of each project whose row was missing or drifted is bumped (cached dashboard
+        summaries and ETags showed the wrong counts). Returns the number of such rows.
+        """
+        from apps.projects.models import Project
+        from apps.projects.services import ProjectService
+
+        projects = Project.objects.all()
+        if project_ids is not None:
+            projects = projects.filter(pk__in=project_ids)
+        actual = TaskStatsService.compute(project_ids)
+        stored = {
+            row["project_id"]: row
+            for row in ProjectTaskStats.objects.filter(project_id__in=projects.values("pk")).values(
+                "project_id", *COUNTER_FIELDS
+            )
+        }
+        fixed = 0
+        for project_id in projects.values_list("pk", flat=True).iterator():
+            counts = actual.get(project_id) or dict.fromkeys(COUNTER_FIELDS, 0)
+            current = stored.get(project_id)
+            if current is not None and all(current[key] == counts[key] for key in COUNTER_FIELDS):
+                continue
+            fixed += 1
+            try:
+                with transaction.atomic():
+                    ProjectTaskStats.objects.update_or_create(project_id=project_id, defaults=counts)
+            except IntegrityError:
+                # A concurrent writer created the row first; overwrite with the counted values.
+                ProjectTaskStats.objects.filter(project_id=project_id).update(**counts, updated_at=timezone.now())
+            ProjectService.bump_project_version(project_id)
+        return fixed
@@ -0,0 +1,158 @@
+"""
+TeamTrack – Task sync service.
+Incremental reads for GET /api/v1/projects/<id>/tasks/changes/?since=<token>: tasks created or
+updated after the token (keyset over updated_at, id) plus tombstones from the TaskDeletion log
+(keyset over deleted_at, id), so clients refresh with O(changes) work.
+Delivery is at-least-once: a token never moves past now - TASK_SYNC_SAFETY_WINDOW_SECONDS,
+so rows written by transactions that commit late are not skipped; clients apply results as upserts.
+"""
+import base64
+import datetime
+import itertools
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.exceptions import ValidationError
+
+from apps.projects.models import Project
+from apps.tasks.models import Task, TaskDeletion
+
+DELETION_BATCH_SIZE = 1000
+
+
+class TaskSyncService:
+    """Changes-since-token reads and deletion log maintenance."""
+
+    @staticmethod
+    def encode_token(task_position, deletion_position, issued_at) -> str:
+        def encode(position):
+            return [position[0].isoformat(), position[1]] if position else None
+
+        raw = json.dumps(
+            {"t": encode(task_position), "d": encode(deletion_position), "i": issued_at.isoformat()},
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_token(token: str) -> dict:
+        """Return {"t": (updated_at, id) | None, "d": (deleted_at, id) | None, "i": issued_at}."""
+        def decode(position):
+            if position is None:
+                return None
+            moment, row_id = position
+            moment = parse_datetime(moment)
+            if moment is None or not isinstance(row_id, int):
+                raise ValueError("position")
+            return (moment, row_id)
+
+        try:
+            raw = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+            issued_at = parse_datetime(raw["i"])
+            if issued_at is None:
+                raise ValueError("issued_at")
+            return {"t": decode(raw["t"]), "d": decode(raw["d"]), "i": issued_at}
+        except (ValueError, TypeError, KeyError):
+            raise ValidationError(message="Invalid sync token.", code="invalid_sync_token")
+
+    @staticmethod
+    def _after(prefix: str, position) -> Q:
+        """Rows strictly after position in (prefix, id) ascending order."""
+        moment, row_id = position
+        return Q(**{f"{prefix}__gt": moment}) | Q(**{prefix: moment, "id__gt": row_id})
+
+    @staticmethod
+    def _next_position(since, rows, prefix: str, has_more: bool, cutoff):
+        """
+        Position for the next token: the last row returned while more are pending; once drained,
+        the last row at or before the safety cutoff (newer rows are re-sent by the next poll).
+        """
+        if has_more:
+            return (rows[-1][prefix], rows[-1]["id"])
+        held = [(row[prefix], row["id"]) for row in rows if row[prefix] <= cutoff]
+        return held[-1] if held else since
+
+    @staticmethod
+    def list_changes(project: Project, token: str = None, limit: int = 100, values=None) -> dict:
+        """
+        Tasks changed and tasks deleted after token (from the beginning when token is empty:
+        every task, no tombstones). values(queryset) turns the task queryset into rows
+        (default: plain values()); rows must include updated_at and id.
+        Returns {"tasks": [...], "deleted": [{"id", "deleted_at"}], "token": str, "has_more": bool}.
+        """
+        now = timezone.now()
+        cutoff = now - datetime.timedelta(seconds=settings.TASK_SYNC_SAFETY_WINDOW_SECONDS)
+        if token:
+            state = TaskSyncService.decode_token(token)
+            if state["i"] < now - datetime.timedelta(days=settings.TASK_SYNC_RETENTION_DAYS):
+                raise ValidationError(
+                    message="Sync token expired; reload the task list and start a new sync.",
+                    code="sync_token_expired",
+                )
+            task_since, deletion_since = state["t"], state["d"]
+        else:
+            # A fresh sync starts from the full task list, so no tombstone applies to it; the
+            # token's deletion log starts at the safety cutoff, so the next poll also gets
+            # deletions that commit late (those may name tasks the client never saw; harmless).
+            task_since, deletion_since = None, (cutoff, 0)
+
+        tasks = Task.objects.filter(project=project)
+        if task_since is not None:
+            tasks = tasks.filter(TaskSyncService._after("updated_at", task_since))
+        tasks = tasks.order_by("updated_at", "id")
+        rows = values(tasks) if values is not None else tasks.values()
+        task_rows = list(rows[: limit + 1])
+        tasks_more = len(task_rows) > limit
+        task_rows = task_rows[:limit]
+
+        deletion_rows, deletions_more = [], False
+        if token:
+            deletions = (
+                TaskDeletion.objects.filter(project_id=project.pk)
+                .filter(TaskSyncService._after("deleted_at", deletion_since))
+                .order_by("deleted_at", "id")
+                .values("id", "task_id", "deleted_at")
+            )
+            deletion_rows = list(deletions[: limit + 1])
+            deletions_more = len(deletion_rows) > limit
+            deletion_rows = deletion_rows[:limit]
+
+        next_token = TaskSyncService.encode_token(
+            TaskSyncService._next_position(task_since, task_rows, "updated_at", tasks_more, cutoff),
+            TaskSyncService._next_position(deletion_since, deletion_rows, "deleted_at", deletions_more, cutoff),
+            now,
+        )
+        return {
+            "tasks": task_rows,
+            "deleted": [{"id": row["task_id"], "deleted_at": row["deleted_at"]} for row in deletion_rows],
+            "token": next_token,
+            "has_more": tasks_more or deletions_more,
+        }
+
+    @staticmethod
+    def record_deleted(project_id: int, task_ids) -> None:
+        """
+        Write tombstones for deleted tasks (call inside the deleting transaction).
+        task_ids may be any iterable, e.g. a values_list iterator over a whole project.
+        """
+        now = timezone.now()
+        task_ids = iter(task_ids)
+        while True:
+            batch = list(itertools.islice(task_ids, DELETION_BATCH_SIZE))
+            if not batch:
+                break
+            TaskDeletion.objects.bulk_create(
+                [TaskDeletion(task_id=task_id, project_id=project_id, deleted_at=now) for task_id in batch]
+            )
+
+    @staticmethod
+    def prune(before=None) -> int:
+        """Delete tombstones older than before (default: the retention period). Returns the count."""
+        if before is None:
+            before = timezone.now() - datetime.timedelta(days=settings.TASK_SYNC_RETENTION_DAYS)
+        deleted, _ = TaskDeletion.objects.filter(deleted_at__lt=before).delete()
+        return deleted
@@ -0,0 +1,19 @@
+"""
+TeamTrack – Task signal receivers.
+Deleting a user cascades to the tasks they created and unassigns the tasks assigned to them in
+the database, outside TaskService; this receiver does the service's bookkeeping for those rows
+(TaskService.record_user_deletion) in the deleting transaction.
+"""
+from django.db.models.signals import pre_delete
+
+from apps.users.models import User
+
+
+def user_deleting(sender, instance, **kwargs):
+    from apps.tasks.services import TaskService
+
+    TaskService.record_user_deletion(instance.pk)
+
+
+def connect() -> None:
+    pre_delete.connect(user_deleting, sender=User, dispatch_uid="tasks.user_deleting")
@@ -0,0 +1,57 @@
+"""
+TeamTrack – Task service tests.
+"""
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from apps.users.models import User
+from apps.projects.services import ProjectService
+from apps.tasks.services import TaskService
+from apps.tasks.services.task_search import get_task_search_backend
+
+
+class TaskSearchTests(TestCase):
+    """TaskService.list_tasks(search=...) with the configured (index) backend."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        cls.project = ProjectService.create_project(cls.user, {"name": "Project"})
+        cls.deploy = TaskService.create_task(cls.project, cls.user, {"title": "Deploy the release"})
+        cls.deploy_docs = TaskService.create_task(
+            cls.project, cls.user, {"title": "Write deploy docs", "description": "How to deploy and roll back a deploy"}
+        )
+        cls.login = TaskService.create_task(cls.project, cls.user, {"title": "Fix login", "description": "Timeout"})
+
+    def search(self, term, rank=False) -> list:
+        return list(TaskService.list_tasks(self.project, search=term, order_by_relevance=rank).values_list("pk", flat=True))
+
+    def test_words_and_prefixes(self):
+        self.assertCountEqual(self.search("deploy"), [self.deploy.pk, self.deploy_docs.pk])
+        self.assertCountEqual(self.search("deplo"), [self.deploy.pk, self.deploy_docs.pk])
+        self.assertEqual(self.search("login timeout"), [self.login.pk])
+        self.assertEqual(self.search("deploy timeout"), [])
+
+    def test_relevance_order(self):
+        if not get_task_search_backend().supports_ranking:
+            self.skipTest(f"{connection.vendor} search backend does not rank")
+        self.assertEqual(self.search("deploy", rank=True), [self.deploy_docs.pk, self.deploy.pk])
+
+    def test_substrings_inside_words(self):
+        self.assertCountEqual(self.search("ploy"), [self.deploy.pk, self.deploy_docs.pk])
+        self.assertEqual(self.search("ogi"), [self.login.pk])
+
+    def test_substring_fallback_ignores_other_projects(self):
+        other = ProjectService.create_project(self.user, {"name": "Other"})
+        ploy = TaskService.create_task(other, self.user, {"title": "Ployment checklist"})
+        self.assertCountEqual(self.search("ploy"), [self.deploy.pk, self.deploy_docs.pk])
+        self.assertCountEqual(self.search("ploy", rank=True), [self.deploy.pk, self.deploy_docs.pk])
+        self.assertEqual(
+            list(TaskService.list_tasks(other, search="ploy").values_list("pk", flat=True)), [ploy.pk]
+        )
+
+    @override_settings(TASK_SEARCH_SUBSTRING_FALLBACK=False)
+    def test_substring_fallback_disabled(self):
+        if get_task_search_backend().name == "like":
+            self.skipTest("LIKE search always matches substrings")
+        self.assertEqual(self.search("ploy"), [])
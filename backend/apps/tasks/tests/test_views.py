@@ -0,0 +1,554 @@
+"""
+TeamTrack – Task view tests.
+"""
+import asyncio
+import datetime
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.db import connection
+from django.test import Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken
+
+from core.pubsub import get_broker
+from core.testing import assert_async_view_matches, assert_within_query_budget
+
+from apps.users.models import User
+from apps.projects.services import ProjectService
+from apps.tasks.models import ProjectTaskStats, Task, TaskDeletion
+from apps.tasks.serializers import TaskListSerializer, TaskListValuesSerializer
+from apps.tasks.services import TaskService, TaskStatsService
+from apps.tasks.services.task_search import get_task_search_backend
+from apps.tasks.views.task_views import TaskListView
+
+
+class TaskViewTestCase(TestCase):
+    """A project owned by an authenticated team member."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="owner", email="owner@example.com", password="pass12345")
+        cls.project = ProjectService.create_project(cls.user, {"name": "Project"})
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+        self.tasks_url = f"/api/v1/projects/{self.project.pk}/tasks/"
+
+    def create_task(self, **data) -> int:
+        response = self.client.post(self.tasks_url, {"title": "Task", **data}, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]["id"]
+
+    def assertStatsMatchTasks(self):
+        stored = ProjectTaskStats.objects.filter(project=self.project).values("total", "todo", "in_progress", "done").get()
+        counted = TaskStatsService.compute([self.project.pk]).get(self.project.pk) or dict.fromkeys(stored, 0)
+        self.assertEqual(stored, counted)
+
+
+class TaskStatsDateRolloverTests(TaskViewTestCase):
+    """Writes to tasks that became overdue after they were created (stats regression)."""
+
+    def setUp(self):
+        super().setUp()
+        tomorrow = timezone.localdate() + datetime.timedelta(days=1)
+        self.task_ids = [self.create_task(due_date=tomorrow.isoformat()) for _ in range(3)]
+        later = mock.patch("django.utils.timezone.localdate", return_value=tomorrow + datetime.timedelta(days=2))
+        later.start()
+        self.addCleanup(later.stop)
+
+    def test_complete_and_delete_overdue_tasks(self):
+        response = self.client.patch(f"{self.tasks_url}{self.task_ids[0]}/", {"status": Task.Status.DONE}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        response = self.client.delete(f"{self.tasks_url}{self.task_ids[1]}/")
+        self.assertEqual(response.status_code, 204, response.content)
+        response = self.client.post(
+            f"{self.tasks_url}bulk/", {"operations": [{"op": "delete", "id": self.task_ids[2]}]}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertStatsMatchTasks()
+        self.assertEqual(TaskStatsService.overdue_counts([self.project.pk]), {})
+
+    def test_overdue_counts_use_the_current_date(self):
+        self.assertEqual(TaskStatsService.overdue_counts([self.project.pk]), {self.project.pk: 3})
+
+
+class TaskQueryBudgetTests(TaskViewTestCase):
+    """Task endpoints in a freshly created project (no task written to it yet) stay within budget."""
+
+    def test_first_writes_in_a_new_project(self):
+        response = self.client.post("/api/v1/projects/", {"name": "New project"}, format="json")
+        self.assertEqual(response.status_code, 201, response.content)
+        assert_within_query_budget(response)
+        self.tasks_url = f"/api/v1/projects/{response.json()['data']['id']}/tasks/"
+
+        task_id = self.create_task()
+        response = self.client.get(self.tasks_url)
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        response = self.client.patch(f"{self.tasks_url}{task_id}/", {"status": Task.Status.DONE}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        response = self.client.delete(f"{self.tasks_url}{task_id}/")
+        self.assertEqual(response.status_code, 204, response.content)
+        assert_within_query_budget(response)
+
+
+class TaskSearchViewTests(TaskViewTestCase):
+    def test_search_within_query_budget(self):
+        deploy = self.create_task(title="Deploy the release")
+        self.create_task(title="Fix login")
+        for term in ("deploy", "ploy"):
+            response = self.client.get(self.tasks_url, {"search": term, "ordering": "relevance"})
+            self.assertEqual(response.status_code, 200, response.content)
+            assert_within_query_budget(response)
+            self.assertEqual([row["id"] for row in response.json()["data"]["results"]], [deploy])
+
+
+class TaskBulkViewTests(TaskViewTestCase):
+    def bulk(self, *operations):
+        response = self.client.post(f"{self.tasks_url}bulk/", {"operations": list(operations)}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]
+
+    def test_updates_write_only_the_fields_they_set(self):
+        first, second = self.create_task(title="First"), self.create_task(title="Second")
+        with CaptureQueriesContext(connection) as queries:
+            self.bulk(
+                {"op": "update", "id": first, "data": {"title": "First, renamed"}},
+                {"op": "update", "id": second, "data": {"status": Task.Status.DONE}},
+            )
+        updates = [query["sql"] for query in queries if query["sql"].startswith('UPDATE "tasks_task"')]
+        self.assertEqual(len(updates), 2)
+        self.assertEqual(sum('"status"' in sql for sql in updates), 1)
+        self.assertEqual(sum('"title"' in sql for sql in updates), 1)
+        self.assertEqual(Task.objects.get(pk=first).title, "First, renamed")
+        self.assertEqual(Task.objects.get(pk=second).status, Task.Status.DONE)
+        self.assertStatsMatchTasks()
+
+    def test_delete_records_stats_and_tombstones(self):
+        kept, deleted = self.create_task(), self.create_task(status=Task.Status.DONE)
+        data = self.bulk({"op": "delete", "id": deleted})
+        self.assertEqual(data["deleted"], 1)
+        self.assertEqual(list(Task.objects.values_list("pk", flat=True)), [kept])
+        self.assertEqual(list(TaskDeletion.objects.values_list("task_id", flat=True)), [deleted])
+        self.assertStatsMatchTasks()
+
+    def test_creates_without_insert_returning(self):
+        # As on MySQL: one bulk INSERT, then the new ids are read back in a single query.
+        operations = [{"op": "create", "data": {"title": title}} for title in ("Same", "Same", "Other")]
+        with mock.patch.object(type(connection.features), "can_return_rows_from_bulk_insert", False):
+            with CaptureQueriesContext(connection) as queries:
+                data = self.bulk(*operations)
+        self.assertEqual(sum(query["sql"].startswith('INSERT INTO "tasks_task"') for query in queries), 1)
+        self.assertEqual(data["created"], 3)
+        ids = [result["id"] for result in data["results"]]
+        self.assertEqual(sorted(ids), sorted(Task.objects.values_list("pk", flat=True)))
+        self.assertEqual([result["data"]["title"] for result in data["results"]], ["Same", "Same", "Other"])
+        self.assertStatsMatchTasks()
+
+    def test_task_deleted_before_read_back_is_reported_missing(self):
+        task_id = self.create_task()
+        with mock.patch("apps.tasks.views.task_views.TaskService.list_tasks", return_value=Task.objects.none()):
+            data = self.bulk({"op": "update", "id": task_id, "data": {"title": "Renamed"}})
+        self.assertEqual(data["updated"], 1)
+        self.assertIsNone(data["results"][0]["data"])
+        self.assertEqual(data["results"][0]["code"], "not_found")
+
+    def test_stats_recounted_when_rows_were_already_deleted(self):
+        task_id = self.create_task()
+        # A concurrent delete got there first (possible where SELECT ... FOR UPDATE locks nothing).
+        with mock.patch("django.db.models.query.QuerySet.delete", return_value=(0, {})):
+            self.bulk({"op": "delete", "id": task_id})
+        self.assertStatsMatchTasks()
+
+
+class TaskAssigneeMembershipTests(TaskViewTestCase):
+    """Updates naming an assignee who is no longer a project member are refused, even if unchanged."""
+
+    def setUp(self):
+        super().setUp()
+        member = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+        ProjectService.add_member(self.project, member.pk, "MEMBER", self.user)
+        self.member_id = member.pk
+        self.task_id = self.create_task(assigned_to=member.pk)
+        ProjectService.remove_member(self.project, member.pk, self.user)
+
+    def test_update(self):
+        url = f"{self.tasks_url}{self.task_id}/"
+        response = self.client.patch(url, {"title": "Renamed", "assigned_to": self.member_id}, format="json")
+        self.assertEqual(response.status_code, 403, response.content)
+        self.assertEqual(response.json()["code"], "assignee_not_member")
+        response = self.client.patch(url, {"title": "Renamed"}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        self.assertEqual(response.json()["data"]["assigned_to"], self.member_id)
+
+    def test_bulk_update(self):
+        response = self.client.post(f"{self.tasks_url}bulk/", {"operations": [
+            {"op": "update", "id": self.task_id, "data": {"title": "Renamed", "assigned_to": self.member_id}},
+        ]}, format="json")
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertEqual(response.json()["errors"]["results"][0]["code"], "assignee_not_member")
+        self.assertEqual(Task.objects.get(pk=self.task_id).title, "Task")
+
+
+class TaskListFieldsetTests(TaskViewTestCase):
+    """?fields= / ?exclude= on the task list: selected keys, narrowed SQL, 400 for bad selections."""
+
+    def get_rows(self, **params) -> tuple:
+        """The rows and the SQL of the page query."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.tasks_url, params)
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        [page_sql] = [query["sql"] for query in queries if 'FROM "tasks_task"' in query["sql"] and "COUNT(" not in query["sql"]]
+        return response.json()["data"]["results"], page_sql
+
+    def test_fields_and_exclude(self):
+        self.create_task(description="Long text")
+        for params in ({}, {"cursor": ""}):
+            rows, sql = self.get_rows(fields="title,id", **params)
+            self.assertEqual(list(rows[0]), ["id", "title"])
+            self.assertNotIn('"description"', sql)
+            self.assertNotIn('"users_user"', sql)
+
+        rows, sql = self.get_rows(fields="assigned_to_email,created_by_email")
+        self.assertEqual(rows[0], {"assigned_to_email": None, "created_by_email": self.user.email})
+        rows, sql = self.get_rows(exclude="description")
+        self.assertNotIn("description", rows[0])
+        self.assertEqual(len(rows[0]), len(TaskListSerializer.Meta.fields) - 1)
+        self.assertNotIn('"description"', sql)
+
+    def test_invalid_selections(self):
+        for params in ({"fields": "id,secret"}, {"exclude": "nope"}, {"fields": "id", "exclude": "title"}, {"fields": ","}):
+            response = self.client.get(self.tasks_url, params)
+            self.assertEqual(response.status_code, 400, params)
+            self.assertEqual(response.json()["code"], "invalid_fieldset")
+        response = self.client.get(self.tasks_url, {"fields": "id,secret"})
+        self.assertEqual(response.json()["errors"]["fields"], ["Unknown field: secret."])
+
+
+class TaskListCursorTests(TaskViewTestCase):
+    def get_page(self, **params) -> dict:
+        response = self.client.get(self.tasks_url, {"page_size": 3, **params})
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]
+
+    def test_walk_to_the_end(self):
+        for index in range(8):
+            self.create_task(title=f"Task {index}")
+        # Ties on updated_at are broken by id.
+        Task.objects.filter(pk__in=Task.objects.order_by("id").values("pk")[2:6]).update(updated_at=timezone.now())
+        expected = list(Task.objects.order_by("-updated_at", "-id").values_list("id", flat=True))
+
+        seen, cursor, pages = [], "", 0
+        while cursor is not None:
+            data = self.get_page(cursor=cursor, include_count="true")
+            self.assertEqual(data["pagination"]["count"], 8)
+            seen += [row["id"] for row in data["results"]]
+            cursor, pages = data["pagination"]["next_cursor"], pages + 1
+        self.assertEqual(seen, expected)
+        self.assertEqual(pages, 3)
+
+    def test_invalid_cursor(self):
+        response = self.client.get(self.tasks_url, {"cursor": "not-a-cursor"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["code"], "invalid_cursor")
+
+    def test_relevance_ordering_is_rejected(self):
+        self.create_task(title="Deploy the release")
+        response = self.client.get(self.tasks_url, {"search": "deploy", "ordering": "relevance", "cursor": ""})
+        if get_task_search_backend().supports_ranking:
+            self.assertEqual(response.status_code, 400, response.content)
+            self.assertEqual(response.json()["code"], "invalid_cursor_ordering")
+        else:
+            self.assertEqual(response.status_code, 200, response.content)
+        response = self.client.get(self.tasks_url, {"search": "deploy", "ordering": "relevance"})
+        self.assertEqual(response.status_code, 200, response.content)
+
+
+class TaskListAsyncViewTests(TaskViewTestCase):
+    """TaskListView.aget answers like TaskListView.get."""
+
+    def assertAsyncMatches(self, params: dict = None, headers: dict = None):
+        return assert_async_view_matches(
+            TaskListView, self.user, self.tasks_url, params, headers=headers, pk=self.project.pk
+        )
+
+    def test_same_responses(self):
+        for index in range(5):
+            self.create_task(title=f"Deploy {index}", priority=Task.Priority.HIGH if index % 2 else Task.Priority.LOW)
+        first = self.assertAsyncMatches({"page_size": 2, "cursor": ""}).data["data"]["pagination"]["next_cursor"]
+        for params in (
+            None,
+            {"page_size": 2, "page": 2},
+            {"page_size": 2, "page": 9},  # 404
+            {"page_size": 2, "cursor": first, "include_count": "true"},
+            {"cursor": "not-a-cursor"},  # 400
+            {"fields": "id,title", "priority": Task.Priority.HIGH},
+            {"fields": "id,secret"},  # 400
+            {"search": "deploy", "page_size": 3},
+        ):
+            self.assertAsyncMatches(params)
+
+    def test_same_not_modified_response(self):
+        self.create_task()
+        etag = self.assertAsyncMatches()["ETag"]
+        self.assertEqual(self.assertAsyncMatches(headers={"If-None-Match": etag}).status_code, 304)
+
+
+class TaskListValuesSerializerTests(TaskViewTestCase):
+    """The values() read path renders the same bytes as TaskListSerializer."""
+
+    def test_same_output_as_the_model_serializer(self):
+        member = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+        ProjectService.add_member(self.project, member.pk, "MEMBER", self.user)
+        self.create_task(title="Plain")
+        self.create_task(
+            title="Full – ünïcode", description="Line\nbreak", status=Task.Status.DONE, priority=Task.Priority.HIGH,
+            due_date="2026-02-28", assigned_to=member.pk,
+        )
+        queryset = TaskService.list_tasks(self.project)
+        for fields in (None, ["id", "title"], ["assigned_to_email", "due_date", "updated_at"]):
+            rows = TaskListValuesSerializer.get_queryset(queryset, fields=fields)
+            expected = JSONRenderer().render(TaskListSerializer(queryset, many=True, fields=fields).data)
+            self.assertEqual(JSONRenderer().render(TaskListValuesSerializer(rows, many=True, fields=fields).data), expected)
+
+
+class TaskWritesOutsideServiceTests(TaskViewTestCase):
+    """Django admin writes and user-deletion cascades keep counters, tombstones and versions."""
+
+    def setUp(self):
+        super().setUp()
+        admin = User.objects.create_superuser(username="root", email="root@example.com", password="pass12345")
+        self.admin = Client()
+        self.admin.force_login(admin)
+
+    def version(self, project) -> int:
+        return ProjectService.get_project_versions([project.pk]).get(project.pk, 0)
+
+    def change(self, task_id: int, **data):
+        task = Task.objects.get(pk=task_id)
+        form = {
+            "title": task.title, "description": task.description, "project": task.project_id,
+            "status": task.status, "priority": task.priority, "assigned_to": "", "due_date": "",
+            "created_by": task.created_by_id, **data,
+        }
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.admin.post(f"/admin/tasks/task/{task_id}/change/", form)
+        self.assertEqual(response.status_code, 302, response.content)
+
+    def test_admin_change_and_move(self):
+        task_id = self.create_task()
+        version = self.version(self.project)
+        self.change(task_id, status=Task.Status.DONE)
+        self.assertStatsMatchTasks()
+        self.assertNotEqual(self.version(self.project), version)
+
+        other = ProjectService.create_project(self.user, {"name": "Other"})
+        self.change(task_id, project=other.pk)
+        self.assertStatsMatchTasks()
+        self.assertEqual(ProjectTaskStats.objects.get(project=other).done, 1)
+        self.assertEqual(list(TaskDeletion.objects.filter(project_id=self.project.pk).values_list("task_id", flat=True)), [task_id])
+
+    def test_admin_bulk_delete(self):
+        task_ids = [self.create_task(), self.create_task(status=Task.Status.DONE)]
+        version = self.version(self.project)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.admin.post(
+                "/admin/tasks/task/", {"action": "delete_selected", "_selected_action": task_ids, "post": "yes"}
+            )
+        self.assertEqual(response.status_code, 302, response.content)
+        self.assertFalse(Task.objects.exists())
+        self.assertStatsMatchTasks()
+        self.assertEqual(sorted(TaskDeletion.objects.values_list("task_id", flat=True)), sorted(task_ids))
+        self.assertNotEqual(self.version(self.project), version)
+
+    def test_deleting_a_user_records_their_cascaded_tasks(self):
+        member = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+        ProjectService.add_member(self.project, member.pk, "MEMBER", self.user)
+        created = TaskService.create_task(self.project, member, {"title": "By member"})
+        assigned = TaskService.create_task(self.project, self.user, {"title": "For member", "assigned_to": member.pk})
+        version = self.version(self.project)
+        with self.captureOnCommitCallbacks(execute=True):
+            member.delete()
+        self.assertStatsMatchTasks()
+        self.assertEqual(list(TaskDeletion.objects.values_list("task_id", flat=True)), [created.pk])
+        self.assertGreater(Task.objects.get(pk=assigned.pk).updated_at, assigned.updated_at)
+        self.assertNotEqual(self.version(self.project), version)
+
+    def test_rebuild_bumps_the_versions_of_fixed_projects(self):
+        self.create_task()
+        ProjectTaskStats.objects.filter(project=self.project).update(total=5)
+        version = self.version(self.project)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(TaskStatsService.rebuild(), 1)
+        self.assertStatsMatchTasks()
+        self.assertNotEqual(self.version(self.project), version)
+
+
+class TaskListConditionalGetTests(TaskViewTestCase):
+    def test_not_modified_skips_serialization(self):
+        task_id = self.create_task()
+        etag = self.client.get(self.tasks_url)["ETag"]
+        with mock.patch("apps.tasks.views.task_views.TaskListValuesSerializer") as serializer:
+            response = self.client.get(self.tasks_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response["ETag"], etag)
+        self.assertEqual(serializer.mock_calls, [])
+        assert_within_query_budget(response)
+
+        self.client.patch(f"{self.tasks_url}{task_id}/", {"title": "Renamed"}, format="json")
+        response = self.client.get(self.tasks_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response["ETag"], etag)
+
+
+    def test_assignee_email_change_and_deletion_change_the_etag(self):
+        assignee = User.objects.create_user(username="dev", email="dev@example.com", password="pass12345")
+        ProjectService.add_member(self.project, assignee.pk, "MEMBER", self.user)
+        self.create_task(assigned_to=assignee.pk)
+        response = self.client.get(self.tasks_url)
+        etag = response["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            assignee.email = "developer@example.com"
+            assignee.save()
+        response = self.client.get(self.tasks_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["results"][0]["assigned_to_email"], "developer@example.com")
+
+        etag = response["ETag"]
+        with self.captureOnCommitCallbacks(execute=True):
+            assignee.delete()
+        response = self.client.get(self.tasks_url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()["data"]["results"][0]["assigned_to"])
+
+    def test_invalid_fieldset_is_rejected_before_the_etag_check(self):
+        self.create_task()
+        response = self.client.get(self.tasks_url, {"fields": "id,nonexistent"}, HTTP_IF_NONE_MATCH="*")
+        self.assertEqual(response.status_code, 400, response.content)
+
+
+class TaskChangesViewTests(TaskViewTestCase):
+    def changes(self, **params):
+        response = self.client.get(f"{self.tasks_url}changes/", params)
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]
+
+    def test_initial_sync_returns_every_task_and_no_tombstones(self):
+        kept = [self.create_task(title=f"Task {index}") for index in range(3)]
+        self.client.delete(f"{self.tasks_url}{self.create_task()}/")
+
+        data = self.changes()
+        self.assertEqual(set(data), {"results", "deleted", "next_token", "has_more"})
+        self.assertCountEqual([row["id"] for row in data["results"]], kept)
+        self.assertEqual(data["deleted"], [])
+        self.assertFalse(data["has_more"])
+
+        deleted = kept.pop()
+        self.client.delete(f"{self.tasks_url}{deleted}/")
+        data = self.changes(since=data["next_token"])
+        self.assertIn(deleted, [row["id"] for row in data["deleted"]])
+
+    def test_initial_sync_pages(self):
+        created = [self.create_task(title=f"Task {index}") for index in range(3)]
+        first = self.changes(page_size=2)
+        self.assertEqual(len(first["results"]), 2)
+        self.assertTrue(first["has_more"])
+        rest = self.changes(since=first["next_token"], page_size=2)
+        self.assertEqual([row["id"] for row in first["results"] + rest["results"]], created)
+
+
+class TaskEventStreamTests(TaskViewTestCase):
+    def setUp(self):
+        super().setUp()
+        self.events_url = f"{self.tasks_url}events/"
+
+    def ticket(self, project_id=None) -> str:
+        response = self.client.post(f"/api/v1/projects/{project_id or self.project.pk}/tasks/events/ticket/")
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]["ticket"]
+
+    def test_not_served_over_wsgi(self):
+        response = self.client.get(self.events_url)
+        self.assertEqual(response.status_code, 501)
+        self.assertEqual(response.json()["code"], "asgi_required")
+
+    async def test_stream_opens_once_per_ticket(self):
+        ticket = await sync_to_async(self.ticket)()
+        response = await self.async_client.get(self.events_url, {"ticket": ticket})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        stream = response.streaming_content
+        self.assertTrue((await anext(stream)).startswith(b"retry: 5000"))
+        await stream.aclose()
+
+        response = await self.async_client.get(self.events_url, {"ticket": ticket})
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["code"], "ticket_used")
+
+    async def test_rejects_other_credentials(self):
+        other = await sync_to_async(ProjectService.create_project)(self.user, {"name": "Other"})
+        other_ticket = await sync_to_async(self.ticket)(other.pk)
+        access_token = str(await sync_to_async(AccessToken.for_user)(self.user))
+        for params, code in (
+            ({"ticket": other_ticket}, "ticket_invalid"),
+            ({"ticket": "forged"}, "ticket_invalid"),
+            ({"access_token": access_token}, "not_authenticated"),
+        ):
+            response = await self.async_client.get(self.events_url, params)
+            self.assertEqual(response.status_code, 401, params)
+            self.assertEqual(response.json()["code"], code)
+
+    async def open_stream(self):
+        ticket = await sync_to_async(self.ticket)()
+        response = await self.async_client.get(self.events_url, {"ticket": ticket})
+        self.assertEqual(response.status_code, 200)
+        stream = response.streaming_content
+        self.assertTrue((await anext(stream)).startswith(b"retry: 5000"))
+        return stream
+
+    @override_settings(TASK_EVENTS_HEARTBEAT_SECONDS=0.05)
+    async def test_heartbeat_rechecks_the_user(self):
+        stream = await self.open_stream()
+        try:
+            self.assertEqual(await asyncio.wait_for(anext(stream), 1), b": heartbeat\n\n")
+            await User.objects.filter(pk=self.user.pk).aupdate(is_active=False)
+            while (chunk := await asyncio.wait_for(anext(stream), 1)) == b": heartbeat\n\n":
+                pass
+            self.assertTrue(chunk.startswith(b"event: reconnect\n"))
+            with self.assertRaises(StopAsyncIteration):
+                await anext(stream)
+        finally:
+            await stream.aclose()
+
+    @override_settings(TASK_EVENTS_HEARTBEAT_SECONDS=60, TASK_EVENTS_QUEUE_SIZE=2)
+    async def test_overflow_sends_resync_at_once(self):
+        stream = await self.open_stream()
+        try:
+            read = asyncio.ensure_future(anext(stream))  # waiting for the next event
+            await asyncio.sleep(0.01)
+            for task_id in range(5):
+                get_broker().publish(ProjectService.events_channel(self.project.pk), {"type": "task.deleted", "id": task_id})
+            # Not after the heartbeat timeout: the waiting read is woken by the resync itself.
+            self.assertTrue((await asyncio.wait_for(read, 1)).startswith(b"event: resync\n"))
+        finally:
+            await stream.aclose()
+
+    @override_settings(TASK_EVENTS_TICKET_SECONDS=-1)
+    async def test_expired_ticket(self):
+        ticket = await sync_to_async(self.ticket)()
+        response = await self.async_client.get(self.events_url, {"ticket": ticket})
+        self.assertEqual(response.status_code, 401)
+        self.assertEqual(response.json()["code"], "ticket_expired")
@@ -4,9 +4,14 @@ Mounted at /api/v1/projects/<project_id>/tasks/
 """
 from django.urls import path
 
-from apps.tasks.views.task_views import TaskListView, TaskDetailView
+from apps.tasks.views.event_views import TaskEventTicketView, task_events_view
+from apps.tasks.views.task_views import TaskListView, TaskDetailView, TaskChangesView, TaskBulkView
 
 urlpatterns = [
     path("", TaskListView.as_view(), name="tasks-list"),
+    path("changes/", TaskChangesView.as_view(), name="tasks-changes"),
+    path("bulk/", TaskBulkView.as_view(), name="tasks-bulk"),
+    path("events/", task_events_view, name="tasks-events"),
+    path("events/ticket/", TaskEventTicketView.as_view(), name="tasks-events-ticket"),
     path("<int:task_pk>/", TaskDetailView.as_view(), name="tasks-detail"),
 ]
@@ -0,0 +1,158 @@
+"""
+TeamTrack – Task event stream (Server-Sent Events).
+GET /api/v1/projects/<project_id>/tasks/events/ keeps a connection open and pushes the project's
+task create / update / delete events (published by TaskService after commit, see core.pubsub).
+Plain async Django view rather than a DRF APIView: DRF cannot stream from an async iterator.
+Served only by an ASGI server (config/asgi.py): under WSGI the stream would tie up a worker
+thread for its whole lifetime, so the route answers 501 there.
+Browsers (EventSource cannot send headers) first POST .../tasks/events/ticket/ and open the
+stream with ?ticket=<ticket> (TaskEventService); other clients may send the Authorization header.
+"""
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from rest_framework import exceptions as drf_exceptions
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.views import APIView
+
+from core.exceptions import AuthenticationError, BaseAPIException
+from core.pubsub import get_broker
+from core.responses import success_response
+
+from apps.users.models import User
+from apps.projects.services import ProjectService
+from apps.projects.views.mixins import ProjectAccessMixin
+from apps.tasks.services import TaskEventService
+
+
+class TaskEventTicketView(ProjectAccessMixin, APIView):
+    """
+    POST /api/v1/projects/<project_id>/tasks/events/ticket/ – single-use ticket for opening the
+    project's event stream with ?ticket= (expires after TASK_EVENTS_TICKET_SECONDS).
+    """
+    permission_classes = [IsAuthenticated]
+    query_budget = 2
+
+    def post(self, request: Request, pk: int) -> Response:
+        project = self.get_project()
+        return success_response(data={
+            "ticket": TaskEventService.issue_ticket(request.user, project.pk),
+            "expires_in": settings.TASK_EVENTS_TICKET_SECONDS,
+        })
+
+
+def _authenticate(request, project_id: int):
+    """
+    The user of a ?ticket= (see TaskEventTicketView), else the configured DRF authentication
+    classes run against the plain Django request (Authorization header).
+    """
+    ticket = request.GET.get("ticket")
+    if ticket:
+        return TaskEventService.redeem_ticket(ticket, project_id)
+    for authentication_class in api_settings.DEFAULT_AUTHENTICATION_CLASSES:
+        result = authentication_class().authenticate(request)
+        if result is not None:
+            return result[0]
+    raise AuthenticationError(message="Authentication credentials were not provided.", code="not_authenticated")
+
+
+def _error_response(exc) -> JsonResponse:
+    """Same envelope as core.exception_handler for errors raised before the stream starts."""
+    if isinstance(exc, BaseAPIException):
+        body = {"success": False, "message": exc.message, "code": exc.code}
+        if exc.details is not None:
+            body["errors"] = exc.details
+        return JsonResponse(body, status=exc.status_code)
+    detail = exc.detail.get("detail", exc.detail) if isinstance(exc.detail, dict) else exc.detail
+    body = {"success": False, "message": str(detail), "code": getattr(exc, "default_code", "error")}
+    return JsonResponse(body, status=exc.status_code)
+
+
+def _format_event(event: dict) -> str:
+    return f"event: {event['type']}\ndata: {json.dumps(event, separators=(',', ':'))}\n\n"
+
+
+async def _has_access(project_id: int, user_id: int) -> bool:
+    """Whether the user is still active and can view the project (two queries)."""
+    user = await User.objects.filter(pk=user_id, is_active=True).afirst()
+    if user is None:
+        return False
+    try:
+        await ProjectService.aget_project_access(project_id, user)
+    except BaseAPIException:
+        return False
+    return True
+
+
+async def _event_stream(project_id: int, user_id: int):
+    broker = get_broker()
+    subscription = broker.subscribe(ProjectService.events_channel(project_id), max_queue=settings.TASK_EVENTS_QUEUE_SIZE)
+    deadline = time.monotonic() + settings.TASK_EVENTS_MAX_DURATION_SECONDS
+    try:
+        # Clients reconnect after 5 s; on reconnect they catch up through /tasks/changes/.
+        yield "retry: 5000\n: connected\n\n"
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                # Bounded lifetime: the client reconnects and is re-authenticated (token expiry).
+                yield _format_event({"type": "reconnect"})
+                return
+            event = await subscription.get(timeout=min(settings.TASK_EVENTS_HEARTBEAT_SECONDS, remaining))
+            if event is None:
+                # Deactivation and access changes made outside the project's events (e.g. a
+                # role change, Django admin) are caught here: the client reconnects and is refused.
+                if not await _has_access(project_id, user_id):
+                    yield _format_event({"type": "reconnect"})
+                    return
+                yield ": heartbeat\n\n"
+                continue
+            yield _format_event(event)
+            # Stop once the project is gone or this user lost access to it.
+            if event["type"] == "project.deleted" or (
+                event["type"] == "member.removed" and event.get("user") == user_id
+            ):
+                return
+    finally:
+        # Also reached when the client disconnects (the ASGI handler cancels the iterator).
+        subscription.close()
+
+
+async def task_events_view(request, pk: int):
+    """
+    Stream the project's live events to a user who can view the project. Event types:
+    task.created / task.updated / task.deleted (id), task.bulk (created / updated / deleted ids),
+    project.updated, project.deleted, member.added / member.removed (user), resync (events were
+    dropped because the client fell behind: refetch), reconnect (stream lifetime reached, or the
+    user was deactivated or lost access, re-checked before each heartbeat). Comment lines
+    (": heartbeat") keep idle connections open through proxies.
+    """
+    if request.method != "GET":
+        return JsonResponse(
+            {"success": False, "message": f'Method "{request.method}" not allowed.', "code": "method_not_allowed"},
+            status=405,
+        )
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"success": False, "message": "Event streams are only served over ASGI.", "code": "asgi_required"},
+            status=501,
+        )
+    try:
+        user = await sync_to_async(_authenticate)(request, pk)
+        await sync_to_async(ProjectService.get_project_access)(pk, user)
+    except (BaseAPIException, drf_exceptions.APIException) as exc:
+        return _error_response(exc)
+
+    response = StreamingHttpResponse(
+        _event_stream(pk, user.pk),
+        content_type="text/event-stream",
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"  # disable proxy buffering (nginx)
+    return response
@@ -1,9 +1,10 @@
 """
-TeamTrack – Task views (list, create, detail, update, delete).
+TeamTrack – Task views (list, create, detail, update, delete, changes, bulk).
 Request handling only; business logic in TaskService. Project access via ProjectService.
 """
 from datetime import datetime
 
+from asgiref.sync import sync_to_async
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
@@ -11,28 +12,35 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework.generics import ListAPIView
 
+from core.conditional import etag_matches, not_modified_response, request_etag
+from core.fieldsets import SparseFieldsetMixin
 from core.responses import success_response
+from core.views import AsyncAPIView
 from core.exceptions import ValidationError as APIValidationError
 from core.exceptions import PermissionDeniedError
 
-from apps.projects.services import ProjectService
+from apps.projects.views.mixins import ProjectAccessMixin
 from apps.tasks.serializers import (
     TaskCreateUpdateSerializer,
     TaskListSerializer,
     TaskDetailSerializer,
+    TaskListValuesSerializer,
+    TaskDeletionSerializer,
+    TaskBulkSerializer,
 )
-from apps.tasks.services import TaskService
+from apps.tasks.services import TaskService, TaskSyncService
 
 
-class TaskListView(ListAPIView, APIView):
-    """GET /api/v1/projects/<project_id>/tasks/ – list (with filters). POST – create (modify permission)."""
+class TaskListView(ProjectAccessMixin, SparseFieldsetMixin, ListAPIView, AsyncAPIView):
+    """
+    GET /api/v1/projects/<project_id>/tasks/ – list (with filters, ?fields= / ?exclude=).
+    POST – create (modify permission).
+    """
     permission_classes = [IsAuthenticated]
+    project_access_from_token = True
+    query_budget = {"GET": 6, "POST": 5}
     serializer_class = TaskListSerializer
 
-    def get_project(self):
-        project_pk = self.kwargs["pk"]
-        return ProjectService.get_project_by_id(project_pk, self.request.user)
-
     def get_queryset(self):
         project = self.get_project()
         params = self.request.query_params
@@ -57,6 +65,7 @@ class TaskListView(ListAPIView, APIView):
             except (ValueError, TypeError):
                 due_date_to = None
         search = params.get("search")
+        order_by_relevance = params.get("ordering") == "relevance"
         return TaskService.list_tasks(
             project,
             status=status_val,
@@ -65,21 +74,53 @@ class TaskListView(ListAPIView, APIView):
             due_date_from=due_date_from,
             due_date_to=due_date_to,
             search=search,
+            order_by_relevance=order_by_relevance,
         )
 
     def get(self, request: Request, pk: int) -> Response:
-        self.get_project()
+        project = self.get_project()
+        # Query parameters are validated first, so a bad ?fields= gets 400 even for a cached list.
+        fieldset = self.get_fieldset()
+        # Validate before querying the page: an unchanged task set answers 304 without serializing.
+        etag = request_etag(request, "tasks", project.pk, *TaskService.get_list_fingerprint(project))
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        # values() rows serialized by TaskListValuesSerializer (same output as TaskListSerializer).
         queryset = self.get_queryset()
+        extra = self.get_fieldset_ordering_columns(queryset) if fieldset is not None else ()
+        queryset = TaskListValuesSerializer.get_queryset(queryset, fields=fieldset, extra=extra)
         page = self.paginate_queryset(queryset)
         if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        serializer = self.get_serializer(queryset, many=True)
-        return success_response(data=serializer.data)
+            serializer = TaskListValuesSerializer(page, many=True, fields=fieldset)
+            return self.paginator.get_paginated_response(serializer.data, etag=etag)
+        serializer = TaskListValuesSerializer(queryset, many=True, fields=fieldset)
+        return success_response(data=serializer.data, etag=etag)
+
+    async def aget(self, request: Request, pk: int) -> Response:
+        """Async get (settings.API_ASYNC_VIEWS)."""
+        project = (await self.aget_project_access()).project
+        fieldset = self.get_fieldset()
+        etag = request_etag(request, "tasks", project.pk, *await TaskService.aget_list_fingerprint(project))
+        if etag_matches(request, etag):
+            return not_modified_response(etag)
+        if request.query_params.get("search"):
+            # The search backend is resolved with a catalog query on first use per process.
+            queryset = await sync_to_async(self.get_queryset)()
+        else:
+            queryset = self.get_queryset()
+        extra = self.get_fieldset_ordering_columns(queryset) if fieldset is not None else ()
+        queryset = TaskListValuesSerializer.get_queryset(queryset, fields=fieldset, extra=extra)
+        page = await self.apaginate_queryset(queryset)
+        if page is not None:
+            serializer = TaskListValuesSerializer(page, many=True, fields=fieldset)
+            return self.paginator.get_paginated_response(serializer.data, etag=etag)
+        serializer = TaskListValuesSerializer([row async for row in queryset], many=True, fields=fieldset)
+        return success_response(data=serializer.data, etag=etag)
 
     def post(self, request: Request, pk: int) -> Response:
-        project = self.get_project()
-        if not ProjectService.can_modify_project(request.user, project):
+        access = self.get_project_access()
+        project = access.project
+        if not access.can_modify:
             raise PermissionDeniedError(message="You do not have permission to create tasks in this project.")
         serializer = TaskCreateUpdateSerializer(data=request.data)
         if not serializer.is_valid():
@@ -95,28 +136,25 @@ class TaskListView(ListAPIView, APIView):
         )
 
 
-class TaskDetailView(APIView):
+class TaskDetailView(ProjectAccessMixin, APIView):
     """GET /api/v1/projects/<project_id>/tasks/<task_id>/ – retrieve. PATCH – update. DELETE – delete (modify permission)."""
     permission_classes = [IsAuthenticated]
-
-    def get_project(self):
-        project_pk = self.kwargs["pk"]
-        return ProjectService.get_project_by_id(project_pk, self.request.user)
+    project_access_from_token = True
+    query_budget = {"GET": 3, "PATCH": 5, "DELETE": 7}
 
     def get_task(self):
         project_pk = self.kwargs["pk"]
         task_pk = self.kwargs["task_pk"]
-        return TaskService.get_task_by_id(project_pk, task_pk)
+        return TaskService.get_task_by_id(project_pk, task_pk, project=self.get_project())
 
     def get(self, request: Request, pk: int, task_pk: int) -> Response:
-        self.get_project()
         task = self.get_task()
         serializer = TaskDetailSerializer(task)
         return success_response(data=serializer.data)
 
     def patch(self, request: Request, pk: int, task_pk: int) -> Response:
-        project = self.get_project()
-        if not ProjectService.can_modify_project(request.user, project):
+        access = self.get_project_access()
+        if not access.can_modify:
             raise PermissionDeniedError(message="You do not have permission to update tasks in this project.")
         serializer = TaskCreateUpdateSerializer(data=request.data, partial=True)
         if not serializer.is_valid():
@@ -125,12 +163,110 @@ class TaskDetailView(APIView):
                 code="validation_error",
                 details=serializer.errors,
             )
-        task = TaskService.update_task(pk, task_pk, serializer.validated_data)
+        task = TaskService.update_task(pk, task_pk, serializer.validated_data, project=access.project)
         return success_response(data=TaskDetailSerializer(task).data)
 
     def delete(self, request: Request, pk: int, task_pk: int) -> Response:
-        project = self.get_project()
-        if not ProjectService.can_modify_project(request.user, project):
+        access = self.get_project_access()
+        if not access.can_modify:
             raise PermissionDeniedError(message="You do not have permission to delete tasks in this project.")
-        TaskService.delete_task(pk, task_pk)
+        TaskService.delete_task(pk, task_pk, project=access.project)
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class TaskChangesView(ProjectAccessMixin, APIView):
+    """
+    GET /api/v1/projects/<project_id>/tasks/changes/?since=<token> – tasks created or updated
+    and ids of tasks deleted since token. Without since: every task (initial sync).
+    Continue with next_token (immediately while has_more, otherwise on the next poll).
+    Results may repeat recently changed tasks; apply them as upserts.
+    """
+    permission_classes = [IsAuthenticated]
+    project_access_from_token = True
+    query_budget = 4
+    page_size = 100
+    max_page_size = 500
+
+    def get_page_size(self) -> int:
+        try:
+            size = int(self.request.query_params["page_size"])
+        except (KeyError, ValueError, TypeError):
+            return self.page_size
+        return min(size, self.max_page_size) if size > 0 else self.page_size
+
+    def get(self, request: Request, pk: int) -> Response:
+        project = self.get_project()
+        changes = TaskSyncService.list_changes(
+            project,
+            token=request.query_params.get("since"),
+            limit=self.get_page_size(),
+            values=TaskListValuesSerializer.get_queryset,
+        )
+        return success_response(data={
+            "results": TaskListValuesSerializer(changes["tasks"], many=True).data,
+            "deleted": TaskDeletionSerializer(changes["deleted"], many=True).data,
+            "next_token": changes["token"],
+            "has_more": changes["has_more"],
+        })
+
+
+class TaskBulkView(ProjectAccessMixin, APIView):
+    """
+    POST /api/v1/projects/<project_id>/tasks/bulk/ – create / update / delete many tasks (modify permission).
+    Body: {"operations": [{"op": "create"|"update"|"delete", "id": <task id>, "data": {...}}], "atomic": true}
+    atomic=true (default) applies all operations or none; atomic=false applies the valid ones
+    and reports the rest. Results are returned per operation, in request order.
+    """
+    permission_classes = [IsAuthenticated]
+    project_access_from_token = True
+    query_budget = 10  # independent of the number of operations
+
+    def post(self, request: Request, pk: int) -> Response:
+        access = self.get_project_access()
+        if not access.can_modify:
+            raise PermissionDeniedError(message="You do not have permission to modify tasks in this project.")
+        envelope = TaskBulkSerializer(data=request.data)
+        if not envelope.is_valid():
+            raise APIValidationError(
+                message="Validation failed",
+                code="validation_error",
+                details=envelope.errors,
+            )
+        items = []
+        for index, operation in enumerate(envelope.validated_data["operations"]):
+            item = {"index": index, "op": operation["op"], "id": operation.get("id"), "data": None, "errors": None}
+            if operation["op"] != "delete":
+                serializer = TaskCreateUpdateSerializer(data=operation["data"], partial=operation["op"] == "update")
+                if serializer.is_valid():
+                    item["data"] = serializer.validated_data
+                else:
+                    item["errors"] = serializer.errors
+            items.append(item)
+
+        results = TaskService.bulk_apply(
+            access.project, request.user, items, atomic=envelope.validated_data["atomic"]
+        )
+        tasks = [result.pop("task") for result in results if "task" in result]
+        if tasks:
+            # One query for the assignee / creator emails of every created or updated task.
+            refreshed = TaskService.list_tasks(access.project).in_bulk([task.pk for task in tasks])
+            for result in results:
+                if result["success"] and result["op"] != "delete":
+                    task = refreshed.get(result["id"])
+                    if task is None:
+                        # Applied, then deleted by another request before it could be read back.
+                        result["data"] = None
+                        result["code"] = "not_found"
+                    else:
+                        result["data"] = TaskDetailSerializer(task).data
+        counts = {op: sum(1 for r in results if r["success"] and r["op"] == op) for op in ("create", "update", "delete")}
+        return success_response(
+            data={
+                "results": results,
+                "created": counts["create"],
+                "updated": counts["update"],
+                "deleted": counts["delete"],
+                "failed": sum(1 for r in results if not r["success"]),
+            },
+            status_code=status.HTTP_200_OK,
+        )
@@ -1,7 +1,27 @@
 from django.apps import AppConfig
 
 
+def token_table_metrics() -> dict:
+    """Row counts of the refresh-token tables for core.metrics (TokenService.table_sizes)."""
+    from apps.users.services import TokenService
+
+    sizes = TokenService.table_sizes()
+    return {
+        "teamtrack_auth_token_rows": {
+            "type": "gauge",
+            "help": "Rows in the refresh-token tables (pruned by manage.py prune_tokens).",
+            "labelnames": ["table"],
+            "series": [[[table], rows] for table, rows in sizes.items()],
+        }
+    }
+
+
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "apps.users"
     verbose_name = "Users"
+
+    def ready(self):
+        from core import metrics
+
+        metrics.registry.register_collector(token_table_metrics, server_wide=True)
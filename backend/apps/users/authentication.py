@@ -0,0 +1,72 @@
+"""
+TeamTrack – JWT authentication with a user cache.
+simplejwt's JWTAuthentication loads the user row on every authenticated request. This variant
+caches the loaded user for USER_AUTH_CACHE_TIMEOUT seconds per user id, tagged with the user's
+version counter (core.cache): UserService.bump_user_version, called whenever role, is_active or
+profile fields change, makes the next request load the row again, so deactivation and role
+changes apply immediately. The TTL bounds staleness for changes made outside the API.
+Invalidation relies on every worker seeing the bump, so the cache is only used with a shared
+cache backend (Redis, Memcached: see is_shared_cache). With the default LocMemCache each worker
+would keep serving its own copy of a deactivated or demoted user, so the row is loaded on every
+request instead, like JWTAuthentication.
+Only the fields request handling reads are cached (CACHED_USER_FIELDS), never the password hash:
+the token revocation check compares against a fingerprint of it, the value tokens carry.
+"""
+from django.conf import settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from core.cache import CacheStats, get_versioned, is_shared_cache, set_versioned
+
+from apps.users.models import User
+from apps.users.services.user_service import USER_VERSION
+
+cache_stats = CacheStats.get("auth_user")
+
+# Read by permissions, the profile GET and the services; other fields load from the row on access.
+CACHED_USER_FIELDS = (
+    "id", "username", "email", "first_name", "last_name", "role",
+    "is_active", "is_staff", "is_superuser", "date_joined",
+)
+
+
+def _cache_entry(user: User) -> dict:
+    entry = {field: getattr(user, field) for field in CACHED_USER_FIELDS}
+    entry["password_fingerprint"] = get_md5_hash_password(user.password)
+    return entry
+
+
+def _user_from_cache(entry: dict) -> User:
+    fields = [field.attname for field in User._meta.concrete_fields if field.attname in CACHED_USER_FIELDS]
+    return User.from_db(User.objects.db, fields, [entry[field] for field in fields])
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """JWTAuthentication serving request.user from the versioned user cache."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise InvalidToken("Token contained no recognizable user identification")
+        if not is_shared_cache():
+            return super().get_user(validated_token)
+
+        entry, version = get_versioned(USER_VERSION, user_id, f"auth:user:{user_id}")
+        if entry is None:
+            cache_stats.record_miss()
+            user = super().get_user(validated_token)
+            set_versioned(f"auth:user:{user_id}", version, _cache_entry(user), settings.USER_AUTH_CACHE_TIMEOUT)
+            return user
+
+        cache_stats.record_hit()
+        # Same checks as JWTAuthentication.get_user, on the cached fields.
+        if api_settings.CHECK_USER_IS_ACTIVE and not entry["is_active"]:
+            raise AuthenticationFailed("User is inactive", code="user_inactive")
+        if api_settings.CHECK_REVOKE_TOKEN and validated_token.get(
+            api_settings.REVOKE_TOKEN_CLAIM
+        ) != entry["password_fingerprint"]:
+            raise AuthenticationFailed("The user's password has been changed.", code="password_changed")
+        return _user_from_cache(entry)
@@ -0,0 +1,27 @@
+"""
+TeamTrack – Password hashers.
+Django's hashers with work factors taken from settings (PASSWORD_* environment variables), so
+the CPU / memory cost of a login can be tuned per deployment; unset factors keep Django's
+defaults. settings.PASSWORD_HASHERS lists the preferred hasher (PASSWORD_HASHER) first. On a
+successful login Django re-hashes the password with it whenever the stored hash uses another
+algorithm or other work factors (check_password's setter), so changing the policy upgrades
+users transparently. Algorithm names are Django's, so existing hashes keep verifying.
+"""
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class TunedPBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    iterations = settings.PASSWORD_PBKDF2_ITERATIONS or hashers.PBKDF2PasswordHasher.iterations
+
+
+class TunedScryptPasswordHasher(hashers.ScryptPasswordHasher):
+    work_factor = settings.PASSWORD_SCRYPT_WORK_FACTOR or hashers.ScryptPasswordHasher.work_factor
+
+
+class TunedArgon2PasswordHasher(hashers.Argon2PasswordHasher):
+    """Needs argon2-cffi (requirements/production.txt); PASSWORD_HASHER=auto only picks it when installed."""
+
+    time_cost = settings.PASSWORD_ARGON2_TIME_COST or hashers.Argon2PasswordHasher.time_cost
+    memory_cost = settings.PASSWORD_ARGON2_MEMORY_COST or hashers.Argon2PasswordHasher.memory_cost
+    parallelism = settings.PASSWORD_ARGON2_PARALLELISM or hashers.Argon2PasswordHasher.parallelism
@@ -0,0 +1,39 @@
+"""
+TeamTrack – Prune expired refresh tokens.
+Deletes outstanding tokens past their expiry, with their blacklist rows, in batches of
+settings.TOKEN_PRUNE_BATCH_SIZE so no single statement holds the tables for long (expired tokens
+can no longer be refreshed, blacklisted or not). Intended for a daily cron job; replaces
+simplejwt's flushexpiredtokens, which deletes everything in one statement.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from apps.users.services import TokenService
+
+
+class Command(BaseCommand):
+    help = "Delete expired outstanding and blacklisted refresh tokens in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.TOKEN_PRUNE_BATCH_SIZE,
+            help="Tokens deleted per transaction (default: TOKEN_PRUNE_BATCH_SIZE).",
+        )
+        parser.add_argument(
+            "--pause",
+            type=float,
+            default=0.0,
+            help="Seconds to sleep between batches, to leave the database to the API.",
+        )
+
+    def handle(self, *args, **options):
+        deleted = TokenService.prune_expired(batch_size=options["batch_size"], pause=options["pause"])
+        sizes = TokenService.table_sizes(refresh=True)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Pruned {deleted['outstanding']} expired token(s), {deleted['blacklisted']} blacklisted; "
+                f"{sizes['outstanding']} outstanding / {sizes['blacklisted']} blacklisted remain."
+            )
+        )
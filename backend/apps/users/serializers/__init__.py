@@ -1,14 +1,20 @@
-from .auth_serializer import RegisterSerializer, LoginSerializer
+from .auth_serializer import RegisterSerializer, AcceptInviteSerializer, LoginSerializer, RefreshSerializer
 from .user_serializer import (
     UserProfileSerializer,
     UserListSerializer,
     UserAdminUpdateSerializer,
+    UserInviteSerializer,
+    UserInviteBulkSerializer,
 )
 
 __all__ = [
     "RegisterSerializer",
+    "AcceptInviteSerializer",
     "LoginSerializer",
+    "RefreshSerializer",
     "UserProfileSerializer",
     "UserListSerializer",
     "UserAdminUpdateSerializer",
+    "UserInviteSerializer",
+    "UserInviteBulkSerializer",
 ]
@@ -1,11 +1,17 @@
 """
-TeamTrack – Auth serializers (register, login).
+TeamTrack – Auth serializers (register, login, accept invite).
 Validation only; no business logic.
 """
-from django.contrib.auth import authenticate
 from rest_framework import serializers
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
 
 from apps.users.models import User
+from apps.users.services import AuthService, TokenService
+from apps.users.tokens import CachedBlacklistRefreshToken
+from core.exceptions import AuthenticationError
 
 
 class RegisterSerializer(serializers.Serializer):
@@ -17,10 +23,20 @@ class RegisterSerializer(serializers.Serializer):
     last_name = serializers.CharField(required=False, allow_blank=True, max_length=150)
 
     def validate_email(self, value):
-        email = (value or "").strip().lower()
-        if User.objects.filter(email=email).exists():
-            raise serializers.ValidationError("A user with this email already exists.")
-        return email
+        # Uniqueness is enforced by the INSERT (AuthService.register_user), not a pre-check query.
+        return (value or "").strip().lower()
+
+    def validate_password(self, value):
+        from django.contrib.auth.password_validation import validate_password
+        validate_password(value)
+        return value
+
+
+class AcceptInviteSerializer(serializers.Serializer):
+    """Validate accept-invite input: the invite token and the user's new password."""
+
+    token = serializers.CharField(required=True, max_length=512)
+    password = serializers.CharField(required=True, write_only=True, min_length=8, max_length=128)
 
     def validate_password(self, value):
         from django.contrib.auth.password_validation import validate_password
@@ -35,12 +51,37 @@ class LoginSerializer(serializers.Serializer):
     password = serializers.CharField(required=True, write_only=True)
 
     def validate(self, attrs):
-        user = authenticate(
-            request=self.context.get("request"),
-            username=attrs["email"].lower(),
-            password=attrs["password"],
-        )
-        if not user:
-            raise serializers.ValidationError("Invalid email or password.")
-        attrs["user"] = user
+        try:
+            attrs["user"] = AuthService.authenticate_user(
+                attrs["email"], attrs["password"], request=self.context.get("request")
+            )
+        except AuthenticationError as exc:
+            raise serializers.ValidationError(exc.message)
         return attrs
+
+
+class RefreshSerializer(TokenRefreshSerializer):
+    """
+    Validate a refresh token and rotate it like TokenRefreshSerializer, reading the user once
+    and blacklisting through TokenService. validated_data also holds the user.
+    """
+
+    token_class = CachedBlacklistRefreshToken
+
+    def validate(self, attrs):
+        try:
+            refresh = self.token_class(attrs["refresh"])
+        except TokenError as exc:
+            raise serializers.ValidationError({"refresh": [str(exc)]})
+        user = User.objects.filter(pk=refresh.payload.get(api_settings.USER_ID_CLAIM)).first()
+        if user is None or not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(self.error_messages["no_active_account"], "no_active_account")
+
+        data = {"access": str(refresh.access_token), "user": user}
+        if api_settings.ROTATE_REFRESH_TOKENS:
+            try:
+                TokenService.rotate(refresh, user)
+            except TokenError as exc:
+                raise serializers.ValidationError({"refresh": [str(exc)]})
+            data["refresh"] = str(refresh)
+        return data
@@ -1,9 +1,11 @@
 """
 TeamTrack – User serializers.
-Profile (me), list (admin), and admin update (role / is_active).
+Profile (me), list (admin), admin update (role / is_active) and bulk invite.
 """
+from django.conf import settings
 from rest_framework import serializers
 
+from core.fieldsets import SparseFieldsetSerializerMixin
 from apps.users.models import User
 
 
@@ -16,8 +18,8 @@ class UserProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "email", "role", "date_joined")
 
 
-class UserListSerializer(serializers.ModelSerializer):
-    """Serialize user for admin list (no sensitive fields)."""
+class UserListSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
+    """Serialize user for admin list (no sensitive fields). Accepts fields= for sparse fieldsets."""
 
     class Meta:
         model = User
@@ -35,3 +37,23 @@ class UserAdminUpdateSerializer(serializers.Serializer):
         if value not in (User.Role.ADMIN, User.Role.TEAM_MEMBER):
             raise serializers.ValidationError("Invalid role.")
         return value
+
+
+class UserInviteSerializer(serializers.Serializer):
+    """One invited user. Email uniqueness is left to the INSERT (UserService.invite_users)."""
+
+    email = serializers.EmailField(required=True, max_length=254)
+    first_name = serializers.CharField(required=False, allow_blank=True, max_length=150)
+    last_name = serializers.CharField(required=False, allow_blank=True, max_length=150)
+    role = serializers.ChoiceField(choices=User.Role.choices, required=False, default=User.Role.TEAM_MEMBER)
+
+    def validate_email(self, value):
+        return (value or "").strip().lower()
+
+
+class UserInviteBulkSerializer(serializers.Serializer):
+    """Validate the invite envelope. Each row is validated with UserInviteSerializer."""
+
+    users = serializers.ListField(
+        child=serializers.DictField(), allow_empty=False, max_length=settings.USER_INVITE_MAX_USERS
+    )
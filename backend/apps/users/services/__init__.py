@@ -1,4 +1,5 @@
 from .auth_service import AuthService
+from .token_service import TokenService
 from .user_service import UserService
 
-__all__ = ["AuthService", "UserService"]
+__all__ = ["AuthService", "TokenService", "UserService"]
@@ -1,24 +1,100 @@
 """
 TeamTrack – Auth service.
 Business logic for registration and authentication; no token issuance (handled in views with simplejwt).
+Password hashing is deliberately slow, so at most settings.LOGIN_CONCURRENCY hashes run at once per
+worker process (password_hashing_slot). A login or registration that finds every slot taken is
+refused with 429 straight away (after at most LOGIN_QUEUE_TIMEOUT_SECONDS, 0 by default) instead
+of queueing, because a queued request holds a worker thread the rest of the API needs.
+Invites: invited users are created without a usable password (UserService.invite_users) and set
+one with a signed invite token (invite_token / accept_invite). The token carries a fingerprint of
+the stored password, so it stops working once a password is set: it can be used only once.
 """
+import contextlib
+import threading
+import time
+
+from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth import get_user_model
+from django.core import signing
+from django.db import IntegrityError, transaction
+from django.utils.crypto import constant_time_compare, salted_hmac
 
-from core.exceptions import AuthenticationError
+from core import metrics
+from core.exceptions import AuthenticationError, TooManyRequestsError, ValidationError
 
 User = get_user_model()
 
+DUPLICATE_EMAIL_MESSAGE = "A user with this email already exists."
+INVITE_SALT = "users.invite"
+
+_hashing_slots = threading.BoundedSemaphore(settings.LOGIN_CONCURRENCY)
+
+HASHING_WAIT = metrics.registry.histogram(
+    "teamtrack_password_hash_wait_seconds", "Time spent waiting for a password hashing slot."
+)
+HASHING_REJECTED = metrics.registry.counter(
+    "teamtrack_password_hash_rejected_total", "Logins / registrations refused with 429: no free hashing slot."
+)
+
+
+def _is_duplicate_email(error: IntegrityError) -> bool:
+    """
+    Whether error is a unique violation on the email (or username, which holds the email too).
+    Checked on the database's message, since the transaction cannot run a query after it:
+    SQLite "UNIQUE constraint failed: users_user.email", MySQL "Duplicate entry ... for key
+    'users_user.email'", PostgreSQL "duplicate key ... constraint \"users_user_email_key\"".
+    """
+    message = str(error).lower()
+    if "unique" not in message and "duplicate" not in message:
+        return False
+    table = User._meta.db_table
+    names = [f"{table}.{column}" for column in ("email", "username")]
+    names += [f"{table}_{column}_" for column in ("email", "username")]
+    names += ["key 'email'", "key 'username'"]  # MySQL before 8.0.19 names the index only
+    return any(name in message for name in names)
+
+
+def _password_fingerprint(encoded_password: str) -> str:
+    return salted_hmac(INVITE_SALT, encoded_password).hexdigest()[:20]
+
 
 class AuthService:
     """Authentication business logic."""
 
+    @staticmethod
+    @contextlib.contextmanager
+    def password_hashing_slot():
+        """
+        Hold one of the worker's LOGIN_CONCURRENCY hashing slots for the block. Raises
+        TooManyRequestsError (429) if none is free, without waiting unless
+        LOGIN_QUEUE_TIMEOUT_SECONDS is set.
+        """
+        started = time.perf_counter()
+        timeout = settings.LOGIN_QUEUE_TIMEOUT_SECONDS
+        acquired = _hashing_slots.acquire(timeout=timeout) if timeout > 0 else _hashing_slots.acquire(blocking=False)
+        HASHING_WAIT.observe(time.perf_counter() - started)
+        if not acquired:
+            HASHING_REJECTED.inc()
+            raise TooManyRequestsError(
+                message="Too many login attempts are being processed. Please retry shortly.",
+                retry_after=1,
+            )
+        try:
+            yield
+        finally:
+            _hashing_slots.release()
+
     @staticmethod
     def register_user(validated_data):
         """
         Create a new user with the given validated data.
         Password is hashed by Django when set via set_password.
-        Returns the created User.
+        Returns the created User. A taken email is detected by the INSERT hitting the unique
+        constraint (no pre-check query, no race between concurrent sign-ups) and raised as the
+        validation error the serializer used to report. Inside the caller's transaction no
+        savepoint is used: the error must propagate out of it (RegisterView issues the tokens
+        in the same transaction).
         """
         email = validated_data["email"].lower()
         password = validated_data["password"]
@@ -32,21 +108,68 @@ class AuthService:
             last_name=last_name,
             role=User.Role.TEAM_MEMBER,
         )
-        user.set_password(password)
-        user.save()
+        with AuthService.password_hashing_slot():
+            user.set_password(password)
+        try:
+            with transaction.atomic(savepoint=False):
+                user.save(force_insert=True)
+        except IntegrityError as error:
+            if not _is_duplicate_email(error):
+                raise
+            raise ValidationError(
+                message="Validation failed",
+                code="validation_error",
+                details={"email": [DUPLICATE_EMAIL_MESSAGE]},
+            )
         return user
 
     @staticmethod
     def authenticate_user(email, password, request=None):
         """
         Authenticate user by email and password.
-        Returns User if valid; raises AuthenticationError if invalid.
+        Returns User if valid; raises AuthenticationError if invalid. A password hashed with
+        an outdated hasher or work factor is re-hashed with the current one.
         """
-        user = authenticate(
-            request=request,
-            username=email.lower(),
-            password=password,
-        )
+        with AuthService.password_hashing_slot():
+            user = authenticate(
+                request=request,
+                username=email.lower(),
+                password=password,
+            )
         if not user:
             raise AuthenticationError(message="Invalid email or password.")
         return user
+
+    @staticmethod
+    def invite_token(user) -> str:
+        """Signed token letting an invited user (no usable password yet) set their password once."""
+        return signing.dumps({"u": user.pk, "p": _password_fingerprint(user.password)}, salt=INVITE_SALT)
+
+    @staticmethod
+    def accept_invite(token: str, password: str):
+        """
+        Set the password of the invited user the token was issued for and return the user.
+        Raises ValidationError if the token is invalid, older than USER_INVITE_MAX_AGE_SECONDS,
+        already used (a password was set since) or its user is inactive. The password is hashed
+        before the user row is locked, so the lock is held for one SELECT and one UPDATE.
+        """
+        try:
+            payload = signing.loads(token, salt=INVITE_SALT, max_age=settings.USER_INVITE_MAX_AGE_SECONDS)
+        except signing.SignatureExpired:
+            raise ValidationError(message="Invite expired. Ask an administrator for a new one.", code="invite_expired")
+        except signing.BadSignature:
+            raise ValidationError(message="Invalid invite.", code="invite_invalid")
+        invited = User(pk=payload["u"])
+        with AuthService.password_hashing_slot():
+            invited.set_password(password)
+        with transaction.atomic():
+            user = User.objects.select_for_update().filter(pk=payload["u"], is_active=True).first()
+            if (
+                user is None
+                or user.has_usable_password()
+                or not constant_time_compare(_password_fingerprint(user.password), payload["p"])
+            ):
+                raise ValidationError(message="Invalid invite.", code="invite_invalid")
+            user.password = invited.password
+            user.save(update_fields=["password"])
+        return user
@@ -0,0 +1,173 @@
+"""
+TeamTrack – Refresh-token bookkeeping (simplejwt token_blacklist tables).
+Every refresh rotates the token: the presented one is blacklisted and the new one recorded as
+outstanding, so both tables grow with use until prune_expired (manage.py prune_tokens) deletes
+the rows of expired tokens in batches.
+Blacklist checks: a blacklisted token stays blacklisted until it expires, so known-blacklisted
+jtis are kept in a per-process LRU and in the shared cache (until the token's expiry) and
+answered without the database. A jti found in neither is looked up in the database: a miss
+cannot prove a token is not blacklisted (another process may have blacklisted it, or the cache
+evicted the entry), so a replayed token is always refused.
+"""
+import collections
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.utils import datetime_from_epoch
+
+from core.cache import CacheStats
+
+TABLE_SIZES_KEY = "auth:token_table_sizes"
+
+
+def _blacklisted_key(jti: str) -> str:
+    return f"auth:blacklisted:{jti}"
+
+
+class _BlacklistLRU:
+    """Most recently seen blacklisted jtis of this process (bounded)."""
+
+    def __init__(self, size: int):
+        self.size = size
+        self._jtis = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __contains__(self, jti: str) -> bool:
+        with self._lock:
+            if jti not in self._jtis:
+                return False
+            self._jtis.move_to_end(jti)
+            return True
+
+    def add(self, jti: str) -> None:
+        with self._lock:
+            self._jtis[jti] = None
+            self._jtis.move_to_end(jti)
+            while len(self._jtis) > self.size:
+                self._jtis.popitem(last=False)
+
+
+_blacklisted = _BlacklistLRU(settings.TOKEN_BLACKLIST_LRU_SIZE)
+
+
+class TokenService:
+    """Outstanding / blacklisted refresh tokens."""
+
+    blacklist_stats = CacheStats.get("token_blacklist")
+
+    @staticmethod
+    def is_blacklisted(jti: str) -> bool:
+        """Whether the token with this jti is blacklisted (LRU, then shared cache, then database)."""
+        if jti in _blacklisted or cache.get(_blacklisted_key(jti)):
+            TokenService.blacklist_stats.record_hit()
+            _blacklisted.add(jti)
+            return True
+        TokenService.blacklist_stats.record_miss()
+        blacklisted = BlacklistedToken.objects.filter(token__jti=jti).exists()
+        if blacklisted:
+            TokenService._remember_blacklisted(jti, None)
+        return blacklisted
+
+    @staticmethod
+    def _remember_blacklisted(jti: str, expires_at) -> None:
+        """Cache a blacklisted jti until the token expires (expiry unknown: the refresh lifetime)."""
+        _blacklisted.add(jti)
+        if expires_at is None:
+            timeout = int(api_settings.REFRESH_TOKEN_LIFETIME.total_seconds())
+        else:
+            timeout = max(int((expires_at - timezone.now()).total_seconds()), 1)
+        cache.set(_blacklisted_key(jti), True, timeout=timeout)
+
+    @staticmethod
+    def outstand(token, user, created: bool = False) -> OutstandingToken:
+        """
+        Record token as outstanding for user. created=True for a token minted in this request
+        (fresh jti): inserted without looking it up first.
+        """
+        values = {
+            "user": user,
+            "created_at": token.current_time,
+            "token": str(token),
+            "expires_at": datetime_from_epoch(token["exp"]),
+        }
+        if created:
+            return OutstandingToken.objects.create(jti=token[api_settings.JTI_CLAIM], **values)
+        outstanding, _ = OutstandingToken.objects.get_or_create(jti=token[api_settings.JTI_CLAIM], defaults=values)
+        return outstanding
+
+    @staticmethod
+    def blacklist(token, user) -> None:
+        """
+        Blacklist token (recording it as outstanding first if needed). Raises TokenError if it
+        already was, e.g. by a concurrent refresh with the same token that got there first.
+        """
+        outstanding = TokenService.outstand(token, user)
+        _, created = BlacklistedToken.objects.get_or_create(token=outstanding)
+        if not created:
+            TokenService._remember_blacklisted(outstanding.jti, outstanding.expires_at)
+            raise TokenError("Token is blacklisted")
+        transaction.on_commit(lambda: TokenService._remember_blacklisted(outstanding.jti, outstanding.expires_at))
+
+    @staticmethod
+    def rotate(token, user) -> None:
+        """Blacklist token, then give it a new jti / expiry and record it as outstanding (refresh rotation)."""
+        with transaction.atomic():
+            if api_settings.BLACKLIST_AFTER_ROTATION:
+                TokenService.blacklist(token, user)
+            token.set_jti()
+            token.set_exp()
+            token.set_iat()
+            TokenService.outstand(token, user, created=True)
+
+    @staticmethod
+    def prune_expired(before=None, batch_size: int = None, pause: float = 0.0) -> dict:
+        """
+        Delete outstanding tokens that expired before before (default: now), with their
+        blacklist rows, batch_size at a time (each batch its own short transaction, pause
+        seconds apart). Returns {"outstanding": n, "blacklisted": n}.
+        Batches walk the primary key: tokens expire in roughly the order they were issued, so
+        each batch reads the oldest rows instead of scanning expires_at (not indexed).
+        """
+        before = before or timezone.now()
+        batch_size = batch_size or settings.TOKEN_PRUNE_BATCH_SIZE
+        deleted = {"outstanding": 0, "blacklisted": 0}
+        last_id = 0
+        while True:
+            ids = list(
+                OutstandingToken.objects.filter(id__gt=last_id, expires_at__lt=before)
+                .order_by("id")
+                .values_list("id", flat=True)[:batch_size]
+            )
+            if not ids:
+                break
+            with transaction.atomic():
+                deleted["blacklisted"] += BlacklistedToken.objects.filter(token_id__in=ids).delete()[0]
+                deleted["outstanding"] += OutstandingToken.objects.filter(id__in=ids).delete()[0]
+            last_id = ids[-1]
+            if len(ids) < batch_size:
+                break
+            if pause:
+                time.sleep(pause)
+        return deleted
+
+    @staticmethod
+    def table_sizes(refresh: bool = False) -> dict:
+        """
+        {"outstanding": rows, "blacklisted": rows}, counted at most every
+        TOKEN_TABLE_SIZES_CACHE_SECONDS (the counts scan the tables).
+        """
+        sizes = None if refresh else cache.get(TABLE_SIZES_KEY)
+        if sizes is None:
+            sizes = {
+                "outstanding": OutstandingToken.objects.count(),
+                "blacklisted": BlacklistedToken.objects.count(),
+            }
+            cache.set(TABLE_SIZES_KEY, sizes, timeout=settings.TOKEN_TABLE_SIZES_CACHE_SECONDS)
+        return sizes
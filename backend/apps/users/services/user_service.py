@@ -1,12 +1,20 @@
 """
 TeamTrack – User service.
-Business logic for admin user management: list, get by id, update role and is_active.
+Business logic for admin user management: list, get by id, update role and is_active, bulk invite.
 """
+from django.db import transaction
 from django.db.models import QuerySet
+from django.utils import timezone
 
+from core.cache import bump_version_on_commit
 from core.exceptions import NotFoundError, PermissionDeniedError
 
 from apps.users.models import User
+from apps.users.services.auth_service import DUPLICATE_EMAIL_MESSAGE, AuthService
+
+# Cache version namespace (see core.cache): changes whenever a user's row changes through the API,
+# invalidating the user cached by apps.users.authentication.CachedJWTAuthentication.
+USER_VERSION = "user"
 
 
 class UserService:
@@ -62,4 +70,79 @@ class UserService:
             update_fields.append("is_active")
         if update_fields:
             user.save(update_fields=update_fields)
+            UserService.bump_user_version(user.pk)
         return user
+
+    @staticmethod
+    def bump_user_version(user_id: int) -> None:
+        """Invalidate the cached user (authentication) once the current transaction commits."""
+        bump_version_on_commit(USER_VERSION, user_id)
+
+    @staticmethod
+    def invite_users(items: list) -> list:
+        """
+        Create users for a batch of invites with one bulk_create, whatever the batch size.
+        items: [{"index", "data", "errors"}] where data is validated UserInviteSerializer output
+        and errors holds per-row validation errors.
+        Taken emails are left to the unique constraint (ignore_conflicts) rather than checked
+        first: every row of the batch is stamped with the same date_joined, and one query
+        afterwards reads back the rows with that stamp; an email missing from them was taken
+        (before or concurrently). Invited users have no usable password: each created row gets
+        an invite_token to set one (AuthService.accept_invite).
+        Returns per-row results: {"index", "email", "success", "id", "invite_token"} or
+        {..., "code", "errors"}. Caller must have been checked for admin permission.
+        """
+        results = [None] * len(items)
+
+        def fail(item, code, errors):
+            results[item["index"]] = {
+                "index": item["index"],
+                "email": (item.get("data") or {}).get("email"),
+                "success": False,
+                "id": None,
+                "code": code,
+                "errors": errors,
+            }
+
+        seen_emails = set()
+        pending = []
+        for item in items:
+            if item.get("errors"):
+                fail(item, "validation_error", item["errors"])
+                continue
+            data = item["data"]
+            if data["email"] in seen_emails:
+                fail(item, "duplicate_email", {"email": ["This email appears more than once in the request."]})
+                continue
+            seen_emails.add(data["email"])
+            user = User(
+                email=data["email"],
+                username=data["email"],
+                first_name=data.get("first_name", "").strip(),
+                last_name=data.get("last_name", "").strip(),
+                role=data.get("role", User.Role.TEAM_MEMBER),
+            )
+            user.set_unusable_password()
+            pending.append((item, user))
+
+        if pending:
+            joined = timezone.now()
+            emails = [user.email for _, user in pending]
+            for _, user in pending:
+                user.date_joined = joined
+            with transaction.atomic():
+                User.objects.bulk_create([user for _, user in pending], ignore_conflicts=True)
+                inserted = dict(User.objects.filter(email__in=emails, date_joined=joined).values_list("email", "id"))
+            for item, user in pending:
+                if user.email not in inserted:
+                    fail(item, "email_taken", {"email": [DUPLICATE_EMAIL_MESSAGE]})
+                    continue
+                user.pk = inserted[user.email]
+                results[item["index"]] = {
+                    "index": item["index"],
+                    "email": user.email,
+                    "success": True,
+                    "id": user.pk,
+                    "invite_token": AuthService.invite_token(user),
+                }
+        return results
@@ -0,0 +1,72 @@
+"""
+TeamTrack – Authentication tests.
+"""
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from apps.users.authentication import cache_stats
+from apps.users.models import User
+from apps.users.services import UserService
+
+ME_URL = "/api/v1/users/me/"
+
+
+class CachedJWTAuthenticationTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+
+    def get_me(self, status: int):
+        response = self.client.get(ME_URL)
+        self.assertEqual(response.status_code, status, response.content)
+
+    def test_process_local_cache_loads_the_user_every_request(self):
+        self.get_me(200)
+        misses = cache_stats.snapshot()["misses"]
+        # Deactivated by another worker: its version bump would not reach this process's LocMemCache.
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.get_me(401)
+        self.assertEqual(cache_stats.snapshot()["misses"], misses)
+
+    def shared_cache(self):
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location, ignore_errors=True)
+        shared = {"default": {"BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location}}
+        return override_settings(CACHES=shared)
+
+    def test_shared_cache_serves_the_user_until_its_version_changes(self):
+        with self.shared_cache():
+            expected = self.client.get(ME_URL).json()
+            hits = cache_stats.snapshot()["hits"]
+            self.assertEqual(self.client.get(ME_URL).json(), expected)
+            self.assertEqual(cache_stats.snapshot()["hits"], hits + 1)
+            _, entry = cache.get(f"auth:user:{self.user.pk}")
+            self.assertNotIn("password", entry)
+            self.assertNotIn(self.user.password, entry.values())
+            with self.captureOnCommitCallbacks(execute=True):
+                User.objects.filter(pk=self.user.pk).update(is_active=False)
+                UserService.bump_user_version(self.user.pk)
+            self.get_me(401)
+
+    def test_shared_cache_revokes_tokens_after_a_password_change(self):
+        with self.shared_cache(), mock.patch.object(api_settings, "CHECK_REVOKE_TOKEN", True):
+            old_token = f"Bearer {AccessToken.for_user(self.user)}"
+            self.user.set_password("an0ther-pass")
+            User.objects.filter(pk=self.user.pk).update(password=self.user.password)
+            self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(self.user)}")
+            self.get_me(200)  # caches the user with the new password's fingerprint
+            hits = cache_stats.snapshot()["hits"]
+            self.client.credentials(HTTP_AUTHORIZATION=old_token)
+            self.get_me(401)
+            self.assertEqual(cache_stats.snapshot()["hits"], hits + 1)
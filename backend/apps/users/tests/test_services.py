@@ -0,0 +1,118 @@
+"""
+TeamTrack – User service tests.
+"""
+import datetime
+import io
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from apps.users.models import User
+from apps.users.services import TokenService, token_service
+from apps.users.services.token_service import _BlacklistLRU
+
+
+class TokenPruneTests(TestCase):
+    """prune_expired / manage.py prune_tokens delete expired tokens and their blacklist rows only."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+        now = timezone.now()
+        # Interleaved, so batches walking the primary key meet live tokens between expired ones.
+        for index in range(10):
+            expires_at = now + datetime.timedelta(days=1 if index % 3 == 0 else -1)
+            outstanding = OutstandingToken.objects.create(
+                user=cls.user, jti=f"jti-{index}", token=f"token-{index}", created_at=now, expires_at=expires_at
+            )
+            if index % 2 == 0:
+                BlacklistedToken.objects.create(token=outstanding)
+        cls.live = ["jti-0", "jti-3", "jti-6", "jti-9"]
+
+    def assertOnlyLiveTokensRemain(self):
+        self.assertCountEqual(OutstandingToken.objects.values_list("jti", flat=True), self.live)
+        self.assertCountEqual(BlacklistedToken.objects.values_list("token__jti", flat=True), ["jti-0", "jti-6"])
+
+    def test_prune_expired_in_batches(self):
+        with mock.patch.object(token_service.time, "sleep") as sleep:
+            deleted = TokenService.prune_expired(batch_size=2, pause=0.5)
+        self.assertEqual(deleted, {"outstanding": 6, "blacklisted": 3})
+        self.assertEqual(sleep.mock_calls, [mock.call(0.5)] * 3)  # after each full batch
+        self.assertOnlyLiveTokensRemain()
+        self.assertEqual(TokenService.prune_expired(batch_size=2), {"outstanding": 0, "blacklisted": 0})
+
+    def test_prune_expired_before(self):
+        deleted = TokenService.prune_expired(before=timezone.now() - datetime.timedelta(days=2))
+        self.assertEqual(deleted, {"outstanding": 0, "blacklisted": 0})
+        self.assertEqual(OutstandingToken.objects.count(), 10)
+
+    def test_prune_tokens_command(self):
+        stdout = io.StringIO()
+        call_command("prune_tokens", "--batch-size", "4", stdout=stdout)
+        self.assertIn("Pruned 6 expired token(s), 3 blacklisted; 4 outstanding / 2 blacklisted remain.", stdout.getvalue())
+        self.assertOnlyLiveTokensRemain()
+        self.assertEqual(TokenService.table_sizes(), {"outstanding": 4, "blacklisted": 2})
+
+
+class TokenBlacklistTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch.object(token_service, "_blacklisted", _BlacklistLRU(10))
+        self.lru = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_lru_evicts_the_least_recently_seen_jti(self):
+        lru = _BlacklistLRU(2)
+        lru.add("a")
+        lru.add("b")
+        self.assertIn("a", lru)  # "b" is now the least recently seen
+        lru.add("c")
+        self.assertNotIn("b", lru)
+        self.assertIn("a", lru)
+        self.assertIn("c", lru)
+        lru.add("a")
+        lru.add("d")
+        self.assertNotIn("c", lru)
+        self.assertIn("a", lru)
+
+    def test_blacklisted_jtis_are_answered_without_the_database(self):
+        token = RefreshToken.for_user(self.user)
+        jti = token["jti"]
+        with self.captureOnCommitCallbacks(execute=True):
+            TokenService.blacklist(token, self.user)
+        with self.assertNumQueries(0):
+            self.assertTrue(TokenService.is_blacklisted(jti))
+        self.assertIn(jti, self.lru)
+
+        # Another process: its LRU has not seen the jti, the shared cache has.
+        with mock.patch.object(token_service, "_blacklisted", _BlacklistLRU(10)) as lru:
+            with self.assertNumQueries(0):
+                self.assertTrue(TokenService.is_blacklisted(jti))
+            self.assertIn(jti, lru)
+
+    def test_jti_unknown_to_the_caches_is_looked_up(self):
+        token = RefreshToken.for_user(self.user)
+        jti = token["jti"]
+        with self.captureOnCommitCallbacks(execute=True):
+            TokenService.blacklist(token, self.user)
+        # Evicted from both caches: a replayed token is still refused, and remembered again.
+        cache.clear()
+        with mock.patch.object(token_service, "_blacklisted", _BlacklistLRU(10)):
+            with self.assertNumQueries(1):
+                self.assertTrue(TokenService.is_blacklisted(jti))
+            with self.assertNumQueries(0):
+                self.assertTrue(TokenService.is_blacklisted(jti))
+
+        live = RefreshToken.for_user(self.user)["jti"]
+        with self.assertNumQueries(1):
+            self.assertFalse(TokenService.is_blacklisted(live))
+        self.assertNotIn(live, self.lru)
@@ -0,0 +1,129 @@
+"""
+TeamTrack – User / auth view tests.
+"""
+import time
+from unittest import mock
+
+from django.db import IntegrityError
+from django.conf import settings
+from django.test import TestCase
+from rest_framework.test import APIClient
+
+from core.testing import assert_async_view_matches, assert_within_query_budget
+from apps.users.models import User
+from apps.users.services import auth_service
+from apps.users.views.user_views import MeView
+
+LOGIN_URL = "/api/v1/auth/login/"
+REGISTER_URL = "/api/v1/auth/register/"
+INVITE_URL = "/api/v1/users/invite/"
+ACCEPT_INVITE_URL = "/api/v1/auth/invite/accept/"
+ME_URL = "/api/v1/users/me/"
+
+
+class LoginHashingSlotTests(TestCase):
+    """Logins beyond LOGIN_CONCURRENCY are refused at once instead of queueing for a slot."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+
+    def hold_every_slot(self):
+        for _ in range(settings.LOGIN_CONCURRENCY):
+            self.assertTrue(auth_service._hashing_slots.acquire(blocking=False))
+            self.addCleanup(auth_service._hashing_slots.release)
+
+    def login(self):
+        return APIClient().post(LOGIN_URL, {"email": self.user.email, "password": "pass12345"}, format="json")
+
+    def test_busy_slots_refuse_without_waiting(self):
+        self.hold_every_slot()
+        started = time.perf_counter()
+        response = self.login()
+        self.assertLess(time.perf_counter() - started, 0.5)
+        self.assertEqual(response.status_code, 429, response.content)
+        self.assertEqual(response["Retry-After"], "1")
+
+    def test_free_slot_logs_in(self):
+        response = self.login()
+        self.assertEqual(response.status_code, 200, response.content)
+
+
+class UserInviteTests(TestCase):
+    """Bulk invite, then each invited user sets a password with their invite token."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create_user(
+            username="admin", email="admin@example.com", password="pass12345", role=User.Role.ADMIN
+        )
+        User.objects.create_user(username="taken", email="taken@example.com", password="pass12345")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def invite(self, *emails) -> list:
+        response = self.client.post(INVITE_URL, {"users": [{"email": email} for email in emails]}, format="json")
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        return response.json()["data"]["results"]
+
+    def accept(self, token: str, password: str = "n3w-Passw0rd!"):
+        return APIClient().post(ACCEPT_INVITE_URL, {"token": token, "password": password}, format="json")
+
+    def test_invite_reports_taken_and_repeated_emails(self):
+        results = self.invite("new@example.com", "Taken@example.com", "new@example.com")
+        self.assertEqual([result["success"] for result in results], [True, False, False])
+        self.assertEqual([result.get("code") for result in results], [None, "email_taken", "duplicate_email"])
+        invited = User.objects.get(email="new@example.com")
+        self.assertEqual(results[0]["id"], invited.pk)
+        self.assertFalse(invited.has_usable_password())
+        self.assertTrue(results[0]["invite_token"])
+
+    def test_invited_user_sets_a_password_once_and_logs_in(self):
+        token = self.invite("new@example.com")[0]["invite_token"]
+        response = self.accept(token)
+        self.assertEqual(response.status_code, 200, response.content)
+        assert_within_query_budget(response)
+        self.assertEqual(response.json()["data"]["user"]["email"], "new@example.com")
+        self.assertTrue(response.json()["data"]["access"])
+
+        response = APIClient().post(
+            LOGIN_URL, {"email": "new@example.com", "password": "n3w-Passw0rd!"}, format="json"
+        )
+        self.assertEqual(response.status_code, 200, response.content)
+
+        response = self.accept(token, "an0ther-Passw0rd!")
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertEqual(response.json()["code"], "invite_invalid")
+
+    def test_tampered_token_is_refused(self):
+        token = self.invite("new@example.com")[0]["invite_token"]
+        response = self.accept(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertEqual(response.json()["code"], "invite_invalid")
+
+
+class RegisterTests(TestCase):
+    def register(self, email: str):
+        return APIClient().post(REGISTER_URL, {"email": email, "password": "n3w-Passw0rd!"}, format="json")
+
+    def test_taken_email_is_a_validation_error(self):
+        self.assertEqual(self.register("new@example.com").status_code, 201)
+        response = self.register("New@example.com")
+        self.assertEqual(response.status_code, 400, response.content)
+        self.assertIn("email", response.json()["errors"])
+
+    def test_other_integrity_errors_are_not_reported_as_a_taken_email(self):
+        error = IntegrityError("NOT NULL constraint failed: users_user.first_name")
+        with mock.patch.object(User, "save", side_effect=error):
+            response = self.register("new@example.com")
+        self.assertEqual(response.status_code, 500, response.content)
+
+
+class MeViewTests(TestCase):
+    def test_async_view_answers_like_the_sync_view(self):
+        user = User.objects.create_user(username="member", email="member@example.com", password="pass12345")
+        response = assert_async_view_matches(MeView, user, ME_URL)
+        self.assertEqual(response.data["data"]["email"], "member@example.com")
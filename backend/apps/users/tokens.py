@@ -0,0 +1,59 @@
+"""
+TeamTrack – Tokens.
+CachedBlacklistRefreshToken: simplejwt's RefreshToken with the blacklist check answered by
+TokenService (front cache for known-blacklisted tokens).
+Access-token claims:
+With settings.JWT_ACCESS_CLAIMS, access tokens also carry the user's role and a versioned digest
+of the projects they can see / modify (ProjectService.get_access_claims). Task endpoints then
+answer project access checks from the verified token instead of the database; a token whose
+role or membership version is no longer current (role change, add_member / remove_member,
+project created or deleted) is still valid but its claims are ignored until the next refresh.
+That version lives in the cache, so claims are only issued and honoured with a shared cache
+backend (access_claims_enabled): with LocMemCache a membership removed through one worker would
+leave the claims current in every other worker.
+"""
+from django.conf import settings
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from core.cache import is_shared_cache
+
+ROLE_CLAIM = "role"
+ACCESS_CLAIM = "prj"
+
+
+class CachedBlacklistRefreshToken(RefreshToken):
+    def check_blacklist(self) -> None:
+        from apps.users.services import TokenService
+
+        if TokenService.is_blacklisted(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+
+
+def access_claims_enabled() -> bool:
+    """settings.JWT_ACCESS_CLAIMS, in effect only with a shared cache (see module docstring)."""
+    return settings.JWT_ACCESS_CLAIMS and is_shared_cache()
+
+
+def add_access_claims(token, user) -> None:
+    """Add the role and project-access claims to an access token (no-op with claims off)."""
+    from apps.projects.services import ProjectService
+
+    if not access_claims_enabled():
+        return
+    token[ROLE_CLAIM] = user.role
+    claims = ProjectService.get_access_claims(user)
+    if claims is not None:
+        token[ACCESS_CLAIM] = claims
+
+
+def with_access_claims(access: str, user=None) -> str:
+    """Re-issue a freshly minted access token (e.g. by RefreshSerializer) with current claims."""
+    from apps.users.services import UserService
+
+    if not access_claims_enabled():
+        return access
+    token = AccessToken(access)
+    add_access_claims(token, user or UserService.get_user_by_id(token[api_settings.USER_ID_CLAIM]))
+    return str(token)
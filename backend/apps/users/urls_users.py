@@ -4,10 +4,11 @@ Mounted at /api/v1/users/
 """
 from django.urls import path
 
-from apps.users.views.user_views import MeView, UserListView, UserDetailView
+from apps.users.views.user_views import MeView, UserInviteView, UserListView, UserDetailView
 
 urlpatterns = [
     path("me/", MeView.as_view(), name="users-me"),
+    path("invite/", UserInviteView.as_view(), name="users-invite"),
     path("<int:pk>/", UserDetailView.as_view(), name="users-detail"),
     path("", UserListView.as_view(), name="users-list"),
 ]
@@ -1,25 +1,33 @@
 """
-TeamTrack – Auth views (register, login, refresh, logout).
+TeamTrack – Auth views (register, accept invite, login, refresh, logout).
 Request handling only; business logic in AuthService; tokens via simplejwt.
 """
+from django.db import transaction
 from rest_framework import status
 from rest_framework.permissions import AllowAny
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 from rest_framework_simplejwt.tokens import RefreshToken
 
 from core.responses import success_response
 from core.exceptions import ValidationError as APIValidationError
 
-from apps.users.serializers import RegisterSerializer, LoginSerializer, UserProfileSerializer
-from apps.users.services import AuthService
+from apps.users.serializers import (
+    RegisterSerializer,
+    AcceptInviteSerializer,
+    LoginSerializer,
+    RefreshSerializer,
+    UserProfileSerializer,
+)
+from apps.users.services import AuthService, TokenService
+from apps.users.tokens import CachedBlacklistRefreshToken, add_access_claims, with_access_claims
 
 
 class RegisterView(APIView):
     """POST /api/v1/auth/register/ – create user and return tokens."""
     permission_classes = [AllowAny]
+    query_budget = 3
 
     def post(self, request: Request) -> Response:
         serializer = RegisterSerializer(data=request.data)
@@ -29,8 +37,9 @@ class RegisterView(APIView):
                 code="validation_error",
                 details=serializer.errors,
             )
-        user = AuthService.register_user(serializer.validated_data)
-        tokens = _tokens_for_user(user)
+        with transaction.atomic():
+            user = AuthService.register_user(serializer.validated_data)
+            tokens = _tokens_for_user(user)
         return success_response(
             data={
                 "user": UserProfileSerializer(user).data,
@@ -41,9 +50,37 @@ class RegisterView(APIView):
         )
 
 
+class AcceptInviteView(APIView):
+    """
+    POST /api/v1/auth/invite/accept/ – an invited user sets their password with the invite token
+    from POST /api/v1/users/invite/ and gets tokens. Body: {"token": ..., "password": ...}
+    """
+    permission_classes = [AllowAny]
+    query_budget = 3
+
+    def post(self, request: Request) -> Response:
+        serializer = AcceptInviteSerializer(data=request.data)
+        if not serializer.is_valid():
+            raise APIValidationError(
+                message="Validation failed",
+                code="validation_error",
+                details=serializer.errors,
+            )
+        user = AuthService.accept_invite(serializer.validated_data["token"], serializer.validated_data["password"])
+        tokens = _tokens_for_user(user)
+        return success_response(
+            data={
+                "user": UserProfileSerializer(user).data,
+                "access": tokens["access"],
+                "refresh": tokens["refresh"],
+            },
+        )
+
+
 class LoginView(APIView):
     """POST /api/v1/auth/login/ – authenticate and return tokens."""
     permission_classes = [AllowAny]
+    query_budget = 3  # 2, plus the project-access digest with JWT_ACCESS_CLAIMS
 
     def post(self, request: Request) -> Response:
         serializer = LoginSerializer(data=request.data, context={"request": request})
@@ -67,9 +104,10 @@ class LoginView(APIView):
 class RefreshView(APIView):
     """POST /api/v1/auth/refresh/ – return new access (and optionally refresh) token."""
     permission_classes = [AllowAny]
+    query_budget = 10  # 9, plus the project-access digest with JWT_ACCESS_CLAIMS
 
     def post(self, request: Request) -> Response:
-        serializer = TokenRefreshSerializer(data=request.data)
+        serializer = RefreshSerializer(data=request.data)
         if not serializer.is_valid():
             raise APIValidationError(
                 message="Invalid or expired refresh token",
@@ -79,7 +117,7 @@ class RefreshView(APIView):
         data = serializer.validated_data
         return success_response(
             data={
-                "access": data["access"],
+                "access": with_access_claims(data["access"], data["user"]),
                 "refresh": data.get("refresh"),
             },
         )
@@ -93,17 +131,18 @@ class LogoutView(APIView):
         refresh_token = request.data.get("refresh")
         if refresh_token:
             try:
-                token = RefreshToken(refresh_token)
-                token.blacklist()
+                TokenService.blacklist(CachedBlacklistRefreshToken(refresh_token), None)
             except Exception:
                 pass  # Invalid token: still return success so client can clear storage
         return success_response(data=None, message="Logged out successfully.")
 
 
 def _tokens_for_user(user):
-    """Generate access and refresh tokens for a user."""
+    """Generate access and refresh tokens for a user (access claims: apps.users.tokens)."""
     refresh = RefreshToken.for_user(user)
+    access = refresh.access_token
+    add_access_claims(access, user)
     return {
-        "access": str(refresh.access_token),
+        "access": str(access),
         "refresh": str(refresh),
     }
@@ -1,7 +1,8 @@
 """
-TeamTrack – User views (me + admin list/detail).
+TeamTrack – User views (me + admin list/detail/invite).
 Request handling only; business logic in UserService.
 """
+from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.request import Request
 from rest_framework.response import Response
@@ -10,27 +11,40 @@ from rest_framework.generics import ListAPIView
 
 from core.responses import success_response
 from core.exceptions import ValidationError as APIValidationError
+from core.fieldsets import SparseFieldsetMixin
+from core.views import AsyncAPIView
 from core.permissions import IsAdminUser
 
 from apps.users.serializers import (
     UserProfileSerializer,
     UserListSerializer,
     UserAdminUpdateSerializer,
+    UserInviteSerializer,
+    UserInviteBulkSerializer,
 )
 from apps.users.services import UserService
 
 
-class MeView(APIView):
+class MeView(AsyncAPIView):
     """GET /api/v1/users/me/ – current user profile. PATCH – update profile."""
     permission_classes = [IsAuthenticated]
+    query_budget = {"GET": 1, "PATCH": 3}
 
     def get(self, request: Request) -> Response:
         serializer = UserProfileSerializer(request.user)
         return success_response(data=serializer.data)
 
+    async def aget(self, request: Request) -> Response:
+        """Async get (settings.API_ASYNC_VIEWS): the user was loaded by authentication."""
+        return self.get(request)
+
     def patch(self, request: Request) -> Response:
+        # Save onto a freshly loaded row: request.user may come from the authentication cache.
+        # Only the submitted profile fields are written (email is read-only, so the projects
+        # showing it need no version bump: apps.projects.signals).
+        user = UserService.get_user_by_id(request.user.pk)
         serializer = UserProfileSerializer(
-            request.user,
+            user,
             data=request.data,
             partial=True,
         )
@@ -40,14 +54,19 @@ class MeView(APIView):
                 code="validation_error",
                 details=serializer.errors,
             )
-        serializer.save()
+        for field, value in serializer.validated_data.items():
+            setattr(user, field, value)
+        user.save(update_fields=list(serializer.validated_data))
+        UserService.bump_user_version(user.pk)
         return success_response(data=serializer.data)
 
 
-class UserListView(ListAPIView):
-    """GET /api/v1/users/ – admin list all users (paginated, optional filters)."""
+class UserListView(SparseFieldsetMixin, ListAPIView):
+    """GET /api/v1/users/ – admin list all users (paginated, optional filters, ?fields= / ?exclude=)."""
     permission_classes = [IsAdminUser]
+    query_budget = 3
     serializer_class = UserListSerializer
+    cursor_ordering = ("-date_joined", "-id")
 
     def get_queryset(self):
         role = self.request.query_params.get("role")
@@ -55,12 +74,13 @@ class UserListView(ListAPIView):
         is_active = None
         if is_active_param is not None:
             is_active = str(is_active_param).lower() in ("true", "1", "yes")
-        return UserService.list_users(role=role, is_active=is_active)
+        return self.apply_fieldset(UserService.list_users(role=role, is_active=is_active))
 
 
 class UserDetailView(APIView):
     """GET /api/v1/users/<id>/ – admin retrieve. PATCH – admin update role/is_active."""
     permission_classes = [IsAdminUser]
+    query_budget = {"GET": 2, "PATCH": 3}
 
     def get(self, request: Request, pk: int) -> Response:
         user = UserService.get_user_by_id(pk)
@@ -83,3 +103,41 @@ class UserDetailView(APIView):
             is_active=data.get("is_active"),
         )
         return success_response(data=UserListSerializer(user).data)
+
+
+class UserInviteView(APIView):
+    """
+    POST /api/v1/users/invite/ – admin creates many users at once (no password until one is set).
+    Body: {"users": [{"email": ..., "first_name": ..., "last_name": ..., "role": ...}]}
+    Valid rows are created, the others reported (invalid, repeated in the request, or email
+    already taken). Results are returned per row, in request order; each created row carries an
+    invite_token for the user to set a password with (POST /api/v1/auth/invite/accept/).
+    """
+    permission_classes = [IsAdminUser]
+    query_budget = 4  # independent of the number of users (SQLite splits INSERTs over ~100 rows)
+
+    def post(self, request: Request) -> Response:
+        envelope = UserInviteBulkSerializer(data=request.data)
+        if not envelope.is_valid():
+            raise APIValidationError(
+                message="Validation failed",
+                code="validation_error",
+                details=envelope.errors,
+            )
+        items = []
+        for index, row in enumerate(envelope.validated_data["users"]):
+            item = {"index": index, "data": None, "errors": None}
+            serializer = UserInviteSerializer(data=row)
+            if serializer.is_valid():
+                item["data"] = serializer.validated_data
+            else:
+                item["errors"] = serializer.errors
+                item["data"] = {"email": row.get("email")}
+            items.append(item)
+
+        results = UserService.invite_users(items)
+        created = sum(1 for result in results if result["success"])
+        return success_response(
+            data={"results": results, "created": created, "failed": len(results) - created},
+            status_code=status.HTTP_200_OK,
+        )
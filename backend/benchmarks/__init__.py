@@ -0,0 +1,20 @@
+"""
+TeamTrack – Performance benchmarks.
+Standalone scripts run from backend/, e.g. `python -m benchmarks.renderers`.
+API suite: `python -m benchmarks.datagen` seeds an SQLite database, then
+`python -m benchmarks.suite` runs the scenarios and compares them with baseline.json;
+`python -m benchmarks.login` measures password hashing and login throughput;
+`python -m benchmarks.search` times task search query shapes on a 1M-task database.
+"""
+import os
+
+
+def setup_django(settings_module: str = "config.settings.development"):
+    """
+    Configure Django for a benchmark script. Defaults to manage.py's settings module; the
+    suite passes "benchmarks.settings" (seeded SQLite database). DJANGO_SETTINGS_MODULE wins.
+    """
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+
+    django.setup()
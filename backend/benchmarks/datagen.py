@@ -0,0 +1,216 @@
+"""
+TeamTrack – Benchmark data generator.
+Seeds the benchmark database with users, projects and tasks whose shape follows a typical
+deployment: a few admins, team sizes skewed towards 4–8 people with some users in many
+projects, task counts per project skewed (a few large projects, a long tail of small ones),
+most tasks assigned, nearly half done, a quarter without a due date, timestamps spread over
+the last six months. Output is deterministic for a given --seed and sizes, so query counts
+are comparable between runs.
+
+Usage (from backend/): python -m benchmarks.datagen [--users 300] [--projects 60] [--tasks 30000] [--seed 42]
+"""
+import argparse
+import datetime
+import random
+import time
+
+from benchmarks import setup_django
+
+PASSWORD = "bench-password-123"
+EMAIL_DOMAIN = "bench.teamtrack.test"
+BATCH_SIZE = 2000
+
+WORDS = (
+    "api auth backend billing bug cache cleanup client dashboard database deploy design docs "
+    "email export feature fix frontend import index invoice login migration mobile monitoring "
+    "onboarding payment performance permissions refactor release report review search security "
+    "settings signup sync test timeout upload user webhook"
+).split()
+STATUSES = (("TODO", 35), ("IN_PROGRESS", 20), ("DONE", 45))
+PRIORITIES = (("LOW", 30), ("MEDIUM", 50), ("HIGH", 20))
+TEAM_SIZES = ((2, 5), (3, 10), (4, 16), (5, 18), (6, 16), (8, 12), (12, 10), (20, 8), (40, 5))
+
+
+def weighted(rng: random.Random, choices) -> str:
+    values, weights = zip(*choices)
+    return rng.choices(values, weights=weights)[0]
+
+
+def sentence(rng: random.Random, low: int, high: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randint(low, high)))
+
+
+class _FixedTimestamps:
+    """Let bulk_create keep explicit created_at / updated_at (auto_now fields overwrite them)."""
+
+    def __init__(self, *models):
+        self.fields = [
+            field for model in models for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        ]
+
+    def __enter__(self):
+        self.saved = [(field, field.auto_now, field.auto_now_add) for field in self.fields]
+        for field in self.fields:
+            field.auto_now = field.auto_now_add = False
+
+    def __exit__(self, *exc_info):
+        for field, auto_now, auto_now_add in self.saved:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def generate(users: int = 300, projects: int = 60, tasks: int = 30000, seed: int = 42) -> dict:
+    """Replace the database contents with a generated data set. Returns the row counts."""
+    from django.contrib.auth.hashers import make_password
+    from django.core.management import call_command
+    from django.db import transaction
+    from django.utils import timezone
+
+    from apps.projects.models import Project, ProjectMember
+    from apps.tasks.models import Task, TaskDeletion
+    from apps.tasks.services import TaskStatsService
+    from apps.tasks.services.task_search import install_task_search
+    from apps.users.models import User
+
+    rng = random.Random(seed)
+    now = timezone.now().replace(microsecond=0)
+    today = now.date()
+
+    call_command("migrate", run_syncdb=True, verbosity=0)
+    call_command("flush", interactive=False, verbosity=0)
+    password = make_password(PASSWORD)  # one hash for everyone: hashing is not what is being seeded
+
+    def moment(days_ago_max: int) -> datetime.datetime:
+        return now - datetime.timedelta(seconds=rng.randint(0, days_ago_max * 86400))
+
+    with transaction.atomic(), _FixedTimestamps(User, Project, ProjectMember, Task):
+        admins = max(1, users // 50)
+        User.objects.bulk_create(
+            [
+                User(
+                    email=f"{'admin' if index < admins else 'user'}{index:04d}@{EMAIL_DOMAIN}",
+                    username=f"{'admin' if index < admins else 'user'}{index:04d}",
+                    first_name=rng.choice(WORDS).title(),
+                    last_name=rng.choice(WORDS).title(),
+                    role=User.Role.ADMIN if index < admins else User.Role.TEAM_MEMBER,
+                    password=password,
+                    date_joined=moment(365),
+                )
+                for index in range(users)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        user_ids = list(User.objects.order_by("id").values_list("id", flat=True))
+        members = user_ids[admins:] or user_ids
+        # Popularity skew: low-index users belong to many projects, the tail to few.
+        popularity = [1 / (rank + 1) ** 0.6 for rank in range(len(members))]
+
+        created = [moment(180) for _ in range(projects)]
+        Project.objects.bulk_create(
+            [
+                Project(
+                    name=f"{sentence(rng, 1, 3).title()} {index + 1:03d}",
+                    description=sentence(rng, 5, 20),
+                    status=Project.Status.ARCHIVED if rng.random() < 0.15 else Project.Status.ACTIVE,
+                    created_by_id=rng.choice(members),
+                    created_at=created[index],
+                    updated_at=created[index] + (now - created[index]) * rng.random(),
+                )
+                for index in range(projects)
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        project_rows = list(Project.objects.order_by("id").values("id", "created_by_id", "created_at"))
+
+        memberships = []
+        project_members = {}
+        for project in project_rows:
+            size = min(weighted(rng, TEAM_SIZES), len(members))
+            team = {project["created_by_id"]}
+            while len(team) < size:
+                team.add(rng.choices(members, weights=popularity)[0])
+            project_members[project["id"]] = sorted(team)
+            for user_id in project_members[project["id"]]:
+                is_owner = user_id == project["created_by_id"]
+                memberships.append(
+                    ProjectMember(
+                        project_id=project["id"],
+                        user_id=user_id,
+                        role=(
+                            ProjectMember.Role.PROJECT_ADMIN if is_owner or rng.random() < 0.15
+                            else ProjectMember.Role.MEMBER
+                        ),
+                        joined_at=project["created_at"],
+                    )
+                )
+        ProjectMember.objects.bulk_create(memberships, batch_size=BATCH_SIZE)
+
+        # Task volume per project: Zipf-like, so a few projects hold most tasks.
+        shares = [1 / (rank + 1) ** 0.8 for rank in range(len(project_rows))]
+        rng.shuffle(shares)
+        task_projects = rng.choices(project_rows, weights=shares, k=tasks)
+        batch = []
+        for project in task_projects:
+            team = project_members[project["id"]]
+            created_at = project["created_at"] + (now - project["created_at"]) * rng.random()
+            batch.append(
+                Task(
+                    project_id=project["id"],
+                    title=f"{sentence(rng, 2, 6).capitalize()}",
+                    description=sentence(rng, 0, 40),
+                    status=weighted(rng, STATUSES),
+                    priority=weighted(rng, PRIORITIES),
+                    due_date=None if rng.random() < 0.25 else today + datetime.timedelta(days=rng.randint(-30, 60)),
+                    assigned_to_id=None if rng.random() < 0.15 else rng.choice(team),
+                    created_by_id=rng.choice(team),
+                    created_at=created_at,
+                    updated_at=created_at + (now - created_at) * rng.random() ** 2,
+                )
+            )
+            if len(batch) >= BATCH_SIZE:
+                Task.objects.bulk_create(batch)
+                batch = []
+        Task.objects.bulk_create(batch)
+        TaskDeletion.objects.all().delete()
+
+    install_task_search(rebuild=True)
+    TaskStatsService.rebuild()
+    return dataset_counts()
+
+
+def dataset_counts() -> dict:
+    """Row counts of the seeded tables (recorded with baselines)."""
+    from apps.projects.models import Project, ProjectMember
+    from apps.tasks.models import Task
+    from apps.users.models import User
+
+    return {
+        "users": User.objects.count(),
+        "projects": Project.objects.count(),
+        "memberships": ProjectMember.objects.count(),
+        "tasks": Task.objects.count(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=300)
+    parser.add_argument("--projects", type=int, default=60)
+    parser.add_argument("--tasks", type=int, default=30000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    setup_django("benchmarks.settings")
+    from django.conf import settings
+
+    started = time.perf_counter()
+    counts = generate(users=args.users, projects=args.projects, tasks=args.tasks, seed=args.seed)
+    print(
+        f"Seeded {settings.DATABASES['default']['NAME']} in {time.perf_counter() - started:.1f} s: "
+        + ", ".join(f"{count} {name}" for name, count in counts.items())
+    )
+    print(f"Every user's password is {PASSWORD!r}.")
+
+
+if __name__ == "__main__":
+    main()
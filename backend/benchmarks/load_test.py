@@ -0,0 +1,222 @@
+"""
+TeamTrack – HTTP load test: WSGI (gunicorn threads) versus ASGI (uvicorn), sync versus async views.
+Sends authenticated GETs over keep-alive connections from --concurrency client threads for
+--duration seconds and reports requests/sec and latency percentiles per server and path.
+
+Against a server that is already running:
+    python -m benchmarks.load_test --url http://127.0.0.1:8000 --email admin@example.com --password ...
+Starting the servers itself (one after the other, same database and settings):
+    python -m benchmarks.load_test --serve wsgi asgi asgi-async --workers 2 --threads 8 --email ... --password ...
+Paths default to the async read endpoints (project and task lists, /users/me/, dashboard
+summary); `{project}` in a path is replaced by the first project visible to the user.
+The client runs on the same machine: keep --concurrency moderate, and compare servers on one
+host and database rather than reading absolute numbers.
+"""
+import argparse
+import http.client
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+
+from benchmarks.report import percentiles
+
+DEFAULT_PATHS = [
+    "/api/v1/projects/",
+    "/api/v1/projects/{project}/tasks/",
+    "/api/v1/users/me/",
+    "/api/v1/dashboard/summary/",
+]
+
+WSGI_COMMAND = [
+    "gunicorn", "config.wsgi:application", "--worker-class", "gthread",
+    "--workers", "{workers}", "--threads", "{threads}", "--bind", "127.0.0.1:{port}", "--log-level", "warning",
+]
+ASGI_COMMAND = [
+    "gunicorn", "config.asgi:application", "--worker-class", "uvicorn.workers.UvicornWorker",
+    "--workers", "{workers}", "--bind", "127.0.0.1:{port}", "--log-level", "warning",
+]
+
+# name: (command, extra environment)
+SERVERS = {
+    # Sync views on gunicorn threads: each request holds a worker thread for its whole duration.
+    "wsgi": (WSGI_COMMAND, {}),
+    # Sync views under ASGI: Django runs each one in the worker's thread pool.
+    "asgi": (ASGI_COMMAND, {"API_ASYNC_VIEWS": "false"}),
+    # Async handlers of the AsyncAPIView endpoints on the event loop (settings.API_ASYNC_VIEWS).
+    "asgi-async": (ASGI_COMMAND, {"API_ASYNC_VIEWS": "true"}),
+}
+
+
+def request(connection, method: str, path: str, headers: dict, body=None):
+    connection.request(method, path, body=body, headers=headers)
+    response = connection.getresponse()
+    return response.status, response.read()
+
+
+def login(url: str, email: str, password: str) -> str:
+    parts = urllib.parse.urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    body = json.dumps({"email": email, "password": password})
+    status, content = request(connection, "POST", "/api/v1/auth/login/", {"Content-Type": "application/json"}, body)
+    connection.close()
+    if status != 200:
+        raise SystemExit(f"Login failed ({status}): {content[:200]!r}")
+    return json.loads(content)["data"]["access"]
+
+
+def resolve_paths(url: str, headers: dict, paths: list) -> list:
+    """Fill in {project} with the first project the user can see."""
+    if not any("{project}" in path for path in paths):
+        return paths
+    parts = urllib.parse.urlsplit(url)
+    connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+    status, content = request(connection, "GET", "/api/v1/projects/?fields=id&page_size=1", headers)
+    connection.close()
+    results = json.loads(content)["data"]["results"] if status == 200 else []
+    if not results:
+        raise SystemExit("No project visible to the load-test user; seed data first.")
+    return [path.replace("{project}", str(results[0]["id"])) for path in paths]
+
+
+def run_load(url: str, headers: dict, path: str, concurrency: int, duration: float) -> dict:
+    """Hammer one path from concurrency keep-alive clients; return throughput and latency stats."""
+    parts = urllib.parse.urlsplit(url)
+    latencies = [[] for _ in range(concurrency)]
+    errors = [0] * concurrency
+    start_barrier = threading.Barrier(concurrency + 1)
+    deadline = [0.0]
+
+    def client(index: int):
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+        start_barrier.wait()
+        while time.perf_counter() < deadline[0]:
+            started = time.perf_counter()
+            try:
+                status, _ = request(connection, "GET", path, headers)
+            except (OSError, http.client.HTTPException):
+                connection.close()
+                connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=60)
+                status = None
+            latencies[index].append(time.perf_counter() - started)
+            if status != 200:
+                errors[index] += 1
+        connection.close()
+
+    threads = [threading.Thread(target=client, args=(index,), daemon=True) for index in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    began = time.perf_counter()
+    deadline[0] = began + duration
+    start_barrier.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    samples = [latency for client_latencies in latencies for latency in client_latencies]
+    if not samples:
+        return {"requests": 0, "errors": 0, "rps": 0.0, "p50": 0.0, "p99": 0.0, "max": 0.0}
+    cuts = percentiles(samples, (50, 99))
+    return {
+        "requests": len(samples),
+        "errors": sum(errors),
+        "rps": len(samples) / elapsed,
+        "p50": cuts[50] * 1000,
+        "p99": cuts[99] * 1000,
+        "max": max(samples) * 1000,
+    }
+
+
+def start_server(kind: str, args) -> subprocess.Popen:
+    backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    command, extra_env = SERVERS[kind]
+    command = [part.format(workers=args.workers, threads=args.threads, port=args.port) for part in command]
+    env = {**os.environ, **extra_env}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "config.settings.development")
+    process = subprocess.Popen(command, cwd=backend_dir, env=env, start_new_session=True)
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise SystemExit(f"{kind} server exited with status {process.returncode}.")
+        try:
+            http.client.HTTPConnection("127.0.0.1", args.port, timeout=1).request("HEAD", "/")
+            return process
+        except OSError:
+            time.sleep(0.2)
+    stop_server(process)
+    raise SystemExit(f"{kind} server did not start listening on port {args.port}.")
+
+
+def stop_server(process: subprocess.Popen) -> None:
+    os.killpg(process.pid, signal.SIGTERM)
+    try:
+        process.wait(timeout=15)
+    except subprocess.TimeoutExpired:
+        os.killpg(process.pid, signal.SIGKILL)
+        process.wait()
+
+
+def benchmark(label: str, url: str, args) -> list:
+    token = args.token or login(url, args.email, args.password)
+    headers = {"Authorization": f"Bearer {token}", "Accept": "application/json"}
+    rows = []
+    for path in resolve_paths(url, headers, args.path or DEFAULT_PATHS):
+        run_load(url, headers, path, args.concurrency, args.warmup)
+        stats = run_load(url, headers, path, args.concurrency, args.duration)
+        rows.append((label, path, stats))
+        print(
+            f"{label:>10} {path:<38} {stats['rps']:>9.1f} {stats['p50']:>9.1f} {stats['p99']:>9.1f} "
+            f"{stats['max']:>9.1f} {stats['requests']:>8} {stats['errors']:>7}",
+            flush=True,
+        )
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://127.0.0.1:8000", help="Server to load (ignored with --serve).")
+    parser.add_argument("--serve", nargs="+", choices=sorted(SERVERS), help="Start these servers in turn and load each.")
+    parser.add_argument("--port", type=int, default=8765, help="Port for servers started with --serve.")
+    parser.add_argument("--workers", type=int, default=2, help="Server worker processes (--serve).")
+    parser.add_argument("--threads", type=int, default=8, help="Threads per WSGI worker (--serve wsgi).")
+    parser.add_argument("--path", action="append", help="Path to load (repeatable; default: the read endpoints).")
+    parser.add_argument("--token", help="Access token (otherwise log in with --email / --password).")
+    parser.add_argument("--email")
+    parser.add_argument("--password")
+    parser.add_argument("--concurrency", type=int, default=16, help="Concurrent keep-alive clients.")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of measured load per path.")
+    parser.add_argument("--warmup", type=float, default=2.0, help="Seconds of unmeasured load per path.")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file.")
+    args = parser.parse_args()
+    if not args.token and not (args.email and args.password):
+        parser.error("pass --token, or --email and --password")
+
+    print(f"{'server':>10} {'path':<38} {'req/s':>9} {'p50 ms':>9} {'p99 ms':>9} {'max ms':>9} {'requests':>8} {'errors':>7}")
+    rows = []
+    if args.serve:
+        url = f"http://127.0.0.1:{args.port}"
+        for kind in args.serve:
+            process = start_server(kind, args)
+            try:
+                rows += benchmark(kind, url, args)
+            finally:
+                stop_server(process)
+    else:
+        rows += benchmark("server", args.url, args)
+
+    if args.json_path:
+        with open(args.json_path, "w") as handle:
+            json.dump(
+                [{"server": label, "path": path, **stats} for label, path, stats in rows],
+                handle,
+                indent=2,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
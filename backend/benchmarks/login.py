@@ -0,0 +1,183 @@
+"""
+TeamTrack – Login throughput benchmark.
+Password hashing dominates POST /auth/login/, so this measures it on its own and end to end:
+  1. hashers: cost of one password check with each configured hasher (PASSWORD_HASHERS, work
+     factors from the PASSWORD_* settings), single-threaded and from --threads threads;
+  2. upgrade: a member whose password was hashed with another hasher logs in, and the stored hash
+     must now use the preferred hasher and work factor;
+  3. logins: --threads threads log in through the real URLconf (test Client, WSGI handler) for
+     --duration seconds against the database seeded by benchmarks.datagen. Hashing is capped at
+     LOGIN_CONCURRENCY per process, so this is one worker's login capacity; refusals (429) are
+     counted separately.
+
+Usage (from backend/):
+    python -m benchmarks.login [--threads 8] [--duration 5]
+    PASSWORD_HASHER=pbkdf2 python -m benchmarks.login      # compare hashers / work factors
+    python -m benchmarks.login --min-rate 20               # CI: exit 1 below 20 logins/s or if the upgrade fails
+"""
+import argparse
+import collections
+import os
+import sys
+import threading
+import time
+
+from benchmarks import setup_django
+from benchmarks.report import percentiles
+
+
+def hasher_costs(threads: int, checks: int) -> list:
+    """[(algorithm, parameters, ms per check, checks/s from threads)] for each usable configured hasher."""
+    from django.contrib.auth.hashers import get_hashers
+
+    from benchmarks.datagen import PASSWORD
+
+    rows = []
+    for hasher in get_hashers():
+        try:
+            encoded = hasher.encode(PASSWORD, hasher.salt())
+        except ValueError:
+            continue  # library not installed (argon2-cffi, bcrypt)
+        parameters = {
+            key: value for key, value in hasher.decode(encoded).items() if key not in ("algorithm", "hash", "salt")
+        }
+        started = time.perf_counter()
+        for _ in range(checks):
+            hasher.verify(PASSWORD, encoded)
+        single = (time.perf_counter() - started) / checks
+
+        def work():
+            for _ in range(checks):
+                hasher.verify(PASSWORD, encoded)
+
+        workers = [threading.Thread(target=work) for _ in range(threads)]
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        rows.append((hasher.algorithm, parameters, single * 1000, threads * checks / (time.perf_counter() - started)))
+    return rows
+
+
+def check_upgrade(user) -> tuple:
+    """Store user's password with a non-preferred hasher, log in, and report (old, new, upgraded)."""
+    from django.contrib.auth.hashers import get_hasher, get_hashers, identify_hasher, make_password
+    from django.test import Client
+
+    from benchmarks.datagen import PASSWORD
+
+    preferred = get_hasher()
+    legacy = next(
+        hasher for hasher in get_hashers()[1:] if hasher.algorithm != preferred.algorithm and _usable(hasher)
+    )
+    user.password = make_password(PASSWORD, hasher=legacy.algorithm)
+    user.save(update_fields=["password"])
+    response = Client().post(
+        "/api/v1/auth/login/", {"email": user.email, "password": PASSWORD}, content_type="application/json"
+    )
+    user.refresh_from_db(fields=["password"])
+    current = identify_hasher(user.password)
+    upgraded = (
+        response.status_code == 200
+        and current.algorithm == preferred.algorithm
+        and not preferred.must_update(user.password)
+    )
+    return legacy.algorithm, current.algorithm, upgraded
+
+
+def _usable(hasher) -> bool:
+    try:
+        hasher.encode("x", hasher.salt())
+    except ValueError:
+        return False
+    return True
+
+
+def run_logins(users: list, threads: int, duration: float) -> tuple:
+    """Log in from threads threads (one user each) for duration seconds: (latencies of 200s, status counts, elapsed)."""
+    from django.db import connections
+    from django.test import Client
+
+    from benchmarks.datagen import PASSWORD
+
+    latencies = []
+    statuses = collections.Counter()
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    def work(email: str):
+        client = Client()
+        body = {"email": email, "password": PASSWORD}
+        try:
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                response = client.post("/api/v1/auth/login/", body, content_type="application/json")
+                elapsed = time.perf_counter() - started
+                with lock:
+                    statuses[response.status_code] += 1
+                    if response.status_code == 200:
+                        latencies.append(elapsed)
+        finally:
+            connections.close_all()
+
+    workers = [threading.Thread(target=work, args=(users[index % len(users)].email,)) for index in range(threads)]
+    began = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return latencies, statuses, time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threads", type=int, default=8, help="Concurrent hash checks / login clients.")
+    parser.add_argument("--checks", type=int, default=10, help="Password checks per thread and hasher.")
+    parser.add_argument("--duration", type=float, default=5.0, help="Seconds of concurrent logins.")
+    parser.add_argument("--login-concurrency", type=int, help="Override LOGIN_CONCURRENCY (hashes at once).")
+    parser.add_argument("--min-rate", type=float, help="Exit with status 1 below this many successful logins/s.")
+    args = parser.parse_args()
+
+    if args.login_concurrency:
+        os.environ["LOGIN_CONCURRENCY"] = str(args.login_concurrency)
+    setup_django("benchmarks.settings")
+    from django.conf import settings
+
+    from apps.users.models import User
+
+    print(
+        f"hasher={settings.PASSWORD_HASHER} login_concurrency={settings.LOGIN_CONCURRENCY} "
+        f"queue_timeout={settings.LOGIN_QUEUE_TIMEOUT_SECONDS}s threads={args.threads} cpus={os.cpu_count()}"
+    )
+    print(f"{'hasher':<24} {'parameters':<44} {'ms/check':>9} {'checks/s':>9}")
+    for algorithm, parameters, single_ms, rate in hasher_costs(args.threads, args.checks):
+        described = " ".join(f"{key}={value}" for key, value in parameters.items())
+        print(f"{algorithm:<24} {described:<44} {single_ms:>9.1f} {rate:>9.1f}")
+
+    users = list(User.objects.filter(role=User.Role.TEAM_MEMBER, is_active=True).order_by("id")[: args.threads])
+    if not users:
+        raise SystemExit("No users: seed the benchmark database with `python -m benchmarks.datagen` first.")
+    old, new, upgraded = check_upgrade(users[0])
+    print(f"upgrade on login: {old} -> {new} {'ok' if upgraded else 'FAILED'}")
+    for user in users[1:]:
+        check_upgrade(user)  # every client starts from a current hash, so the run measures steady state
+
+    latencies, statuses, elapsed = run_logins(users, args.threads, args.duration)
+    rate = len(latencies) / elapsed
+    print(f"logins: {rate:.1f}/s over {elapsed:.1f} s, statuses " + ", ".join(
+        f"{status}={count}" for status, count in sorted(statuses.items())
+    ))
+    if latencies:
+        cuts = percentiles(latencies)
+        print("latency ms: " + " ".join(f"p{point}={value * 1000:.1f}" for point, value in cuts.items()))
+
+    failed = not upgraded
+    if args.min_rate is not None and rate < args.min_rate:
+        print(f"Login throughput {rate:.1f}/s is below --min-rate {args.min_rate}.")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,116 @@
+"""
+TeamTrack – JSON renderer benchmark.
+Times serialize-to-bytes of the success_response envelope for task pages of increasing size,
+comparing DRF's JSONRenderer with FastJSONRenderer (orjson, and its stdlib fallback),
+and checks all of them produce identical bytes. Two payload shapes are measured:
+"serialized" (strings, as produced by the API serializers) and "native" (dates, datetimes,
+Decimal and lazy strings left for the encoder).
+
+Usage (from backend/): python -m benchmarks.renderers [--sizes 1 20 100 1000] [--repeat 200]
+"""
+import argparse
+import datetime
+import decimal
+import time
+
+from benchmarks import setup_django
+
+
+def build_payload(size: int, native: bool) -> dict:
+    """Paginated task-list envelope; native=False pre-formats values the way serializers do."""
+    from django.utils import timezone
+    from django.utils.translation import gettext_lazy
+
+    now = timezone.now()
+    results = [
+        {
+            "id": index,
+            "project": 1,
+            "title": f"Task {index} – déploiement",
+            "description": "Lorem ipsum dolor sit amet " * 4,
+            "status": ("TODO", "IN_PROGRESS", "DONE")[index % 3],
+            "priority": "MEDIUM",
+            "due_date": datetime.date(2026, 1, 1) + datetime.timedelta(days=index % 90),
+            "assigned_to": index % 7 or None,
+            "assigned_to_email": f"user{index % 7}@example.com" if index % 7 else None,
+            "created_by": 1,
+            "created_by_email": "admin@example.com",
+            "created_at": now - datetime.timedelta(minutes=index),
+            "updated_at": now - datetime.timedelta(seconds=index, microseconds=index),
+            "estimate": decimal.Decimal("1.25") * index,
+            "label": gettext_lazy("Task"),
+        }
+        for index in range(size)
+    ]
+    if not native:
+        from rest_framework.renderers import JSONRenderer
+
+        encode = JSONRenderer.encoder_class().default
+        results = [
+            {key: value if value is None or isinstance(value, (int, str)) else encode(value) for key, value in row.items()}
+            for row in results
+        ]
+    return {
+        "success": True,
+        "data": {
+            "results": results,
+            "pagination": {"count": size, "page_size": size, "next": None, "previous": None},
+        },
+    }
+
+
+def best_time(func, repeat: int) -> float:
+    best = None
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 20, 100, 1000], help="Rows per payload.")
+    parser.add_argument("--repeat", type=int, default=200, help="Timed runs per renderer (best is reported).")
+    args = parser.parse_args()
+
+    setup_django()
+    from rest_framework.renderers import JSONRenderer
+
+    from core.renderers import FastJSONRenderer
+
+    stdlib_fallback = FastJSONRenderer()
+    stdlib_fallback.use_orjson = False
+    renderers = {
+        "drf JSONRenderer": JSONRenderer(),
+        "FastJSONRenderer (stdlib)": stdlib_fallback,
+    }
+    if FastJSONRenderer.use_orjson:
+        renderers["FastJSONRenderer (orjson)"] = FastJSONRenderer()
+    else:
+        print("orjson not installed; only the stdlib path is measured.")
+
+    print(f"{'payload':>10} {'rows':>6} {'bytes':>9}  " + "  ".join(f"{name:>26}" for name in renderers) + "  speedup")
+    for native in (False, True):
+        for size in args.sizes:
+            payload = build_payload(size, native)
+            outputs = {name: renderer.render(payload) for name, renderer in renderers.items()}
+            reference = outputs["drf JSONRenderer"]
+            mismatched = [name for name, output in outputs.items() if output != reference]
+            if mismatched:
+                raise SystemExit(f"Output differs from JSONRenderer for {', '.join(mismatched)} at {size} rows.")
+            repeat = max(args.repeat * 100 // max(size, 100), 5)
+            timings = {
+                name: best_time(lambda r=renderer: r.render(payload), repeat) for name, renderer in renderers.items()
+            }
+            speedup = timings["drf JSONRenderer"] / min(timings.values())
+            print(
+                f"{'native' if native else 'serialized':>10} {size:>6} {len(reference):>9}  "
+                + "  ".join(f"{timings[name]:>23.3f} ms" for name in renderers)
+                + f"  {speedup:6.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
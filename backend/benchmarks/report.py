@@ -0,0 +1,96 @@
+"""
+TeamTrack – Benchmark statistics, baseline comparison and report formatting.
+A baseline (benchmarks/baseline.json) stores per-client, per-scenario results of a reference
+run. A scenario regresses when it issues more queries per request than the baseline, or when
+its p95 latency exceeds the baseline by more than the tolerance (and by at least MIN_DELTA_MS,
+so sub-millisecond noise is not reported). Latency baselines are machine-specific: record one
+on the machine that runs the comparison; query counts are portable.
+"""
+import json
+import platform
+import statistics
+
+MIN_DELTA_MS = 1.0
+
+
+def percentiles(samples: list, points=(50, 95, 99)) -> dict:
+    """{point: value} for the given percentiles of samples (inclusive method; any order)."""
+    ordered = sorted(samples)
+    if len(ordered) == 1:
+        return {point: ordered[0] for point in points}
+    cuts = statistics.quantiles(ordered, n=100, method="inclusive")
+    return {point: cuts[point - 1] for point in points}
+
+
+def summarize(latencies: list, queries: list, elapsed: float) -> dict:
+    """Per-scenario result: latencies in seconds, queries per request, elapsed wall time."""
+    cuts = percentiles(latencies)
+    return {
+        "requests": len(latencies),
+        "throughput": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "p50_ms": round(cuts[50] * 1000, 3),
+        "p95_ms": round(cuts[95] * 1000, 3),
+        "p99_ms": round(cuts[99] * 1000, 3),
+        "queries": round(statistics.fmean(queries), 2),
+        "queries_max": max(queries),
+    }
+
+
+def load_baseline(path: str) -> dict:
+    try:
+        with open(path) as handle:
+            return json.load(handle)
+    except FileNotFoundError:
+        return {}
+
+
+def write_baseline(path: str, client: str, results: dict, meta: dict) -> None:
+    """Store results as the baseline for client (other clients' entries are kept)."""
+    baseline = load_baseline(path)
+    baseline.setdefault("results", {})[client] = results
+    baseline.setdefault("meta", {})[client] = {
+        **meta,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+    }
+    with open(path, "w") as handle:
+        json.dump(baseline, handle, indent=2, sort_keys=True)
+        handle.write("\n")
+
+
+def compare(result: dict, reference: dict, tolerance: float) -> list:
+    """Regression labels for one scenario result against its baseline entry."""
+    regressions = []
+    if reference is None:
+        return regressions
+    if result["queries"] > reference["queries"] + 0.01:
+        regressions.append(f"queries {reference['queries']:g} -> {result['queries']:g}")
+    limit = max(reference["p95_ms"] * (1 + tolerance), reference["p95_ms"] + MIN_DELTA_MS)
+    if result["p95_ms"] > limit:
+        regressions.append(f"p95 {reference['p95_ms']:.1f} -> {result['p95_ms']:.1f} ms")
+    return regressions
+
+
+def format_report(client: str, results: dict, baseline: dict, tolerance: float) -> tuple:
+    """Return (report text, number of regressed scenarios)."""
+    reference = baseline.get("results", {}).get(client, {})
+    lines = [
+        f"{'scenario':<20} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} "
+        f"{'vs baseline p95':>16}  status"
+    ]
+    regressed = 0
+    for name, result in results.items():
+        base = reference.get(name)
+        if base is None:
+            change, status = "", "no baseline"
+        else:
+            change = f"{(result['p95_ms'] / base['p95_ms'] - 1) * 100:+.0f}%" if base["p95_ms"] else ""
+            problems = compare(result, base, tolerance)
+            regressed += bool(problems)
+            status = "REGRESSED: " + "; ".join(problems) if problems else "ok"
+        lines.append(
+            f"{name:<20} {result['throughput']:>8.1f} {result['p50_ms']:>8.2f} {result['p95_ms']:>8.2f} "
+            f"{result['p99_ms']:>8.2f} {result['queries']:>8g} {change:>16}  {status}"
+        )
+    return "\n".join(lines), regressed
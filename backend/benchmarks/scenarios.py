@@ -0,0 +1,184 @@
+"""
+TeamTrack – API benchmark scenarios.
+Each scenario builds the request for iteration i (method, path, JSON body, acting user) against
+the data seeded by benchmarks.datagen; benchmarks.suite sends them through the real URLconf.
+Requests carry a real JWT, so authentication is part of every measurement.
+"""
+from benchmarks.datagen import PASSWORD, WORDS
+
+SCENARIOS = {}
+
+
+class Request:
+    """One API call: method, path, optional JSON body, acting user ("admin" / "member"), expected status."""
+
+    __slots__ = ("method", "path", "data", "actor", "expect")
+
+    def __init__(self, method: str, path: str, data=None, actor: str = "member", expect: int = 200):
+        self.method = method
+        self.path = path
+        self.data = data
+        self.actor = actor
+        self.expect = expect
+
+
+class Scenario:
+    def __init__(self, name: str, description: str, build, weight: float = 1.0, prepare=None):
+        self.name = name
+        self.description = description
+        self.build = build  # (context, iteration) -> Request
+        self.weight = weight  # share of the suite's --iterations (login is dominated by hashing)
+        self.prepare = prepare  # (context, requests) -> None, run before the requests (sync, untimed)
+
+
+def scenario(name: str, description: str, weight: float = 1.0, prepare=None):
+    def register(build):
+        SCENARIOS[name] = Scenario(name, description, build, weight, prepare)
+        return build
+    return register
+
+
+class BenchmarkContext:
+    """
+    Actors and ids the scenarios use, looked up from the seeded database:
+    the first admin; the member with the most memberships; that member's largest project
+    among those they administer (bulk edits need modify permission).
+    """
+
+    BULK_SIZE = 25
+
+    def __init__(self):
+        from django.db.models import Count
+
+        from apps.projects.models import Project, ProjectMember
+        from apps.tasks.models import Task
+        from apps.users.models import User
+
+        self.admin = User.objects.filter(role=User.Role.ADMIN).order_by("id").first()
+        self.member = (
+            User.objects.filter(role=User.Role.TEAM_MEMBER)
+            .annotate(memberships=Count("project_memberships"))
+            .order_by("-memberships", "id")
+            .first()
+        )
+        if self.admin is None or self.member is None:
+            raise SystemExit("The benchmark database is empty; run `python -m benchmarks.datagen` first.")
+        project = (
+            Project.objects.filter(
+                members__user=self.member, members__role=ProjectMember.Role.PROJECT_ADMIN
+            )
+            .annotate(task_count=Count("tasks", distinct=True))
+            .order_by("-task_count", "id")
+            .first()
+        )
+        if project is None:
+            raise SystemExit(f"{self.member.email} administers no project; re-seed with more projects.")
+        self.project_id = project.pk
+        self.bulk_task_ids = list(
+            Task.objects.filter(project_id=project.pk).order_by("id").values_list("id", flat=True)[: self.BULK_SIZE]
+        )
+        self.tokens = {"admin": self.access_token(self.admin), "member": self.access_token(self.member)}
+
+    @staticmethod
+    def access_token(user) -> str:
+        """Access token as issued at login (with the access claims when JWT_ACCESS_CLAIMS is on)."""
+        from rest_framework_simplejwt.tokens import RefreshToken
+
+        from apps.users.tokens import add_access_claims
+
+        access = RefreshToken.for_user(user).access_token
+        add_access_claims(access, user)
+        return str(access)
+
+    def describe(self) -> dict:
+        return {"admin": self.admin.email, "member": self.member.email, "project": self.project_id}
+
+    @property
+    def tasks_url(self) -> str:
+        return f"/api/v1/projects/{self.project_id}/tasks/"
+
+
+@scenario("login", "POST /auth/login/ (password check + token pair)", weight=0.1)
+def login(context, iteration):
+    return Request("POST", "/api/v1/auth/login/", {"email": context.member.email, "password": PASSWORD}, actor=None)
+
+
+def issue_refresh_tokens(context, requests):
+    """Rotation makes refresh tokens single-use: issue one per request up front (as login does)."""
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    context.refresh_tokens = [str(RefreshToken.for_user(context.member)) for _ in range(requests)]
+
+
+@scenario("token_refresh", "POST /auth/refresh/ (blacklist check + rotation)", weight=0.5, prepare=issue_refresh_tokens)
+def token_refresh(context, iteration):
+    return Request("POST", "/api/v1/auth/refresh/", {"refresh": context.refresh_tokens[iteration]}, actor=None)
+
+
+@scenario("me", "GET /users/me/")
+def me(context, iteration):
+    return Request("GET", "/api/v1/users/me/")
+
+
+@scenario("dashboard", "GET /dashboard/summary/ as a member")
+def dashboard(context, iteration):
+    return Request("GET", "/api/v1/dashboard/summary/")
+
+
+@scenario("dashboard_admin", "GET /dashboard/summary/ as an admin (every project)")
+def dashboard_admin(context, iteration):
+    return Request("GET", "/api/v1/dashboard/summary/", actor="admin")
+
+
+@scenario("project_list", "GET /projects/")
+def project_list(context, iteration):
+    return Request("GET", "/api/v1/projects/")
+
+
+@scenario("task_list", "GET /projects/<id>/tasks/, pages 1–5")
+def task_list(context, iteration):
+    return Request("GET", f"{context.tasks_url}?page={iteration % 5 + 1}")
+
+
+TASK_FILTERS = (
+    "status=TODO",
+    "status=IN_PROGRESS&priority=HIGH",
+    "assigned_to={member}",
+    "due_date_from={today}&due_date_to={later}",
+    "status=DONE&fields=id,title,status,updated_at",
+    "cursor=&page_size=50",
+)
+
+
+@scenario("task_list_filtered", "GET /projects/<id>/tasks/ with status / assignee / due-date filters and fieldsets")
+def task_list_filtered(context, iteration):
+    import datetime
+
+    today = datetime.date.today()
+    query = TASK_FILTERS[iteration % len(TASK_FILTERS)].format(
+        member=context.member.pk, today=today, later=today + datetime.timedelta(days=14)
+    )
+    return Request("GET", f"{context.tasks_url}?{query}")
+
+
+@scenario("task_search", "GET /projects/<id>/tasks/?search= (one and two words, relevance order)")
+def task_search(context, iteration):
+    first, second = WORDS[iteration % len(WORDS)], WORDS[(iteration * 7 + 3) % len(WORDS)]
+    if iteration % 3 == 0:
+        return Request("GET", f"{context.tasks_url}?search={first}+{second}&ordering=relevance")
+    return Request("GET", f"{context.tasks_url}?search={first}")
+
+
+@scenario("task_bulk_update", f"POST /projects/<id>/tasks/bulk/ updating {BenchmarkContext.BULK_SIZE} tasks")
+def task_bulk_update(context, iteration):
+    priorities = ("LOW", "MEDIUM", "HIGH")
+    statuses = ("TODO", "IN_PROGRESS", "DONE")
+    operations = [
+        {
+            "op": "update",
+            "id": task_id,
+            "data": {"priority": priorities[(iteration + offset) % 3], "status": statuses[(iteration + offset) % 3]},
+        }
+        for offset, task_id in enumerate(context.bulk_task_ids)
+    ]
+    return Request("POST", f"{context.tasks_url}bulk/", {"operations": operations})
@@ -0,0 +1,165 @@
+"""
+TeamTrack – Task search benchmark.
+Times TaskService.list_tasks(search=...) the way GET /projects/<id>/tasks/?search= runs it (first
+page of values() rows plus the page COUNT) on the largest project of a seeded database, with:
+  - like: LIKE '%term%' over title and description (full scan of the project's tasks);
+  - fts5: the backend's queries: `id IN (SELECT rowid ... MATCH)`, in updated_at order or ranked
+    by bm25() looked up in a materialized CTE (one MATCH per query);
+  - fts5 join: ranked by joining the FTS5 table on rowid (QuerySet.extra), for comparison;
+  - fts5 subquery: ranked by bm25() read from a correlated subquery per row, which SQLite runs
+    as one MATCH per row (interrupted after --subquery-timeout seconds).
+Terms cover a common word, a two-word query, a prefix and a substring inside words (which the
+index cannot find, so `fts5` falls back to LIKE when TASK_SEARCH_SUBSTRING_FALLBACK is on).
+
+The data set is generated by benchmarks.datagen with a fixed seed, so runs are reproducible; it is
+written to its own database (default benchmarks/search.sqlite3) and reused while its size matches.
+Seeding 1M tasks takes several minutes and about 1 GB of disk.
+
+Usage (from backend/):
+    python -m benchmarks.search [--tasks 1000000] [--repeat 5] [--database benchmarks/search.sqlite3]
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+from benchmarks import setup_django
+
+TERMS = ("deploy", "release api", "migra", "ploy")
+PAGE_SIZE = 20
+
+
+def subquery_search(queryset, match: str, rank: bool):
+    """Ranked by a correlated bm25() subquery per row, kept to compare against."""
+    from django.db.models import FloatField
+    from django.db.models.expressions import RawSQL
+
+    queryset = queryset.filter(id__in=RawSQL("SELECT rowid FROM tasks_task_fts WHERE tasks_task_fts MATCH %s", (match,)))
+    if rank:
+        queryset = queryset.annotate(
+            search_rank=RawSQL(
+                "SELECT -bm25(tasks_task_fts) FROM tasks_task_fts WHERE tasks_task_fts MATCH %s AND rowid = tasks_task.id",
+                (match,),
+                output_field=FloatField(),
+            )
+        ).order_by("-search_rank", "-updated_at", "-id")
+    return queryset
+
+
+def join_search(queryset, match: str, rank: bool):
+    """Ranked by joining the FTS5 table on rowid (the unary + makes SQLite drive the join from the match)."""
+    from django.db.models import FloatField
+    from django.db.models.expressions import RawSQL
+
+    if not rank:
+        return subquery_search(queryset, match, rank)
+    return queryset.extra(
+        tables=["tasks_task_fts"],
+        where=["+tasks_task_fts.rowid = tasks_task.id", "tasks_task_fts MATCH %s"],
+        params=[match],
+    ).annotate(
+        search_rank=RawSQL("-bm25(tasks_task_fts)", (), output_field=FloatField())
+    ).order_by("-search_rank", "-updated_at", "-id")
+
+
+def time_page(build, repeat: int, timeout: float = None) -> tuple:
+    """
+    (median ms, matching rows) of building the queryset, reading its first page and counting it.
+    A run still going after timeout seconds is interrupted: returns (None, None).
+    """
+    from django.db import OperationalError, connection
+
+    from apps.tasks.serializers import TaskListValuesSerializer
+
+    timings = []
+    for _ in range(repeat):
+        connection.ensure_connection()
+        timer = threading.Timer(timeout, connection.connection.interrupt) if timeout else None
+        if timer:
+            timer.start()
+        started = time.perf_counter()
+        try:
+            queryset = TaskListValuesSerializer.get_queryset(build())
+            list(queryset[:PAGE_SIZE])
+            count = queryset.count()
+        except OperationalError:
+            return None, None
+        finally:
+            if timer:
+                timer.cancel()
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings), count
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=1_000_000, help="Tasks in the generated data set.")
+    parser.add_argument("--projects", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query; the median is reported.")
+    parser.add_argument("--database", help="SQLite file for the data set (default: benchmarks/search.sqlite3).")
+    parser.add_argument(
+        "--subquery-timeout",
+        type=float,
+        default=60.0,
+        help="Seconds after which a `fts5 subquery` run is interrupted (its ranked form is very slow).",
+    )
+    args = parser.parse_args()
+
+    os.environ["BENCHMARK_DATABASE"] = args.database or os.path.join(os.path.dirname(__file__), "search.sqlite3")
+    setup_django("benchmarks.settings")
+    from django.db import DatabaseError, connection
+    from django.db.models import Count
+
+    from apps.projects.models import Project
+    from apps.tasks.models import Task
+    from apps.tasks.services import TaskService
+    from apps.tasks.services.task_search import LikeSearchBackend, SQLiteFTS5SearchBackend, install_task_search
+    from benchmarks.datagen import dataset_counts, generate
+
+    if connection.vendor != "sqlite":
+        raise SystemExit("The search benchmark compares SQLite FTS5 query shapes; run it on SQLite.")
+    try:
+        seeded = dataset_counts()["tasks"] == args.tasks
+    except DatabaseError:  # tables not created yet
+        seeded = False
+    if not seeded:
+        started = time.perf_counter()
+        generate(tasks=args.tasks, projects=args.projects, seed=args.seed)
+        print(f"Seeded {args.tasks} tasks in {time.perf_counter() - started:.0f} s.")
+    install_task_search(backend_name=SQLiteFTS5SearchBackend.name)
+
+    largest = Task.objects.values("project_id").annotate(tasks=Count("id")).order_by("-tasks").first()
+    project = Project.objects.get(pk=largest["project_id"])
+    print(f"database={connection.settings_dict['NAME']} tasks={args.tasks} project={project.pk} ({largest['tasks']} tasks)")
+
+    like, fts = LikeSearchBackend(), SQLiteFTS5SearchBackend()
+    print(f"{'term':<14} {'query':<24} {'order':<10} {'ms':>9} {'rows':>8}")
+    for term in TERMS:
+        match = SQLiteFTS5SearchBackend.match_expression(term)
+        for rank in (False, True):
+            variants = (
+                ("like", lambda: like.filter(TaskService.list_tasks(project), term)),
+                ("fts5", lambda: fts.filter(TaskService.list_tasks(project), term, rank=rank)),
+                ("fts5 join", lambda: join_search(TaskService.list_tasks(project), match, rank)),
+                ("fts5 subquery", lambda: subquery_search(TaskService.list_tasks(project), match, rank)),
+            )
+            for name, build in variants:
+                if not rank and name in ("fts5 join", "fts5 subquery"):
+                    continue  # same query as fts5
+                if rank and name == "like":
+                    continue  # LIKE cannot rank
+                timeout = args.subquery_timeout if name == "fts5 subquery" else None
+                ms, rows = time_page(build, args.repeat, timeout=timeout)
+                order = "relevance" if rank else "updated"
+                if ms is None:
+                    print(f"{term:<14} {name:<24} {order:<10} {'> ' + str(int(timeout * 1000)):>9} {'-':>8}")
+                else:
+                    print(f"{term:<14} {name:<24} {order:<10} {ms:>9.1f} {rows:>8}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
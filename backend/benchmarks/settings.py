@@ -0,0 +1,26 @@
+"""
+TeamTrack – Benchmark settings.
+Development settings on a dedicated SQLite file (BENCHMARK_DATABASE, default
+benchmarks/bench.sqlite3, seeded by `python -m benchmarks.datagen`), with DEBUG and the
+per-request log lines off so timings measure the API rather than the console.
+"""
+import os
+
+from config.settings.development import *  # noqa: F401,F403
+from config.settings.development import BASE_DIR, LOGGING
+
+DEBUG = False
+ALLOWED_HOSTS = ["*"]
+
+DATABASES = {
+    "default": {
+        "ENGINE": "django.db.backends.sqlite3",
+        "NAME": os.getenv("BENCHMARK_DATABASE", str(BASE_DIR / "benchmarks" / "bench.sqlite3")),
+    }
+}
+
+LOGGING = {
+    **LOGGING,
+    "root": {"handlers": ["console"], "level": "WARNING"},
+    "loggers": {"core.middleware": {"handlers": ["console"], "level": "WARNING", "propagate": False}},
+}
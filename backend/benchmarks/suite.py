@@ -0,0 +1,199 @@
+"""
+TeamTrack – API benchmark suite.
+Runs the scenarios in benchmarks.scenarios in-process through the real URLconf and middleware,
+with Django's test Client (WSGI handler) or AsyncClient (ASGI handler), against the database
+seeded by benchmarks.datagen. Requests run one at a time, so the numbers are per-request cost
+(latency and queries), not concurrency; see benchmarks.load_test for servers under load.
+Reports throughput, p50/p95/p99 latency and queries per request, compared with baseline.json.
+
+Usage (from backend/):
+    python -m benchmarks.datagen                  # once: seed benchmarks/bench.sqlite3
+    python -m benchmarks.suite [--client wsgi|asgi|asgi-async] [--scenario task_list ...]
+    python -m benchmarks.suite --check            # exit 1 if a scenario regressed
+    python -m benchmarks.suite --update-baseline  # record this run as the baseline
+    python -m benchmarks.suite --token-claims     # access tokens with role / project claims
+Results are compared with (and stored as) the baseline of the client, suffixed "+claims" with
+--token-claims; run both to see the queries the token claims save per request (the claims need a
+shared cache backend, e.g. CACHE_BACKEND=django.core.cache.backends.redis.RedisCache).
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+
+from benchmarks import setup_django
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+CLIENTS = ("wsgi", "asgi", "asgi-async")
+
+
+class QueryCounter:
+    """Counts queries on every database connection, in any thread, once installed."""
+
+    def __init__(self):
+        self.count = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        with self._lock:
+            self.count += 1
+        return execute(sql, params, many, context)
+
+    def install(self) -> None:
+        from django.db import connections
+        from django.db.backends.signals import connection_created
+
+        # Connections opened later (e.g. the ASGI handler's sync thread) are wrapped when created.
+        connection_created.connect(self._attach, weak=False)
+        for connection in connections.all(initialized_only=True):
+            self._attach(None, connection)
+
+    def _attach(self, sender, connection, **kwargs):
+        if self not in connection.execute_wrappers:
+            connection.execute_wrappers.append(self)
+
+
+class Measurement:
+    def __init__(self, scenario, counter):
+        self.scenario = scenario
+        self.counter = counter
+        self.latencies = []
+        self.queries = []
+
+    def record(self, request, response, started: float, queries_before: int) -> None:
+        self.latencies.append(time.perf_counter() - started)
+        self.queries.append(self.counter.count - queries_before)
+        check(self.scenario, request, response)
+
+
+def check(scenario, request, response) -> None:
+    if response.status_code != request.expect:
+        body = getattr(response, "content", b"")[:300]
+        raise SystemExit(
+            f"{scenario.name}: {request.method} {request.path} returned {response.status_code}, "
+            f"expected {request.expect}: {body!r}"
+        )
+
+
+def request_args(context, request) -> tuple:
+    headers = {"accept": "application/json"}
+    if request.actor:
+        headers["authorization"] = f"Bearer {context.tokens[request.actor]}"
+    if request.data is None:
+        return (request.method, request.path), {"headers": headers}
+    return (request.method, request.path, json.dumps(request.data)), {
+        "content_type": "application/json",
+        "headers": headers,
+    }
+
+
+def run_sync(scenario, context, counter, iterations: int, warmup: int):
+    from django.test import Client
+
+    client = Client()
+    for iteration in range(warmup):
+        request = scenario.build(context, iteration)
+        args, kwargs = request_args(context, request)
+        check(scenario, request, client.generic(*args, **kwargs))
+    measurement = Measurement(scenario, counter)
+    began = time.perf_counter()
+    for iteration in range(warmup, warmup + iterations):
+        request = scenario.build(context, iteration)
+        args, kwargs = request_args(context, request)
+        queries_before, started = counter.count, time.perf_counter()
+        measurement.record(request, client.generic(*args, **kwargs), started, queries_before)
+    return measurement, time.perf_counter() - began
+
+
+async def run_async(scenario, context, counter, iterations: int, warmup: int):
+    from django.test import AsyncClient
+
+    client = AsyncClient()
+    for iteration in range(warmup):
+        request = scenario.build(context, iteration)
+        args, kwargs = request_args(context, request)
+        check(scenario, request, await client.generic(*args, **kwargs))
+    measurement = Measurement(scenario, counter)
+    began = time.perf_counter()
+    for iteration in range(warmup, warmup + iterations):
+        request = scenario.build(context, iteration)
+        args, kwargs = request_args(context, request)
+        queries_before, started = counter.count, time.perf_counter()
+        measurement.record(request, await client.generic(*args, **kwargs), started, queries_before)
+    return measurement, time.perf_counter() - began
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--client", choices=CLIENTS, default="wsgi",
+                        help="wsgi: test Client; asgi: AsyncClient; asgi-async: AsyncClient with API_ASYNC_VIEWS.")
+    parser.add_argument("--token-claims", action="store_true",
+                        help="Enable JWT_ACCESS_CLAIMS: project access checks answered from the token.")
+    parser.add_argument("--scenario", action="append", help="Scenario to run (repeatable; default: all).")
+    parser.add_argument("--iterations", type=int, default=200, help="Measured requests per scenario (x weight).")
+    parser.add_argument("--warmup", type=int, default=10, help="Unmeasured requests per scenario first.")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="Baseline file to compare with / update.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed p95 increase over the baseline.")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the client's baseline.")
+    parser.add_argument("--check", action="store_true", help="Exit with status 1 when a scenario regressed.")
+    parser.add_argument("--json", dest="json_path", help="Also write the results to this file.")
+    args = parser.parse_args()
+
+    os.environ["API_ASYNC_VIEWS"] = "true" if args.client == "asgi-async" else "false"
+    os.environ["JWT_ACCESS_CLAIMS"] = "true" if args.token_claims else "false"
+    label = args.client + ("+claims" if args.token_claims else "")
+    setup_django("benchmarks.settings")
+    from core.cache import is_shared_cache
+
+    if args.token_claims and not is_shared_cache():
+        parser.error("--token-claims needs a shared cache: set CACHE_BACKEND / CACHE_LOCATION (e.g. Redis).")
+    from benchmarks import report
+    from benchmarks.datagen import dataset_counts
+    from benchmarks.scenarios import SCENARIOS, BenchmarkContext
+
+    names = args.scenario or list(SCENARIOS)
+    unknown = [name for name in names if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)} (available: {', '.join(SCENARIOS)})")
+
+    context = BenchmarkContext()
+    counter = QueryCounter()
+    counter.install()
+    print(f"client={label} " + " ".join(f"{key}={value}" for key, value in context.describe().items()))
+
+    results = {}
+    for name in names:
+        scenario = SCENARIOS[name]
+        iterations = max(int(args.iterations * scenario.weight), 5)
+        warmup = max(int(args.warmup * scenario.weight), 1)
+        if scenario.prepare is not None:
+            scenario.prepare(context, warmup + iterations)
+        if args.client == "wsgi":
+            measurement, elapsed = run_sync(scenario, context, counter, iterations, warmup)
+        else:
+            measurement, elapsed = asyncio.run(run_async(scenario, context, counter, iterations, warmup))
+        results[name] = report.summarize(measurement.latencies, measurement.queries, elapsed)
+
+    baseline = report.load_baseline(args.baseline)
+    text, regressed = report.format_report(label, results, baseline, args.tolerance)
+    print(text)
+
+    if args.json_path:
+        with open(args.json_path, "w") as handle:
+            json.dump({"client": label, "results": results}, handle, indent=2)
+    if args.update_baseline:
+        meta = {"iterations": args.iterations, "warmup": args.warmup, "dataset": dataset_counts(), **context.describe()}
+        report.write_baseline(args.baseline, label, results, meta)
+        print(f"Baseline for {label} written to {args.baseline}.")
+    if regressed:
+        print(f"{regressed} scenario(s) regressed against the baseline (tolerance {args.tolerance:.0%}).")
+        if args.check:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
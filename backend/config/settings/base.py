@@ -2,6 +2,8 @@
 TeamTrack – Django base settings.
 Secrets and env-specific values come from environment variables.
 """
+import hashlib
+import importlib.util
 import os
 from pathlib import Path
 
@@ -47,6 +49,8 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "core.middleware.RequestLoggingMiddleware",
+    "core.middleware.MetricsMiddleware",
+    "core.middleware.QueryInstrumentationMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -72,6 +76,37 @@ TEMPLATES = [
 # Auth
 AUTH_USER_MODEL = "users.User"
 
+# Password hashing (apps.users.hashers): "auto" prefers Argon2 (argon2-cffi installed), then
+# scrypt, then PBKDF2; or set "argon2", "scrypt" or "pbkdf2". Unset work factors keep Django's
+# defaults. Passwords are re-hashed with the preferred hasher / factors on the user's next login.
+PASSWORD_HASHER = os.getenv("PASSWORD_HASHER", "auto").lower()
+if PASSWORD_HASHER == "auto":
+    PASSWORD_HASHER = (
+        "argon2" if importlib.util.find_spec("argon2") else "scrypt" if hasattr(hashlib, "scrypt") else "pbkdf2"
+    )
+_TUNED_HASHERS = {
+    "argon2": "apps.users.hashers.TunedArgon2PasswordHasher",
+    "scrypt": "apps.users.hashers.TunedScryptPasswordHasher",
+    "pbkdf2": "apps.users.hashers.TunedPBKDF2PasswordHasher",
+}
+PASSWORD_HASHERS = [_TUNED_HASHERS[PASSWORD_HASHER]] + [
+    path for name, path in _TUNED_HASHERS.items() if name != PASSWORD_HASHER
+] + [
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+]
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", 0)) or None
+PASSWORD_SCRYPT_WORK_FACTOR = int(os.getenv("PASSWORD_SCRYPT_WORK_FACTOR", 0)) or None  # power of 2
+PASSWORD_ARGON2_TIME_COST = int(os.getenv("PASSWORD_ARGON2_TIME_COST", 0)) or None
+PASSWORD_ARGON2_MEMORY_COST = int(os.getenv("PASSWORD_ARGON2_MEMORY_COST", 0)) or None  # KiB
+PASSWORD_ARGON2_PARALLELISM = int(os.getenv("PASSWORD_ARGON2_PARALLELISM", 0)) or None
+
+# Password hashing concurrency per worker process (login, registration): requests beyond it get
+# 429 at once, so hashing bursts cannot occupy every thread. LOGIN_QUEUE_TIMEOUT_SECONDS lets them
+# wait for a slot instead, holding their thread meanwhile: keep it to a few tens of milliseconds.
+LOGIN_CONCURRENCY = int(os.getenv("LOGIN_CONCURRENCY", 2))
+LOGIN_QUEUE_TIMEOUT_SECONDS = float(os.getenv("LOGIN_QUEUE_TIMEOUT_SECONDS", 0))
+
 AUTH_PASSWORD_VALIDATORS = [
     {"NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator"},
     {"NAME": "django.contrib.auth.password_validation.MinimumLengthValidator", "OPTIONS": {"min_length": 8}},
@@ -116,16 +151,36 @@ else:
         }
     }
 
+# Cache – local memory by default; use a shared backend (Redis or Memcached) when running
+# several workers so version-counter invalidation is seen by all of them. The authenticated-user
+# cache is only used with a shared backend (core.cache.is_shared_cache).
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("CACHE_LOCATION", "teamtrack"),
+    }
+}
+DASHBOARD_CACHE_TIMEOUT = int(os.getenv("DASHBOARD_CACHE_TIMEOUT_SECONDS", 300))
+# Authenticated user rows (apps.users.authentication; shared cache only): invalidated by version
+# on API changes; the TTL bounds staleness for edits made elsewhere (Django admin, shell).
+USER_AUTH_CACHE_TIMEOUT = int(os.getenv("USER_AUTH_CACHE_TIMEOUT_SECONDS", 60))
+# Refresh-token blacklist (apps.users.services.TokenService): blacklisted jtis remembered per
+# process, batch size of `manage.py prune_tokens`, and how long the table row counts reported by
+# /api/v1/metrics/ are cached (counting scans the tables).
+TOKEN_BLACKLIST_LRU_SIZE = int(os.getenv("TOKEN_BLACKLIST_LRU_SIZE", 10000))
+TOKEN_PRUNE_BATCH_SIZE = int(os.getenv("TOKEN_PRUNE_BATCH_SIZE", 1000))
+TOKEN_TABLE_SIZES_CACHE_SECONDS = int(os.getenv("TOKEN_TABLE_SIZES_CACHE_SECONDS", 300))
+
 # REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "apps.users.authentication.CachedJWTAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.IsAuthenticated",
     ],
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "core.renderers.FastJSONRenderer",
     ],
     "DEFAULT_PARSER_CLASSES": [
         "rest_framework.parsers.JSONParser",
@@ -135,6 +190,49 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 20,
 }
 
+# Task search – "auto" (FTS5 on SQLite, FULLTEXT on MySQL), "sqlite_fts5", "mysql_fulltext" or "like"
+TASK_SEARCH_BACKEND = os.getenv("TASK_SEARCH_BACKEND", "auto")
+TASK_SEARCH_MYSQL_MIN_TOKEN = int(os.getenv("TASK_SEARCH_MYSQL_MIN_TOKEN", 3))  # innodb_ft_min_token_size
+# When no indexed word matches the term, search again with LIKE (substring semantics, scans the project's tasks)
+TASK_SEARCH_SUBSTRING_FALLBACK = os.getenv("TASK_SEARCH_SUBSTRING_FALLBACK", "True").lower() in ("true", "1", "yes")
+
+# Maximum operations accepted by POST /api/v1/projects/<id>/tasks/bulk/
+TASK_BULK_MAX_OPERATIONS = int(os.getenv("TASK_BULK_MAX_OPERATIONS", 500))
+
+# Maximum users accepted by POST /api/v1/users/invite/, and how long the invite tokens it returns
+# can be used to set a password (POST /api/v1/auth/invite/accept/).
+USER_INVITE_MAX_USERS = int(os.getenv("USER_INVITE_MAX_USERS", 500))
+USER_INVITE_MAX_AGE_SECONDS = int(os.getenv("USER_INVITE_MAX_AGE_SECONDS", 7 * 24 * 3600))
+
+# Changes (sync) endpoint: tokens re-cover the last window seconds so rows committed late are not
+# skipped; tombstones (and tokens) older than the retention period are pruned / rejected.
+TASK_SYNC_SAFETY_WINDOW_SECONDS = int(os.getenv("TASK_SYNC_SAFETY_WINDOW_SECONDS", 5))
+TASK_SYNC_RETENTION_DAYS = int(os.getenv("TASK_SYNC_RETENTION_DAYS", 30))
+
+# Live events – pub/sub broker (core.pubsub) and the SSE stream at /api/v1/projects/<id>/tasks/events/.
+# The in-memory broker only reaches subscribers in the same process (serve the stream from one ASGI worker).
+PUBSUB_BROKER = os.getenv("PUBSUB_BROKER", "core.pubsub.InMemoryBroker")
+TASK_EVENTS_HEARTBEAT_SECONDS = int(os.getenv("TASK_EVENTS_HEARTBEAT_SECONDS", 15))
+TASK_EVENTS_QUEUE_SIZE = int(os.getenv("TASK_EVENTS_QUEUE_SIZE", 100))  # per connection, then "resync"
+TASK_EVENTS_MAX_DURATION_SECONDS = int(os.getenv("TASK_EVENTS_MAX_DURATION_SECONDS", 3600))
+TASK_EVENTS_TICKET_SECONDS = int(os.getenv("TASK_EVENTS_TICKET_SECONDS", 30))  # ?ticket= lifetime (single use)
+
+# Async read views (core.views.AsyncAPIView): serve their GETs through the async handlers.
+# Off by default: Django runs each async ORM / cache call through a worker thread, so on our load
+# tests the sync handlers were faster under both gunicorn threads and ASGI (benchmarks/load_test.py).
+API_ASYNC_VIEWS = os.getenv("API_ASYNC_VIEWS", "False").lower() in ("true", "1", "yes")
+
+# Query instrumentation (core.middleware.QueryInstrumentationMiddleware): per-request query count,
+# DB time and slowest SQL are always logged; X-DB-* response headers are sent with DEBUG or this flag.
+QUERY_DEBUG_HEADERS = os.getenv("QUERY_DEBUG_HEADERS", "False").lower() in ("true", "1", "yes")
+
+# Metrics (core.metrics, GET /api/v1/metrics/ for admins). Under several gunicorn workers set
+# METRICS_DIR to a local directory shared by them: each worker writes its values there every
+# METRICS_FLUSH_SECONDS and the endpoint merges them, folding exited workers into retired.json.
+# Unset: this process only.
+METRICS_DIR = os.getenv("METRICS_DIR", "")
+METRICS_FLUSH_SECONDS = float(os.getenv("METRICS_FLUSH_SECONDS", 5))
+
 # JWT – simplejwt
 from datetime import timedelta
 
@@ -143,6 +241,12 @@ JWT_REFRESH_LIFETIME_DAYS = int(os.getenv("JWT_REFRESH_TOKEN_LIFETIME_DAYS", 7))
 # Optional: use a separate signing key for JWT (defaults to SECRET_KEY)
 JWT_SIGNING_KEY = os.getenv("JWT_SIGNING_KEY", SECRET_KEY)
 
+# Access-token claims (apps.users.tokens): role + project-access digest, so task endpoints check
+# project access without a query. Users with more projects than the cap get tokens without digest.
+# Requires a shared cache (the digest is versioned there); ignored with LocMemCache.
+JWT_ACCESS_CLAIMS = os.getenv("JWT_ACCESS_CLAIMS", "False").lower() in ("true", "1", "yes")
+JWT_ACCESS_CLAIMS_MAX_PROJECTS = int(os.getenv("JWT_ACCESS_CLAIMS_MAX_PROJECTS", 100))
+
 SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME": timedelta(minutes=JWT_ACCESS_LIFETIME),
     "REFRESH_TOKEN_LIFETIME": timedelta(days=JWT_REFRESH_LIFETIME_DAYS),
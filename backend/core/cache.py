@@ -0,0 +1,151 @@
+"""
+TeamTrack – Cache helpers.
+Version counters kept in Django's cache framework (bumped on write, read to build cache keys
+or stored next to cached values), and per-process hit/miss counters for cache consumers.
+"""
+import threading
+import time
+
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import transaction
+
+
+def is_shared_cache() -> bool:
+    """
+    Whether the default cache is seen by every worker process (e.g. Redis, Memcached). With
+    LocMemCache or DummyCache a version bump made by one process is invisible to the others.
+    """
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def _version_key(namespace: str, object_id) -> str:
+    return f"version:{namespace}:{object_id}"
+
+
+def _initial_version() -> int:
+    # Time-based rather than 0: a counter that was evicted restarts at a value no
+    # previously issued key can contain, so stale entries are never matched again.
+    return time.time_ns()
+
+
+def get_versions(namespace: str, object_ids) -> dict:
+    """Return {object_id: version} for the given ids, initializing missing counters."""
+    keys = {_version_key(namespace, object_id): object_id for object_id in object_ids}
+    if not keys:
+        return {}
+    found = cache.get_many(list(keys))
+    missing = [key for key in keys if key not in found]
+    if missing:
+        initial = _initial_version()
+        for key in missing:
+            cache.add(key, initial, timeout=None)
+        found.update(cache.get_many(missing))
+    return {keys[key]: version for key, version in found.items()}
+
+
+def get_version(namespace: str, object_id) -> int:
+    """Return the current version of a single object (see get_versions)."""
+    return get_versions(namespace, [object_id]).get(object_id, 0)
+
+
+async def aget_versions(namespace: str, object_ids) -> dict:
+    """Async get_versions (cache.aget_many / aadd)."""
+    keys = {_version_key(namespace, object_id): object_id for object_id in object_ids}
+    if not keys:
+        return {}
+    found = await cache.aget_many(list(keys))
+    missing = [key for key in keys if key not in found]
+    if missing:
+        initial = _initial_version()
+        for key in missing:
+            await cache.aadd(key, initial, timeout=None)
+        found.update(await cache.aget_many(missing))
+    return {keys[key]: version for key, version in found.items()}
+
+
+async def aget_version(namespace: str, object_id) -> int:
+    """Async get_version."""
+    return (await aget_versions(namespace, [object_id])).get(object_id, 0)
+
+
+def get_versioned(namespace: str, object_id, key: str) -> tuple:
+    """
+    Return (value, version): the value set_versioned stored under key if it was stored at the
+    object's current version (else None), and that version. The counter and the entry are read
+    in one round trip, so a per-object cache costs a single get_many on hits.
+    """
+    version_key = _version_key(namespace, object_id)
+    found = cache.get_many([version_key, key])
+    version = found.get(version_key)
+    if version is None:
+        return None, get_version(namespace, object_id)
+    entry = found.get(key)
+    if entry is not None and entry[0] == version:
+        return entry[1], version
+    return None, version
+
+
+def set_versioned(key: str, version: int, value, timeout: int) -> None:
+    """Cache value under key for get_versioned, tagged with the version it was read at."""
+    cache.set(key, (version, value), timeout=timeout)
+
+
+def bump_version(namespace: str, object_id) -> None:
+    """Increment an object's version; a missing counter is re-seeded instead."""
+    key = _version_key(namespace, object_id)
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, _initial_version(), timeout=None)
+
+
+def bump_version_on_commit(namespace: str, object_id) -> None:
+    """
+    Bump after the current transaction commits (immediately if none is open), so readers
+    never cache pre-commit data under the new version.
+    """
+    transaction.on_commit(lambda: bump_version(namespace, object_id))
+
+
+class CacheStats:
+    """Thread-safe hit/miss counters for one named cache consumer (per process)."""
+
+    _registry = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, name: str):
+        self.name = name
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def get(cls, name: str) -> "CacheStats":
+        with cls._registry_lock:
+            if name not in cls._registry:
+                cls._registry[name] = cls(name)
+            return cls._registry[name]
+
+    @classmethod
+    def all(cls) -> list:
+        with cls._registry_lock:
+            return list(cls._registry.values())
+
+    def record_hit(self) -> None:
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self) -> None:
+        with self._lock:
+            self.misses += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            }
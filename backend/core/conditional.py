@@ -0,0 +1,46 @@
+"""
+TeamTrack – Conditional GET helpers.
+Views compute a strong ETag from a cheap fingerprint of the data (before running the main query
+or serializer), answer If-None-Match hits with 304 and attach the ETag to full responses.
+"""
+import hashlib
+
+from rest_framework import status
+from rest_framework.response import Response
+
+# Browsers keep the response but revalidate on every use, so repeat fetches become 304s.
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Strong ETag (quoted) for the given fingerprint parts."""
+    raw = "\x1f".join("" if part is None else str(part) for part in parts)
+    return '"%s"' % hashlib.sha1(raw.encode()).hexdigest()
+
+
+def request_etag(request, *parts) -> str:
+    """ETag for a GET on request: fingerprint parts + full path (filters, page, cursor) + rendered format."""
+    renderer = getattr(request, "accepted_renderer", None)
+    return make_etag(*parts, request.get_full_path(), getattr(renderer, "format", ""))
+
+
+def etag_matches(request, etag: str) -> bool:
+    """True if the request's If-None-Match lists etag (weak comparison, as RFC 9110 specifies for GET)."""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates
+
+
+def apply_etag(response: Response, etag: str) -> Response:
+    response["ETag"] = etag
+    response["Cache-Control"] = CACHE_CONTROL
+    return response
+
+
+def not_modified_response(etag: str) -> Response:
+    """Empty 304 carrying the same validators as the full response."""
+    return apply_etag(Response(status=status.HTTP_304_NOT_MODIFIED), etag)
@@ -19,12 +19,15 @@ def custom_exception_handler(exc, context):
     For BaseAPIException, return unified error response with correct status.
     """
     if isinstance(exc, BaseAPIException):
-        return error_response(
+        response = error_response(
             message=exc.message,
             code=exc.code,
             details=exc.details,
             status_code=exc.status_code,
         )
+        if getattr(exc, "retry_after", None) is not None:
+            response["Retry-After"] = str(exc.retry_after)
+        return response
 
     # Let DRF handle standard exceptions (ValidationError, Authentication, etc.)
     response = exception_handler(exc, context)
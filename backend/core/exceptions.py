@@ -50,3 +50,13 @@ class ConflictError(BaseAPIException):
     status_code = status.HTTP_409_CONFLICT
     default_message = "Conflict"
     default_code = "conflict"
+
+
+class TooManyRequestsError(BaseAPIException):
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
+    default_message = "Too many requests"
+    default_code = "too_many_requests"
+
+    def __init__(self, message=None, code=None, details=None, retry_after=None):
+        super().__init__(message=message, code=code, details=details)
+        self.retry_after = retry_after  # seconds, sent as Retry-After
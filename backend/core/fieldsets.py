@@ -0,0 +1,114 @@
+"""
+TeamTrack – Sparse fieldsets for list endpoints.
+`?fields=id,title` returns only the listed fields, `?exclude=description` all but the listed ones.
+The selection narrows the serializer output and the SQL: deferred columns are left out with
+.only() and relations are joined only when a requested field reads through them.
+"""
+from django.core.exceptions import FieldDoesNotExist
+
+from .exceptions import ValidationError
+from .pagination import KeysetPagination
+
+FIELDS_QUERY_PARAM = "fields"
+EXCLUDE_QUERY_PARAM = "exclude"
+
+
+def parse_fieldset(query_params, available) -> list:
+    """
+    Return the selected field names (in `available` order) or None when no selection was requested.
+    Raises ValidationError for unknown names, an empty selection, or fields and exclude together.
+    """
+    requested = {}
+    for param in (FIELDS_QUERY_PARAM, EXCLUDE_QUERY_PARAM):
+        if param in query_params:
+            requested[param] = [name.strip() for name in query_params.get(param, "").split(",") if name.strip()]
+    if not requested:
+        return None
+    if len(requested) > 1:
+        raise ValidationError(
+            message="Use either fields or exclude, not both.",
+            code="invalid_fieldset",
+        )
+    param, names = next(iter(requested.items()))
+    unknown = [name for name in names if name not in available]
+    if unknown:
+        raise ValidationError(
+            message="Unknown field(s) requested.",
+            code="invalid_fieldset",
+            details={param: [f"Unknown field: {name}." for name in unknown], "available": list(available)},
+        )
+    if param == FIELDS_QUERY_PARAM:
+        selected = [name for name in available if name in names]
+    else:
+        selected = [name for name in available if name not in names]
+    if not selected:
+        raise ValidationError(message="At least one field must be selected.", code="invalid_fieldset")
+    return selected
+
+
+class SparseFieldsetSerializerMixin:
+    """Serializer mixin: the `fields` kwarg (list of names) drops every other field from the output."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+
+class SparseFieldsetMixin:
+    """
+    View mixin for list endpoints whose serializer uses SparseFieldsetSerializerMixin.
+    fieldset_columns maps an output field to the model columns it reads (default: the field
+    name itself; "relation__column" for fields read through a join; () for annotations).
+    """
+
+    fieldset_columns = {}
+
+    def get_fieldset_available(self) -> tuple:
+        return tuple(self.get_serializer_class().Meta.fields)
+
+    def get_fieldset(self):
+        """Selected field names for this request (None: all fields). Parsed once per request."""
+        if not hasattr(self, "_fieldset"):
+            self._fieldset = parse_fieldset(self.request.query_params, self.get_fieldset_available())
+        return self._fieldset
+
+    def get_fieldset_columns(self, queryset) -> list:
+        """Columns to load: those of the selected fields plus the pk and every ordering column."""
+        columns = {}
+        for field in self.get_fieldset():
+            columns.update(dict.fromkeys(self.fieldset_columns.get(field, (field,))))
+        columns.update(dict.fromkeys(self.get_fieldset_ordering_columns(queryset)))
+        return list(columns)
+
+    def get_fieldset_ordering_columns(self, queryset) -> list:
+        """pk plus the model columns queryset and keyset pagination order by (needed for cursors)."""
+        model = queryset.model
+        ordering = getattr(self, "cursor_ordering", None) or KeysetPagination.ordering
+        columns = {model._meta.pk.name: None}
+        for field in (*queryset.query.order_by, *ordering):
+            name = field.lstrip("-") if isinstance(field, str) else None
+            try:
+                model._meta.get_field(name)
+            except FieldDoesNotExist:
+                continue  # annotation (e.g. a search rank) or expression, not a column
+            columns[name] = None
+        return list(columns)
+
+    def apply_fieldset(self, queryset):
+        """Restrict queryset to the selected fields (.only() + only the joins they need)."""
+        if self.get_fieldset() is None:
+            return queryset
+        columns = self.get_fieldset_columns(queryset)
+        relations = sorted({column.rsplit("__", 1)[0] for column in columns if "__" in column})
+        queryset = queryset.select_related(None)
+        if relations:
+            queryset = queryset.select_related(*relations)
+        return queryset.only(*columns)
+
+    def get_serializer(self, *args, **kwargs):
+        fieldset = self.get_fieldset()
+        if fieldset is not None:
+            kwargs.setdefault("fields", fieldset)
+        return super().get_serializer(*args, **kwargs)
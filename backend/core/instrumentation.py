@@ -0,0 +1,129 @@
+"""
+TeamTrack – Per-request database instrumentation.
+QueryStats collects one request's query count, total DB time and slowest statement. A single
+execute wrapper is installed on every database connection (including connections opened later
+by worker threads); it records into the QueryStats bound to the current context, so queries run
+through sync_to_async by async views are attributed to the request that issued them.
+Views declare budgets as class attributes, an int or a {method: int} dict:
+    query_budget = 5                      # max queries per request
+    db_time_budget_ms = {"GET": 50}       # max total DB time per request
+Savepoint statements (SAVEPOINT, RELEASE SAVEPOINT, ROLLBACK TO SAVEPOINT) are transaction
+control, not queries: they are counted in QueryStats.savepoints (their time in time) and left
+out of count and the query budget. TestCase runs every test in a transaction, which turns each
+transaction.atomic block of the code under test into a savepoint pair production does not send,
+so counting them would make budgets differ between tests and production.
+"""
+import contextlib
+import contextvars
+import threading
+import time
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+MAX_RECORDED_QUERIES = 100
+SAVEPOINT_STATEMENTS = ("SAVEPOINT ", "RELEASE SAVEPOINT ", "ROLLBACK TO SAVEPOINT ")
+MAX_LOGGED_SQL = 500
+
+_current_stats = contextvars.ContextVar("query_stats", default=None)
+
+
+class QueryStats:
+    """Queries of one request (thread-safe: async views may query from several threads)."""
+
+    def __init__(self):
+        self.count = 0
+        self.savepoints = 0
+        self.time = 0.0
+        self.slowest_sql = None
+        self.slowest_time = 0.0
+        self.queries = []  # (sql, seconds) of the first MAX_RECORDED_QUERIES, for failure reports
+        self._lock = threading.Lock()
+
+    def record(self, sql: str, duration: float) -> None:
+        with self._lock:
+            if sql.startswith(SAVEPOINT_STATEMENTS):
+                self.savepoints += 1
+            else:
+                self.count += 1
+            self.time += duration
+            if self.slowest_sql is None or duration > self.slowest_time:
+                self.slowest_sql, self.slowest_time = sql, duration
+            if len(self.queries) < MAX_RECORDED_QUERIES:
+                self.queries.append((sql, duration))
+
+    @property
+    def time_ms(self) -> float:
+        return round(self.time * 1000, 2)
+
+    @property
+    def slowest_ms(self) -> float:
+        return round(self.slowest_time * 1000, 2)
+
+    def as_log_fields(self) -> dict:
+        return {
+            "db_queries": self.count,
+            "db_time_ms": self.time_ms,
+            "db_slowest_ms": self.slowest_ms,
+            "db_slowest_sql": (self.slowest_sql or "")[:MAX_LOGGED_SQL],
+        }
+
+
+def _record(execute, sql, params, many, context):
+    stats = _current_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    started = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.record(sql, time.perf_counter() - started)
+
+
+def _attach(sender=None, connection=None, **kwargs):
+    if _record not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record)
+
+
+def install() -> None:
+    """Wrap this thread's open connections now and every connection opened from now on (idempotent)."""
+    connection_created.connect(_attach, dispatch_uid="core.instrumentation")
+    for connection in connections.all(initialized_only=True):
+        _attach(connection=connection)
+
+
+@contextlib.contextmanager
+def record_queries():
+    """Collect the queries run inside the block (and by sync_to_async calls made from it)."""
+    install()
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def get_budget(view_class, attribute: str, method: str):
+    """Budget declared on view_class for method (None: no budget)."""
+    budget = getattr(view_class, attribute, None)
+    if isinstance(budget, dict):
+        budget = budget.get(method.upper())
+    return budget
+
+
+def get_budgets(view_class, method: str) -> dict:
+    return {
+        "queries": get_budget(view_class, "query_budget", method),
+        "db_time_ms": get_budget(view_class, "db_time_budget_ms", method),
+    }
+
+
+def exceeded_budgets(stats: QueryStats, budgets: dict) -> list:
+    """Human-readable descriptions of the budgets stats exceeds (empty: within budget)."""
+    exceeded = []
+    if budgets.get("queries") is not None and stats.count > budgets["queries"]:
+        exceeded.append(f"{stats.count} queries > budget {budgets['queries']}")
+    if budgets.get("db_time_ms") is not None and stats.time_ms > budgets["db_time_ms"]:
+        exceeded.append(f"{stats.time_ms} ms DB time > budget {budgets['db_time_ms']} ms")
+    return exceeded
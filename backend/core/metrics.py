@@ -0,0 +1,367 @@
+"""
+TeamTrack – In-process metrics.
+Counters and histograms kept in a process-wide registry and rendered in the Prometheus text
+exposition format by GET /api/v1/metrics/ (MetricsMiddleware records the request metrics).
+Each gunicorn worker has its own registry. With METRICS_DIR set, every process writes its values
+to <METRICS_DIR>/<pid>-<token>.json (atomically, every METRICS_FLUSH_SECONDS while there is new
+data, and at exit) and the endpoint merges all files, so whichever worker answers reports the whole
+server. The random per-process token keeps a worker that got a recycled pid from overwriting the
+file of the dead one. At scrape time, files of processes that no longer run are added into
+retired.json and deleted, so counters never go backwards and the directory does not grow with
+worker restarts (scrapes hold an flock on <METRICS_DIR>/.lock while they do this).
+"""
+import atexit
+import contextlib
+import json
+import os
+import tempfile
+import threading
+import time
+import uuid
+
+from django.conf import settings
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89)
+
+_registry_dirty = threading.Event()  # set on every update, cleared when the process file is written
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+        _registry_dirty.set()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            series = [[list(key), value] for key, value in self._values.items()]
+        return {"type": self.type, "help": self.documentation, "labelnames": list(self.labelnames), "series": series}
+
+
+class Histogram:
+    """Cumulative-bucket histogram; each series is [bucket counts..., sum, count]."""
+
+    type = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = self._values[key] = [0] * (len(self.buckets) + 2)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[index] += 1
+            series[-2] += value
+            series[-1] += 1
+        _registry_dirty.set()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            series = [[list(key), list(values)] for key, values in self._values.items()]
+        return {
+            "type": self.type,
+            "help": self.documentation,
+            "labelnames": list(self.labelnames),
+            "buckets": list(self.buckets),
+            "series": series,
+        }
+
+
+class Registry:
+    """Metrics of this process, plus collectors that report values kept elsewhere (e.g. CacheStats)."""
+
+    def __init__(self):
+        self._metrics = {}
+        self._collectors = []
+        self._server_collectors = []
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, cls, name: str, *args, **kwargs):
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = cls(name, *args, **kwargs)
+            return self._metrics[name]
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames=(), buckets=LATENCY_BUCKETS) -> Histogram:
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets)
+
+    def register_collector(self, collector, server_wide: bool = False) -> None:
+        """
+        collector() returns {name: snapshot entry} like Counter.snapshot(), merged into snapshot().
+        server_wide: the values already describe the whole server (e.g. database row counts), so
+        they are read once per exposition instead of being summed over every process.
+        """
+        (self._server_collectors if server_wide else self._collectors).append(collector)
+
+    def server_snapshot(self) -> dict:
+        data = {}
+        for collector in self._server_collectors:
+            data.update(collector())
+        return data
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        data = {metric.name: metric.snapshot() for metric in metrics}
+        for collector in self._collectors:
+            data.update(collector())
+        return data
+
+
+registry = Registry()
+
+REQUEST_DURATION = registry.histogram(
+    "teamtrack_http_request_duration_seconds", "Request latency by URL name.", ("view", "method")
+)
+RESPONSES = registry.counter(
+    "teamtrack_http_responses_total", "Responses by URL name and status class.", ("view", "method", "status_class")
+)
+DB_QUERIES = registry.histogram(
+    "teamtrack_db_queries_per_request", "Database queries per request.", ("view",), QUERY_COUNT_BUCKETS
+)
+DB_TIME = registry.histogram("teamtrack_db_time_seconds", "Database time per request.", ("view",))
+
+
+def _cache_stats() -> dict:
+    from core.cache import CacheStats
+
+    series = []
+    for stats in CacheStats.all():
+        snapshot = stats.snapshot()
+        series.append([[stats.name, "hit"], snapshot["hits"]])
+        series.append([[stats.name, "miss"], snapshot["misses"]])
+    return {
+        "teamtrack_cache_requests_total": {
+            "type": "counter",
+            "help": "Cache lookups by consumer and result (hit ratio: teamtrack_cache_hit_ratio).",
+            "labelnames": ["cache", "result"],
+            "series": series,
+        }
+    }
+
+
+registry.register_collector(_cache_stats)
+
+
+def observe_request(view: str, method: str, status: int, duration: float, query_stats=None) -> None:
+    """Record one request (called by core.middleware.MetricsMiddleware)."""
+    REQUEST_DURATION.observe(duration, view=view, method=method)
+    RESPONSES.inc(view=view, method=method, status_class=f"{status // 100}xx")
+    if query_stats is not None:
+        DB_QUERIES.observe(query_stats.count, view=view)
+        DB_TIME.observe(query_stats.time, view=view)
+    _ensure_flusher()
+
+
+# --- Multi-process: one file per process in METRICS_DIR ---
+
+RETIRED_FILE = "retired.json"
+LOCK_FILE = ".lock"
+
+_flusher_pid = None
+_flusher_lock = threading.Lock()
+_process_token = (None, None)  # (pid, token) of this process; a forked worker gets its own
+
+
+def _process_file(directory: str) -> str:
+    global _process_token
+    pid = os.getpid()
+    if _process_token[0] != pid:
+        _process_token = (pid, uuid.uuid4().hex[:12])
+    return os.path.join(directory, f"{pid}-{_process_token[1]}.json")
+
+
+def _write_snapshot(path: str, snapshot: dict) -> None:
+    handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), prefix=".tmp-", suffix=".json")
+    with os.fdopen(handle, "w") as output:
+        json.dump(snapshot, output)
+    os.replace(temporary, path)
+
+
+def write_process_file() -> None:
+    """Write this process's snapshot to METRICS_DIR (no-op without it)."""
+    directory = settings.METRICS_DIR
+    if not directory:
+        return
+    _registry_dirty.clear()
+    os.makedirs(directory, exist_ok=True)
+    _write_snapshot(_process_file(directory), registry.snapshot())
+
+
+def _flush_loop(interval: float) -> None:
+    while True:
+        _registry_dirty.wait()
+        time.sleep(interval)
+        try:
+            write_process_file()
+        except OSError:
+            pass  # directory gone or full: retried on the next change
+
+
+def _ensure_flusher() -> None:
+    """Start this process's flush thread once (again in a forked worker, whose pid differs)."""
+    global _flusher_pid
+    if not settings.METRICS_DIR or _flusher_pid == os.getpid():
+        return
+    with _flusher_lock:
+        if _flusher_pid == os.getpid():
+            return
+        _flusher_pid = os.getpid()
+        threading.Thread(
+            target=_flush_loop, args=(settings.METRICS_FLUSH_SECONDS,), name="metrics-flush", daemon=True
+        ).start()
+        atexit.register(write_process_file)
+
+
+def _is_running(filename: str) -> bool:
+    """Whether the process that wrote <pid>-<token>.json still runs (unparsable names count as running)."""
+    try:
+        pid = int(filename.split("-", 1)[0].removesuffix(".json"))
+    except ValueError:
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # exists, owned by another user
+    return True
+
+
+@contextlib.contextmanager
+def _directory_lock(directory: str):
+    """Exclusive lock between scrapes of the same METRICS_DIR (POSIX flock)."""
+    import fcntl
+
+    with open(os.path.join(directory, LOCK_FILE), "a") as handle:
+        fcntl.flock(handle, fcntl.LOCK_EX)
+        yield
+
+
+def collect() -> list:
+    """
+    Snapshots of every process: this one live, the others from METRICS_DIR. Files of exited
+    processes are merged into retired.json and removed.
+    """
+    snapshots = [registry.snapshot()]
+    directory = settings.METRICS_DIR
+    if not directory or not os.path.isdir(directory):
+        return snapshots
+    own = _process_file(directory)
+    with _directory_lock(directory):
+        retired, exited = {}, []
+        for entry in os.scandir(directory):
+            if not entry.name.endswith(".json") or entry.name.startswith(".") or entry.path == own:
+                continue
+            try:
+                with open(entry.path) as handle:
+                    snapshot = json.load(handle)
+            except (OSError, ValueError):
+                continue  # being replaced or truncated; it is read again on the next scrape
+            snapshots.append(snapshot)
+            if entry.name == RETIRED_FILE:
+                retired = snapshot
+            elif not _is_running(entry.name):
+                exited.append((entry.path, snapshot))
+        if exited:
+            merged = merge([retired, *(snapshot for _, snapshot in exited)])
+            _write_snapshot(os.path.join(directory, RETIRED_FILE), as_snapshot(merged))
+            for path, _ in exited:
+                os.remove(path)
+    return snapshots
+
+
+def merge(snapshots: list) -> dict:
+    """Sum counters and histogram series with the same name and labels across snapshots."""
+    merged = {}
+    for snapshot in snapshots:
+        for name, metric in snapshot.items():
+            target = merged.setdefault(name, {**metric, "series": {}})
+            for labels, value in metric["series"]:
+                key = tuple(labels)
+                if metric["type"] == "histogram":
+                    current = target["series"].get(key)
+                    target["series"][key] = value if current is None else [a + b for a, b in zip(current, value)]
+                else:
+                    target["series"][key] = target["series"].get(key, 0) + value
+    return merged
+
+
+def as_snapshot(merged: dict) -> dict:
+    """merge() output back in the snapshot format (series as [labels, value] lists)."""
+    return {
+        name: {**metric, "series": [[list(key), value] for key, value in metric["series"].items()]}
+        for name, metric in merged.items()
+    }
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names, values, extra=()) -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in (*zip(names, values), *extra)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def render(merged: dict) -> str:
+    """Prometheus text exposition of merged metrics, plus teamtrack_cache_hit_ratio derived from the cache counters."""
+    lines = []
+    for name in sorted(merged):
+        metric = merged[name]
+        names = metric["labelnames"]
+        lines.append(f"# HELP {name} {metric['help']}")
+        lines.append(f"# TYPE {name} {metric['type']}")
+        for values, value in sorted(metric["series"].items()):
+            if metric["type"] != "histogram":
+                lines.append(f"{name}{_labels(names, values)} {_number(value)}")
+                continue
+            for bound, count in zip(metric["buckets"], value):
+                lines.append(f"{name}_bucket{_labels(names, values, [('le', _number(float(bound)))])} {count}")
+            lines.append(f"{name}_bucket{_labels(names, values, [('le', '+Inf')])} {value[-1]}")
+            lines.append(f"{name}_sum{_labels(names, values)} {_number(float(value[-2]))}")
+            lines.append(f"{name}_count{_labels(names, values)} {value[-1]}")
+
+    lookups = merged.get("teamtrack_cache_requests_total", {}).get("series", {})
+    caches = sorted({cache for cache, _ in lookups})
+    if caches:
+        lines.append("# HELP teamtrack_cache_hit_ratio Share of cache lookups that were hits.")
+        lines.append("# TYPE teamtrack_cache_hit_ratio gauge")
+        for cache in caches:
+            hits, misses = lookups.get((cache, "hit"), 0), lookups.get((cache, "miss"), 0)
+            ratio = hits / (hits + misses) if hits + misses else 0.0
+            lines.append(f'teamtrack_cache_hit_ratio{{cache="{_escape(cache)}"}} {round(ratio, 4)!r}')
+    return "\n".join(lines) + "\n"
+
+
+def exposition() -> str:
+    """Metrics of every process, plus the server-wide collectors, in the text exposition format."""
+    return render(merge(collect() + [registry.server_snapshot()]))
@@ -1,11 +1,20 @@
 """
 TeamTrack – Custom middleware.
 Request logging: request_id, user, path, method, status.
+Query instrumentation: per-request query count, DB time, slowest SQL and view query budgets.
+Metrics: latency, status and query histograms per URL name (core.metrics).
 Do not log secrets or full tokens.
 """
 import logging
+import time
 import uuid
 
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from core import metrics
+from core.instrumentation import exceeded_budgets, get_budgets, install, record_queries
+
 logger = logging.getLogger("core.middleware")
 
 
@@ -13,17 +22,39 @@ class RequestLoggingMiddleware:
     """
     Log each request with request_id, user (id only), path, method.
     Log response with status after request is processed.
+    Sync and async capable, so under ASGI async views are not forced through a thread.
     """
+    sync_capable = True
+    async_capable = True
+
     def __init__(self, get_response):
         self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
 
     def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        user = getattr(request, "user", None)
+        request_id = self.log_request(request, user)
+        response = self.get_response(request)
+        self.log_response(request, request_id, response)
+        return response
+
+    async def __acall__(self, request):
+        user = await request.auser() if hasattr(request, "auser") else None
+        request_id = self.log_request(request, user)
+        response = await self.get_response(request)
+        self.log_response(request, request_id, response)
+        return response
+
+    def log_request(self, request, user) -> str:
         request_id = getattr(request, "request_id", None) or str(uuid.uuid4())[:8]
         request.request_id = request_id
 
         user_id = None
-        if hasattr(request, "user") and request.user.is_authenticated:
-            user_id = getattr(request.user, "id", None)
+        if user is not None and user.is_authenticated:
+            user_id = getattr(user, "id", None)
 
         logger.info(
             "request_id=%s user_id=%s path=%s method=%s",
@@ -38,15 +69,125 @@ class RequestLoggingMiddleware:
                 "method": request.method,
             },
         )
+        return request_id
 
-        response = self.get_response(request)
-
+    def log_response(self, request, request_id: str, response) -> None:
         status = getattr(response, "status_code", None)
+        stats = getattr(request, "query_stats", None)
+        if stats is None:
+            logger.info(
+                "request_id=%s status=%s",
+                request_id,
+                status,
+                extra={"request_id": request_id, "status": status},
+            )
+            return
         logger.info(
-            "request_id=%s status=%s",
+            "request_id=%s status=%s db_queries=%s db_time_ms=%s db_slowest_ms=%s",
             request_id,
             status,
-            extra={"request_id": request_id, "status": status},
+            stats.count,
+            stats.time_ms,
+            stats.slowest_ms,
+            extra={"request_id": request_id, "status": status, **stats.as_log_fields()},
+        )
+
+
+class MetricsMiddleware:
+    """
+    Record request latency, status class and DB query stats per resolved URL name (core.metrics).
+    Place it between RequestLoggingMiddleware and QueryInstrumentationMiddleware: the query stats
+    are read from the request once the inner middleware has set them.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    async def __acall__(self, request):
+        started = time.perf_counter()
+        response = await self.get_response(request)
+        self.observe(request, response, time.perf_counter() - started)
+        return response
+
+    def observe(self, request, response, duration: float) -> None:
+        match = getattr(request, "resolver_match", None)
+        # URL names keep the label set bounded (paths contain ids); unresolved paths share one label.
+        view = (match.url_name or match.view_name) if match else "unmatched"
+        metrics.observe_request(
+            view, request.method, response.status_code, duration, getattr(request, "query_stats", None)
         )
 
+
+class QueryInstrumentationMiddleware:
+    """
+    Record each request's query count, total DB time and slowest SQL (core.instrumentation).
+    The stats are set on request.query_stats (logged by RequestLoggingMiddleware as structured
+    fields) and on response.query_stats / response.query_budget (core.testing checks them);
+    with DEBUG or QUERY_DEBUG_HEADERS they are also sent as X-DB-* response headers.
+    A request over its view's query_budget / db_time_budget_ms is logged as a warning.
+    Place it after RequestLoggingMiddleware so the stats exist when the response is logged.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        install()
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        with record_queries() as stats:
+            response = self.get_response(request)
+        self.finish(request, response, stats)
+        return response
+
+    async def __acall__(self, request):
+        with record_queries() as stats:
+            response = await self.get_response(request)
+        self.finish(request, response, stats)
         return response
+
+    def finish(self, request, response, stats) -> None:
+        request.query_stats = response.query_stats = stats
+        match = getattr(request, "resolver_match", None)
+        view_class = getattr(match.func, "view_class", None) if match else None
+        budgets = get_budgets(view_class, request.method)
+        response.query_budget = budgets
+        exceeded = exceeded_budgets(stats, budgets)
+        if exceeded:
+            logger.warning(
+                "request_id=%s view=%s method=%s query budget exceeded: %s",
+                getattr(request, "request_id", None),
+                view_class.__name__,
+                request.method,
+                "; ".join(exceeded),
+                extra={
+                    "request_id": getattr(request, "request_id", None),
+                    "view": view_class.__name__,
+                    "method": request.method,
+                    "query_budget": budgets["queries"],
+                    "db_time_budget_ms": budgets["db_time_ms"],
+                    **stats.as_log_fields(),
+                },
+            )
+        if settings.DEBUG or settings.QUERY_DEBUG_HEADERS:
+            response["X-DB-Queries"] = str(stats.count)
+            response["X-DB-Time-Ms"] = str(stats.time_ms)
+            response["X-DB-Slowest-Ms"] = str(stats.slowest_ms)
+            if budgets["queries"] is not None:
+                response["X-DB-Query-Budget"] = str(budgets["queries"])
@@ -2,22 +2,211 @@
 TeamTrack – Default pagination classes.
 Used globally via REST_FRAMEWORK['DEFAULT_PAGINATION_CLASS'].
 """
-from rest_framework.pagination import PageNumberPagination
+import base64
+import datetime
+import json
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.core.paginator import InvalidPage, Page
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from .conditional import apply_etag
+from .exceptions import ValidationError
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination over a fixed ordering, e.g. (-updated_at, -id).
+    Each page is a range scan from the last row of the previous page: no OFFSET and,
+    unless requested with include_count=true, no COUNT(*).
+    The cursor is an opaque token; views may override the ordering via `cursor_ordering`
+    (the last field must be unique, normally the primary key). A queryset ordered by an
+    annotation or expression (e.g. ?ordering=relevance) cannot be paged this way: it is
+    rejected rather than silently re-ordered.
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    cursor_query_param = "cursor"
+    count_query_param = "include_count"
+    ordering = ("-updated_at", "-id")
+
+    def paginate_queryset(self, queryset, request, view=None):
+        page_queryset = self._prepare(queryset, request, view)
+        if self.wants_count:
+            self.count = queryset.count()
+        return self._finish(list(page_queryset[: self.page_size + 1]))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """paginate_queryset for async views (async ORM)."""
+        page_queryset = self._prepare(queryset, request, view)
+        if self.wants_count:
+            self.count = await queryset.acount()
+        return self._finish([row async for row in page_queryset[: self.page_size + 1]])
+
+    def _prepare(self, queryset, request, view):
+        """Read the request's page parameters; return queryset ordered and filtered past the cursor."""
+        self.request = request
+        self.ordering = tuple(getattr(view, "cursor_ordering", self.ordering))
+        self.page_size = self.get_page_size(request)
+        self.count = None
+        self.wants_count = str(request.query_params.get(self.count_query_param, "")).lower() in ("true", "1", "yes")
+
+        for field in queryset.query.order_by:
+            if not isinstance(field, str) or field.lstrip("-") in queryset.query.annotations:
+                raise ValidationError(
+                    message="Cursor pagination does not support this ordering; use page numbers.",
+                    code="invalid_cursor_ordering",
+                )
+        queryset = queryset.order_by(*self.ordering)
+        position = self.decode_cursor(request.query_params.get(self.cursor_query_param), queryset.model)
+        if position is not None:
+            queryset = queryset.filter(self._after(position))
+        return queryset
+
+    def _finish(self, rows):
+        """Trim the look-ahead row and compute the next cursor."""
+        self.has_next = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        self.next_cursor = self.encode_cursor(rows[-1]) if self.has_next else None
+        return rows
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError, TypeError):
+            return self.page_size
+        if size <= 0:
+            return self.page_size
+        return min(size, self.max_page_size)
+
+    def get_paginated_response(self, data, etag=None):
+        """Same envelope as StandardResultsSetPagination; page numbers replaced by a cursor."""
+        response = Response({
+            "success": True,
+            "data": {
+                "results": data,
+                "pagination": {
+                    "count": self.count,
+                    "page_size": self.page_size,
+                    "next_cursor": self.next_cursor,
+                    "next": self.get_next_link(),
+                    "previous": None,
+                },
+            },
+        })
+        if etag:
+            apply_etag(response, etag)
+        return response
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def _after(self, position):
+        """Rows strictly after position in self.ordering (lexicographic comparison)."""
+        condition = Q()
+        equal = {}
+        for field, value in zip(self.ordering, position):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= Q(**equal, **{f"{name}__{lookup}": value})
+            equal[name] = value
+        # Redundant bound on the leading column so the database can seek the index range.
+        leading = self.ordering[0]
+        bound = "lte" if leading.startswith("-") else "gte"
+        return Q(**{f"{leading.lstrip('-')}__{bound}": position[0]}) & condition
+
+    def encode_cursor(self, row):
+        values = []
+        for field in self.ordering:
+            name = field.lstrip("-")
+            value = row[name] if isinstance(row, dict) else getattr(row, name)
+            if isinstance(value, (datetime.date, datetime.time)):
+                value = value.isoformat()  # full precision; DjangoJSONEncoder drops microseconds
+            values.append(value)
+        raw = json.dumps(values, cls=DjangoJSONEncoder, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, token, model):
+        """Return the ordering values encoded in token (None for the first page)."""
+        if not token:
+            return None
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            values = json.loads(raw)
+            if not isinstance(values, list) or len(values) != len(self.ordering):
+                raise ValueError("cursor shape")
+            return [
+                model._meta.get_field(field.lstrip("-")).to_python(value)
+                for field, value in zip(self.ordering, values)
+            ]
+        except (ValueError, TypeError, FieldDoesNotExist, DjangoValidationError):
+            raise ValidationError(message="Invalid cursor.", code="invalid_cursor")
 
 
 class StandardResultsSetPagination(PageNumberPagination):
     """
     Page-number pagination with configurable page size.
     Query params: page, page_size (capped at max_page_size).
+    Passing `cursor` (empty for the first page) switches the request to KeysetPagination.
     """
     page_size = 20
     page_size_query_param = "page_size"
     max_page_size = 100
+    keyset_class = KeysetPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view=view)
+        return super().paginate_queryset(queryset, request, view=view)
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """
+        paginate_queryset for async views: the same pages and errors, with the COUNT and the
+        page query run through the async ORM (acount / async iteration).
+        """
+        self.keyset = None
+        if self.keyset_class.cursor_query_param in request.query_params:
+            self.keyset = self.keyset_class()
+            return await self.keyset.apaginate_queryset(queryset, request, view=view)
+
+        page_size = self.get_page_size(request)
+        if not page_size:
+            return None
+        paginator = self.django_paginator_class(queryset, page_size)
+        paginator.count = await queryset.acount()  # pre-fill the cached_property
+        page_number = self.get_page_number(request, paginator)
+        try:
+            number = paginator.validate_number(page_number)
+        except InvalidPage as exc:
+            msg = self.invalid_page_message.format(page_number=page_number, message=str(exc))
+            raise NotFound(msg)
+        bottom = (number - 1) * paginator.per_page
+        top = bottom + paginator.per_page
+        if top + paginator.orphans >= paginator.count:
+            top = paginator.count
+        rows = [row async for row in queryset[bottom:top]]
+        self.page = Page(rows, number, paginator)
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return list(self.page)
 
-    def get_paginated_response(self, data):
-        """Return pagination metadata + results in a unified format."""
-        return Response({
+    def get_paginated_response(self, data, etag=None):
+        """Return pagination metadata + results in a unified format (optionally with an ETag)."""
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data, etag=etag)
+        response = Response({
             "success": True,
             "data": {
                 "results": data,
@@ -31,3 +220,6 @@ class StandardResultsSetPagination(PageNumberPagination):
                 },
             },
         })
+        if etag:
+            apply_etag(response, etag)
+        return response
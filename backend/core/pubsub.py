@@ -0,0 +1,148 @@
+"""
+TeamTrack – In-process publish/subscribe.
+Services publish small JSON-serializable events to named channels after their transaction
+commits; streaming views (e.g. the task events SSE endpoint) subscribe per connection.
+The broker is pluggable via settings.PUBSUB_BROKER (dotted path to a Broker subclass).
+InMemoryBroker delivers within one process only: use it for tests, development and
+single-process deployments; multi-process deployments need a shared broker (e.g. Redis).
+"""
+import abc
+import asyncio
+import logging
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+# Sent to a subscriber that fell behind: its queued events were dropped and it must re-sync.
+RESYNC_EVENT = {"type": "resync"}
+
+
+class Subscription:
+    """
+    One consumer's bounded event queue, bound to the event loop it was created on.
+    Backpressure: when the queue is full the backlog is replaced by RESYNC_EVENT, which wakes a
+    waiting get() at once; later events are dropped until it is read (the consumer refetches).
+    A slow connection costs bounded memory and never blocks publishers.
+    """
+
+    def __init__(self, broker: "Broker", channel: str, max_queue: int):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue(maxsize=max_queue)
+        self.overflowed = False
+        self.closed = False
+
+    def deliver(self, event: dict) -> None:
+        """Queue event (thread-safe; called by the broker from any thread)."""
+        try:
+            self.loop.call_soon_threadsafe(self._put, event)
+        except RuntimeError:
+            # The consumer's event loop is gone; stop delivering to it.
+            self.close()
+
+    def _put(self, event: dict) -> None:
+        if self.closed or self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_EVENT)
+
+    async def get(self, timeout: float):
+        """Next event, RESYNC_EVENT after an overflow, or None if nothing arrived within timeout."""
+        try:
+            event = await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+        if event is RESYNC_EVENT:
+            self.overflowed = False
+        return event
+
+    def close(self) -> None:
+        if not self.closed:
+            self.closed = True
+            self.broker.unsubscribe(self)
+
+
+class Broker(abc.ABC):
+    """Broker interface: publish() from any thread, subscribe() from inside a running event loop."""
+
+    @abc.abstractmethod
+    def publish(self, channel: str, event: dict) -> None:
+        """Deliver event to every current subscription of channel."""
+
+    @abc.abstractmethod
+    def subscribe(self, channel: str, max_queue: int = 100) -> Subscription:
+        """Register and return a subscription to channel."""
+
+    @abc.abstractmethod
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop delivering to subscription (called by Subscription.close)."""
+
+
+class InMemoryBroker(Broker):
+    """Fan-out to subscriptions registered in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._channels = {}
+
+    def publish(self, channel: str, event: dict) -> None:
+        with self._lock:
+            subscriptions = list(self._channels.get(channel, ()))
+        for subscription in subscriptions:
+            subscription.deliver(event)
+
+    def subscribe(self, channel: str, max_queue: int = 100) -> Subscription:
+        subscription = Subscription(self, channel, max_queue)
+        with self._lock:
+            self._channels.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscriptions = self._channels.get(subscription.channel)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._channels[subscription.channel]
+
+    def subscriber_count(self, channel: str) -> int:
+        with self._lock:
+            return len(self._channels.get(channel, ()))
+
+
+_broker = None
+_broker_lock = threading.Lock()
+
+
+def get_broker() -> Broker:
+    """The process-wide broker configured by settings.PUBSUB_BROKER."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                _broker = import_string(settings.PUBSUB_BROKER)()
+    return _broker
+
+
+def publish_on_commit(channel: str, event: dict) -> None:
+    """
+    Publish after the current transaction commits (immediately if none is open), so subscribers
+    never see events for writes that were rolled back or are not yet visible to their reads.
+    """
+    def publish():
+        try:
+            get_broker().publish(channel, event)
+        except Exception:  # a broker outage must not fail the request that already committed
+            logger.exception("Failed to publish event to %s", channel)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,87 @@
+"""
+TeamTrack – Renderers.
+Drop-in replacement for DRF's JSONRenderer that encodes with orjson when it is installed
+and falls back to DRF's stdlib implementation otherwise; plain text for the metrics endpoint.
+"""
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+try:
+    import orjson
+except ImportError:  # optional dependency (requirements/production.txt)
+    orjson = None
+
+# orjson formats datetimes, dates, times and dataclasses itself; pass them to the DRF encoder instead
+# so the output stays exactly what JSONRenderer produced.
+ORJSON_OPTIONS = (
+    orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_NON_STR_KEYS
+    if orjson is not None else 0
+)
+
+
+def _orjson_floats(data) -> bool:
+    """
+    Whether every float in data (dicts, lists and tuples) is one orjson writes exactly like json:
+    zero, or finite with a magnitude in [1e-4, 1e16), where neither uses an exponent.
+    """
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, float):
+            if value and not 1e-4 <= abs(value) < 1e16:  # also false for NaN / Infinity
+                return False
+        elif isinstance(value, dict):
+            stack.extend(value.values())
+        elif isinstance(value, (list, tuple)):
+            stack.extend(value)
+    return True
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer with an orjson fast path for the compact, UTF-8 output used by the API.
+    Types orjson does not encode natively (dates, datetimes, Decimal, lazy translation strings,
+    querysets, ...) go through DRF's JSONEncoder.default, so their representation is unchanged.
+    Falls back to JSONRenderer for indented output (e.g. "application/json; indent=4"),
+    non-default UNICODE_JSON / COMPACT_JSON settings, and anything orjson rejects
+    (integers beyond 64 bits, unsupported key types).
+    Floats: orjson renders NaN / Infinity as null instead of raising (STRICT_JSON) and writes
+    exponents its own way ("1e16" for "1e+16", "0.00001" for "1e-05"). The API's payloads hold
+    no floats except in views that set renders_floats = True; their data is checked first and
+    rendered by JSONRenderer unless every float is one orjson writes identically.
+    """
+
+    use_orjson = orjson is not None
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        renderer_context = renderer_context or {}
+        if (
+            data is None
+            or not self.use_orjson
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context) is not None
+            or (getattr(renderer_context.get("view"), "renders_floats", False) and not _orjson_floats(data))
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+        try:
+            ret = orjson.dumps(data, default=self.encoder_class().default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+        # Same \u2028 / \u2029 escaping as JSONRenderer (keeps the output a strict JavaScript subset).
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class PlainTextRenderer(BaseRenderer):
+    """
+    text/plain for views whose clients may accept only text (e.g. metrics scrapers).
+    Non-string data (the error envelope) is rendered as JSON text.
+    """
+
+    media_type = "text/plain"
+    format = "txt"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if isinstance(data, str):
+            return data.encode(self.charset)
+        return FastJSONRenderer().render(data, renderer_context=renderer_context)
@@ -5,20 +5,26 @@ All successful API responses use this structure for consistency.
 from rest_framework import status
 from rest_framework.response import Response
 
+from core.conditional import apply_etag
 
-def success_response(data=None, message=None, status_code=status.HTTP_200_OK):
+
+def success_response(data=None, message=None, status_code=status.HTTP_200_OK, etag=None):
     """
     Return a unified success response.
     - data: payload (dict, list, or single value)
     - message: optional human-readable message
     - status_code: HTTP status (default 200)
+    - etag: optional ETag (see core.conditional) sent with revalidation headers
     """
     body = {"success": True}
     if data is not None:
         body["data"] = data
     if message:
         body["message"] = message
-    return Response(body, status=status_code)
+    response = Response(body, status=status_code)
+    if etag:
+        apply_etag(response, etag)
+    return response
 
 
 def error_response(message, code=None, details=None, status_code=status.HTTP_400_BAD_REQUEST):
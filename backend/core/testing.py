@@ -0,0 +1,83 @@
+"""
+TeamTrack – Test helpers.
+Query budgets: QueryInstrumentationMiddleware attaches the request's query stats and its view's
+budgets (query_budget / db_time_budget_ms) to every response; assert_within_query_budget fails
+a test when the endpoint went over them, listing the queries it ran.
+
+    response = client.get(f"/api/v1/projects/{project.pk}/tasks/")
+    assert_within_query_budget(response)
+
+Savepoint statements are not counted (see core.instrumentation), like in the middleware's log.
+
+Async views: assert_async_view_matches runs an AsyncAPIView once with its sync handlers and once
+with its async ones (settings.API_ASYNC_VIEWS) and fails when the two responses differ.
+
+    assert_async_view_matches(TaskListView, user, f"/api/v1/projects/{project.pk}/tasks/", pk=project.pk)
+"""
+from unittest import mock
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.core.cache import cache
+from django.test import override_settings
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+
+def assert_within_query_budget(response, queries: int = None, db_time_ms: float = None) -> None:
+    """
+    Raise AssertionError if the request behind response exceeded its view's budgets.
+    queries / db_time_ms override the budgets declared on the view; with neither declared nor
+    given, the response must at least carry stats (i.e. the middleware is installed).
+    """
+    from core.instrumentation import exceeded_budgets
+
+    stats = getattr(response, "query_stats", None)
+    if stats is None:
+        raise AssertionError(
+            "Response has no query stats: is core.middleware.QueryInstrumentationMiddleware installed?"
+        )
+    budgets = dict(getattr(response, "query_budget", None) or {})
+    if queries is not None:
+        budgets["queries"] = queries
+    if db_time_ms is not None:
+        budgets["db_time_ms"] = db_time_ms
+    exceeded = exceeded_budgets(stats, budgets)
+    if not exceeded:
+        return
+    listing = "\n".join(
+        f"  {index}. ({duration * 1000:.2f} ms) {sql}" for index, (sql, duration) in enumerate(stats.queries, 1)
+    )
+    if len(stats.queries) < stats.count + stats.savepoints:
+        listing += f"\n  ... {stats.count + stats.savepoints - len(stats.queries)} more"
+    request = getattr(response, "wsgi_request", None) or getattr(response, "asgi_request", None)
+    endpoint = f"{request.method} {request.get_full_path()}" if request is not None else "Request"
+    raise AssertionError(f"{endpoint} exceeded its query budget: {'; '.join(exceeded)}\n{listing}")
+
+
+def assert_async_view_matches(view_class, user, path: str, data: dict = None, headers: dict = None, **kwargs):
+    """
+    Raise AssertionError if GET path answers differently (status, ETag or body) through the async
+    handlers of view_class than through its sync ones; return the sync response. The view is built
+    under each value of settings.API_ASYNC_VIEWS (as_view reads it, like URL loading does) and the
+    cache is cleared before each run, so both compute their response; cache version counters
+    restart at the same value both times, so ETags are comparable.
+    """
+    responses = []
+    for async_views in (False, True):
+        request = APIRequestFactory().get(path, data, headers=headers)
+        force_authenticate(request, user)
+        cache.clear()
+        with override_settings(API_ASYNC_VIEWS=async_views), mock.patch("core.cache._initial_version", return_value=1):
+            view = view_class.as_view()
+            if async_views and not iscoroutinefunction(view):
+                raise AssertionError(f"{view_class.__name__} has no async dispatch (is it an AsyncAPIView?)")
+            response = async_to_sync(view)(request, **kwargs) if async_views else view(request, **kwargs)
+        responses.append(response.render())
+    sync, async_ = responses
+    for label, expected, actual in (
+        ("status", sync.status_code, async_.status_code),
+        ("ETag", sync.get("ETag"), async_.get("ETag")),
+        ("body", sync.content, async_.content),
+    ):
+        if expected != actual:
+            raise AssertionError(f"GET {path}: async {label} {actual!r} != sync {label} {expected!r}")
+    return sync
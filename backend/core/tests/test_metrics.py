@@ -0,0 +1,63 @@
+"""
+TeamTrack – Metrics tests.
+"""
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+from django.test import SimpleTestCase, override_settings
+
+from core import metrics
+
+
+def _counter(value: int) -> dict:
+    return {
+        "teamtrack_test_total": {"type": "counter", "help": "Test counter.", "labelnames": [], "series": [[[], value]]}
+    }
+
+
+class MetricsDirectoryTests(SimpleTestCase):
+    """Per-process files in METRICS_DIR."""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        settings = override_settings(METRICS_DIR=self.directory)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def write(self, name: str, value: int) -> str:
+        path = os.path.join(self.directory, name)
+        with open(path, "w") as handle:
+            json.dump(_counter(value), handle)
+        return path
+
+    def exited_pid(self) -> int:
+        process = subprocess.Popen([sys.executable, "-c", "pass"])
+        process.wait()
+        return process.pid
+
+    def total(self) -> int:
+        return metrics.merge(metrics.collect())["teamtrack_test_total"]["series"][()]
+
+    def test_process_file_is_unique_per_process(self):
+        metrics.write_process_file()
+        name = os.path.basename(metrics._process_file(self.directory))
+        self.assertTrue(name.startswith(f"{os.getpid()}-"))
+        self.assertNotEqual(name, f"{os.getpid()}.json")
+        self.assertTrue(os.path.exists(os.path.join(self.directory, name)))
+
+    def test_exited_processes_are_retired_without_losing_counts(self):
+        self.write(metrics.RETIRED_FILE, 5)
+        exited = self.write(f"{self.exited_pid()}-0123456789ab.json", 3)
+        running = self.write(f"{os.getppid()}-0123456789ab.json", 2)
+
+        self.assertEqual(self.total(), 10)
+        self.assertFalse(os.path.exists(exited))
+        self.assertTrue(os.path.exists(running))
+        with open(os.path.join(self.directory, metrics.RETIRED_FILE)) as handle:
+            self.assertEqual(metrics.merge([json.load(handle)])["teamtrack_test_total"]["series"][()], 8)
+        self.assertEqual(self.total(), 10)
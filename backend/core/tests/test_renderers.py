@@ -0,0 +1,71 @@
+"""
+TeamTrack – Renderer tests.
+"""
+import datetime
+import decimal
+import uuid
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.renderers import JSONRenderer
+
+from core.renderers import FastJSONRenderer
+
+FLOATS = (0.0, -0.0, 0.5, 1 / 3, 0.0001, 0.00012345, 12.5, 100.0, 1e15, 9999999999999998.0)
+EXPONENT_FLOATS = (1e-05, 1.5e-07, 5e-324, 1e16, 1.2345678901234568e17, 1e22, 1.7976931348623157e308)
+
+
+class FloatView:
+    renders_floats = True
+
+
+def task_row(index: int) -> dict:
+    now = datetime.datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=datetime.timezone.utc)
+    return {
+        "id": index,
+        "title": f"Task {index} – déploiement \u2028\u2029 \"quoted\" \\ 🚀",
+        "status": ("TODO", "IN_PROGRESS", "DONE")[index % 3],
+        "due_date": datetime.date(2026, 1, 1) + datetime.timedelta(days=index),
+        "assigned_to": index % 2 or None,
+        "created_at": now - datetime.timedelta(minutes=index),
+        "estimate": decimal.Decimal("1.25") * index,
+        "label": gettext_lazy("Task"),
+        "token": uuid.UUID(int=index),
+        "tags": ("a", "b"),
+        "meta": {"big": 2**63 - 1, "small": -(2**63), "flags": [True, False, None]},
+    }
+
+
+class FastJSONRendererTests(SimpleTestCase):
+    """FastJSONRenderer writes the same bytes as DRF's JSONRenderer."""
+
+    def assertSameBytes(self, data, renderer_context=None):
+        expected = JSONRenderer().render(data, renderer_context=renderer_context)
+        self.assertEqual(FastJSONRenderer().render(data, renderer_context=renderer_context), expected)
+
+    def test_envelopes(self):
+        for data in (
+            {"success": True, "data": {"results": [task_row(index) for index in range(20)], "next": None}},
+            {"success": True, "data": [], "message": "Done"},
+            {"success": False, "message": "Validation failed", "code": "validation_error",
+             "errors": {"title": ["This field is required."], "non_field_errors": []}},
+            {"success": True, "data": {1: "integer key", "big": 2**70}},  # orjson refuses: fallback
+            "plain string",
+            [],
+        ):
+            self.assertSameBytes(data)
+
+    def test_floats_of_views_that_render_them(self):
+        context = {"view": FloatView()}
+        for value in FLOATS + EXPONENT_FLOATS:
+            self.assertSameBytes({"value": value, "values": [value, -value]}, context)
+        for value in (float("nan"), float("inf"), float("-inf")):
+            with self.assertRaises(ValueError):
+                FastJSONRenderer().render({"progress": [value]}, renderer_context=context)
+
+    def test_floats_written_without_exponent_match_everywhere(self):
+        for value in FLOATS:
+            self.assertSameBytes({"value": value, "values": [value, -value]})
+
+    def test_indented_output(self):
+        self.assertSameBytes({"data": [task_row(1)]}, {"indent": 2})
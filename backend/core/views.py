@@ -0,0 +1,80 @@
+"""
+TeamTrack – Core API views.
+MetricsView serves core.metrics to admins.
+DRF's APIView is sync-only. AsyncAPIView lets a view offer async variants of its handlers
+(`aget` next to `get`, ...) that read through Django's async ORM (aget, acount, aaggregate,
+async iteration) while keeping DRF's request parsing, authentication, permissions, throttling
+and exception handling. settings.API_ASYNC_VIEWS selects the async handlers (serve them under
+ASGI); otherwise the view is a plain sync APIView. Responses are identical either way.
+"""
+from asgiref.sync import iscoroutinefunction, sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.functional import classproperty
+from rest_framework.views import APIView
+
+from core import metrics
+from core.permissions import IsAdminUser
+from core.renderers import FastJSONRenderer, PlainTextRenderer
+
+
+class AsyncAPIView(APIView):
+    """
+    APIView with an optional async dispatch. In async mode a request for METHOD runs the view's
+    `async def a<method>` handler when it has one; the remaining sync steps (authentication and
+    permission checks, handlers without an async variant, e.g. POST) run in a worker thread.
+    """
+
+    @classproperty
+    def view_is_async(cls):
+        return settings.API_ASYNC_VIEWS
+
+    def dispatch(self, request, *args, **kwargs):
+        if self.view_is_async:
+            return self.adispatch(request, *args, **kwargs)
+        return super().dispatch(request, *args, **kwargs)
+
+    async def adispatch(self, request, *args, **kwargs):
+        """APIView.dispatch on the event loop."""
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            method = request.method.lower()
+            if method in self.http_method_names:
+                handler = getattr(self, f"a{method}", None) or getattr(self, method, self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            if iscoroutinefunction(handler):
+                response = await handler(request, *args, **kwargs)
+            else:
+                response = await sync_to_async(handler)(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def apaginate_queryset(self, queryset):
+        """Async GenericAPIView.paginate_queryset (the paginator must offer apaginate_queryset)."""
+        paginator = getattr(self, "paginator", None)
+        if paginator is None:
+            return None
+        return await paginator.apaginate_queryset(queryset, self.request, view=self)
+
+
+class MetricsView(APIView):
+    """
+    GET /api/v1/metrics/ – admin only. Metrics of every worker (core.metrics) in the Prometheus
+    text exposition format; errors keep the JSON envelope.
+    """
+    permission_classes = [IsAdminUser]
+    renderer_classes = [FastJSONRenderer, PlainTextRenderer]
+    query_budget = 3  # 1, plus the token table row counts when their cached values expired
+
+    def get(self, request):
+        return HttpResponse(metrics.exposition(), content_type=metrics.CONTENT_TYPE)